@@ -0,0 +1 @@
+"""Scale benchmarks and tests of simple_plant."""
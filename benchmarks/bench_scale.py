@@ -0,0 +1,289 @@
+"""Scale benchmarks: setup, midnight tick, watering, rename, estimation, calendar."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import EVENT_STATE_CHANGED, EVENT_STATE_REPORTED
+from homeassistant.core import callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util.dt import now, start_of_local_day
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.simple_plant.const import DOMAIN
+from custom_components.simple_plant.estimator import (
+    AUTO_INTERVAL_KEY,
+    SimplePlantEstimator,
+)
+from custom_components.simple_plant.journal import SimplePlantJournalStore
+from custom_components.simple_plant.scheduler import SimplePlantScheduler
+from custom_components.simple_plant.services import SERVICE_MARK_WATERED
+
+from .conftest import Benchmark, StorageWrites, Timer, entity_count, hub_entry
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from freezegun.api import FrozenDateTimeFactory
+    from homeassistant.core import Event, HomeAssistant
+
+    from custom_components.simple_plant.coordinator import SimplePlantCoordinator
+    from custom_components.simple_plant.data import SimplePlantStore
+
+
+async def async_setup_hub(hass: HomeAssistant, count: int) -> SimplePlantCoordinator:
+    """Set up a hub of `count` synthetic plants."""
+    entry = hub_entry(count)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return hass.data[DOMAIN][entry.entry_id]
+
+
+async def test_setup_entry(
+    hass: HomeAssistant,
+    store: SimplePlantStore,
+    storage_writes: StorageWrites,
+    plant_count: int,
+) -> None:
+    """Measure the setup of a hub, up to every entity being added."""
+    with Timer() as timer:
+        coordinator = await async_setup_hub(hass, plant_count)
+    await store.async_flush()
+
+    assert len(coordinator.plants) == plant_count
+    Benchmark(
+        name="setup_entry",
+        plants=plant_count,
+        seconds=timer.seconds,
+        storage_writes=storage_writes.count,
+        bytes_written=storage_writes.bytes,
+        extra={
+            "entities": entity_count(hass, coordinator.config_entry.entry_id),
+            "storage_loads": store.load_count,
+        },
+    ).record()
+
+
+async def test_midnight_tick(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    store: SimplePlantStore,
+    storage_writes: StorageWrites,
+    plant_count: int,
+) -> None:
+    """Measure the recompute of the plants whose status flips at midnight."""
+    await async_setup_hub(hass, plant_count)
+    await store.async_flush()
+    storage_writes.clear()
+    state_writes = 0
+
+    def count_state_writes(_event: Event) -> None:
+        nonlocal state_writes
+        state_writes += 1
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, count_state_writes)
+    midnight = start_of_local_day(now().date() + timedelta(days=1))
+    freezer.move_to(midnight)
+    with Timer() as timer:
+        async_fire_time_changed(hass, midnight)
+        await hass.async_block_till_done()
+    await store.async_flush()
+
+    scheduler = SimplePlantScheduler(hass)
+    Benchmark(
+        name="midnight_tick",
+        plants=plant_count,
+        seconds=timer.seconds,
+        storage_writes=storage_writes.count,
+        bytes_written=storage_writes.bytes,
+        extra={
+            "recompute_seconds": scheduler.last_run_duration,
+            "updated_plants": scheduler.last_run_updates,
+            "state_writes": state_writes,
+        },
+    ).record()
+
+
+async def test_idle_hub(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    plant_count: int,
+) -> None:
+    """Check the entities of a hub write no state while no plant changes."""
+    noon = start_of_local_day(now().date() + timedelta(days=1)) + timedelta(hours=12)
+    freezer.move_to(noon)
+    coordinator = await async_setup_hub(hass, plant_count)
+    device = dr.async_get(hass).async_get_device(
+        identifiers={(DOMAIN, coordinator.config_entry.entry_id)}
+    )
+    assert device is not None
+    hub_entities = {
+        entity.entity_id
+        for entity in er.async_entries_for_device(er.async_get(hass), device.id)
+    }
+    state_writes = 0
+
+    @callback
+    def is_hub_entity(event_data: Mapping[str, Any]) -> bool:
+        return event_data["entity_id"] in hub_entities
+
+    @callback
+    def count_state_writes(_event: Event) -> None:
+        nonlocal state_writes
+        state_writes += 1
+
+    for event_type in (EVENT_STATE_CHANGED, EVENT_STATE_REPORTED):
+        hass.bus.async_listen(
+            event_type, count_state_writes, event_filter=is_hub_entity
+        )
+    with Timer() as timer:
+        for minute in range(1, 11):
+            freezer.move_to(noon + timedelta(minutes=minute))
+            async_fire_time_changed(hass, noon + timedelta(minutes=minute))
+            await hass.async_block_till_done()
+
+    Benchmark(
+        name="idle_hub",
+        plants=plant_count,
+        seconds=timer.seconds,
+        extra={"hub_entities": len(hub_entities), "state_writes": state_writes},
+    ).record()
+    assert state_writes == 0
+
+
+async def test_bulk_watering(
+    hass: HomeAssistant,
+    store: SimplePlantStore,
+    storage_writes: StorageWrites,
+    plant_count: int,
+) -> None:
+    """Measure marking every plant as watered with a single service call."""
+    coordinator = await async_setup_hub(hass, plant_count)
+    await store.async_flush()
+    storage_writes.clear()
+
+    entity_ids = [
+        f"binary_sensor.{DOMAIN}_todo_{plant.device}"
+        for plant in coordinator.plants.values()
+    ]
+    with Timer() as timer:
+        await hass.services.async_call(
+            DOMAIN, SERVICE_MARK_WATERED, {"entity_id": entity_ids}, blocking=True
+        )
+        await hass.async_block_till_done()
+    await store.async_flush()
+
+    Benchmark(
+        name="bulk_watering",
+        plants=plant_count,
+        seconds=timer.seconds,
+        storage_writes=storage_writes.count,
+        bytes_written=storage_writes.bytes,
+    ).record()
+
+
+async def test_rename_plant(
+    hass: HomeAssistant,
+    store: SimplePlantStore,
+    storage_writes: StorageWrites,
+    plant_count: int,
+) -> None:
+    """Measure renaming a plant in place, with its entity ids."""
+    coordinator = await async_setup_hub(hass, plant_count)
+    await store.async_flush()
+    storage_writes.clear()
+
+    plant = next(iter(coordinator.plants.values()))
+    with Timer() as timer:
+        plant.async_rename("Renamed plant")
+        await hass.async_block_till_done()
+    await store.async_flush()
+
+    assert hass.states.get(f"binary_sensor.{DOMAIN}_todo_renamed_plant")
+
+    Benchmark(
+        name="rename_plant",
+        plants=plant_count,
+        seconds=timer.seconds,
+        storage_writes=storage_writes.count,
+        bytes_written=storage_writes.bytes,
+    ).record()
+
+
+async def test_estimate_intervals(
+    hass: HomeAssistant,
+    store: SimplePlantStore,
+    storage_writes: StorageWrites,
+    plant_count: int,
+) -> None:
+    """Measure the nightly interval estimation, every plant opted in."""
+    coordinator = await async_setup_hub(hass, plant_count)
+    today = now().date().toordinal()
+    # A year of waterings, every 5 to 9 days depending on the plant
+    await SimplePlantJournalStore(hass).async_record(
+        (plant.plant_id, date.fromordinal(day), None)
+        for index, plant in enumerate(coordinator.plants.values())
+        for day in range(today - 365, today, 5 + index % 5)
+    )
+    await store.async_save_batch(
+        {plant_id: {AUTO_INTERVAL_KEY: True} for plant_id in coordinator.plants}
+    )
+    await coordinator.async_refresh()
+    await store.async_flush()
+    storage_writes.clear()
+
+    estimator = SimplePlantEstimator(hass)
+    with Timer() as timer:
+        await estimator.async_run()
+        await hass.async_block_till_done()
+    await store.async_flush()
+
+    assert len(estimator.suggestions) == plant_count
+    Benchmark(
+        name="estimate_intervals",
+        plants=plant_count,
+        seconds=timer.seconds,
+        storage_writes=storage_writes.count,
+        bytes_written=storage_writes.bytes,
+        extra={
+            "estimate_seconds": estimator.last_run_duration,
+            "applied": estimator.last_run_applied,
+        },
+    ).record()
+
+
+async def test_calendar_events(
+    hass: HomeAssistant,
+    plant_count: int,
+) -> None:
+    """Measure listing a year of waterings of every plant of a hub."""
+    coordinator = await async_setup_hub(hass, plant_count)
+    entity_id = er.async_get(hass).async_get_entity_id(
+        "calendar", DOMAIN, f"{DOMAIN}_watering_{coordinator.config_entry.entry_id}"
+    )
+    assert entity_id
+    start = now()
+    with Timer() as timer:
+        response = await hass.services.async_call(
+            "calendar",
+            "get_events",
+            {
+                "entity_id": entity_id,
+                "start_date_time": start,
+                "end_date_time": start + timedelta(days=365),
+            },
+            blocking=True,
+            return_response=True,
+        )
+
+    events = response[entity_id]["events"]
+    assert len(events) >= plant_count
+    Benchmark(
+        name="calendar_events",
+        plants=plant_count,
+        seconds=timer.seconds,
+        extra={"events": len(events)},
+    ).record()
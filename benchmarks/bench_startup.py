@@ -0,0 +1,139 @@
+"""Cold start benchmarks: import time and first setup."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from custom_components.simple_plant.const import DOMAIN
+from custom_components.simple_plant.data import SimplePlantStore
+from custom_components.simple_plant.journal import SimplePlantJournalStore
+
+from .conftest import (
+    Benchmark,
+    StorageWrites,
+    Timer,
+    entity_count,
+    forget_singletons,
+    hub_entry,
+    plant_entry,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+# Modules that must only load on demand, not when the integration is set up
+LAZY_MODULES = (
+    "custom_components.simple_plant.config_flow",
+    "homeassistant.components.file_upload",
+    "PIL",
+)
+
+# Import the integration in a fresh interpreter, after what Home Assistant
+# always loads, and report the time and modules it took
+IMPORT_SCRIPT = """
+import json, sys, time
+import homeassistant.core
+import homeassistant.helpers.config_validation
+import homeassistant.helpers.entity_platform
+before = set(sys.modules)
+start = time.perf_counter()
+import custom_components.simple_plant
+seconds = time.perf_counter() - start
+print(json.dumps({"seconds": seconds, "modules": sorted(set(sys.modules) - before)}))
+"""
+
+
+def test_import_time() -> None:
+    """Measure importing the integration, and check lazy modules stay unloaded."""
+    result = json.loads(
+        subprocess.run(  # noqa: S603
+            [sys.executable, "-c", IMPORT_SCRIPT],
+            capture_output=True,
+            check=True,
+            cwd=Path(__file__).parent.parent,
+            text=True,
+        ).stdout
+    )
+    loaded = [module for module in result["modules"] if module.startswith(LAZY_MODULES)]
+
+    Benchmark(
+        name="import",
+        plants=0,
+        seconds=result["seconds"],
+        extra={"modules": len(result["modules"]), "lazy_modules_loaded": loaded},
+    ).record()
+    assert not loaded
+
+
+async def test_first_setup(
+    hass: HomeAssistant,
+    store: SimplePlantStore,
+    storage_writes: StorageWrites,
+) -> None:
+    """Measure the cold setup of a first plant, platforms included."""
+    entry = plant_entry(0)
+    entry.add_to_hass(hass)
+    with Timer() as timer:
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+    await store.async_flush()
+
+    Benchmark(
+        name="first_setup",
+        plants=1,
+        seconds=timer.seconds,
+        storage_writes=storage_writes.count,
+        bytes_written=storage_writes.bytes,
+        extra={"entities": entity_count(hass, entry.entry_id)},
+    ).record()
+    assert "file_upload" not in hass.config.components
+
+
+async def test_restart(
+    hass: HomeAssistant,
+    store: SimplePlantStore,
+    storage_writes: StorageWrites,
+    plant_count: int,
+) -> None:
+    """Measure restarting a hub of changed plants, and check nothing is written."""
+    entry = hub_entry(plant_count)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    # Change a value of every plant, so each entity has one to restore
+    await store.async_save_batch(
+        {
+            f"plant_{index}": {"days_between_waterings": 5.0, "health": "excellent"}
+            for index in range(plant_count)
+        }
+    )
+    await store.async_flush()
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    forget_singletons()
+    # Any write would be physical right away rather than after the test
+    store = SimplePlantStore(hass)
+    store.save_delay = 0
+    SimplePlantJournalStore(hass).save_delay = 0
+    storage_writes.clear()
+
+    with Timer() as timer:
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    Benchmark(
+        name="restart",
+        plants=plant_count,
+        seconds=timer.seconds,
+        storage_writes=storage_writes.count,
+        bytes_written=storage_writes.bytes,
+        extra={"logical_writes": store.logical_writes},
+    ).record()
+    plant = hass.data[DOMAIN][entry.entry_id].plants["plant_0"]
+    assert plant.data["health"] == "excellent"
+    assert store.logical_writes == 0
+    assert storage_writes.count == 0
@@ -0,0 +1,261 @@
+"""
+Fixtures of the simple_plant scale benchmarks and tests.
+
+Benchmarks and tests run on the Home Assistant test harness with an in-memory `hass`
+and storage. Each measure is collected and written as JSON at the end of the
+session, so results can be compared across commits.
+"""
+
+from __future__ import annotations
+
+import json
+import platform
+import subprocess
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Self
+from unittest.mock import patch
+
+import pytest
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.storage import Store
+from homeassistant.util.dt import utcnow
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.simple_plant.aggregates import SimplePlantAggregates
+from custom_components.simple_plant.const import (
+    CONF_HUB,
+    CONF_PLANT_ID,
+    DOMAIN,
+    SUBENTRY_TYPE_PLANT,
+)
+from custom_components.simple_plant.data import SimplePlantStore
+from custom_components.simple_plant.devices import SimplePlantDeviceIndex
+from custom_components.simple_plant.estimator import SimplePlantEstimator
+from custom_components.simple_plant.image_cache import SimplePlantImageCache
+from custom_components.simple_plant.journal import SimplePlantJournalStore
+from custom_components.simple_plant.photos import SimplePlantPhotoStore
+from custom_components.simple_plant.scheduler import SimplePlantScheduler
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterator
+
+    from homeassistant.core import HomeAssistant
+
+PLANT_COUNTS = [10, 100, 1000, 5000]
+RESULTS: list[dict[str, Any]] = []
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add benchmark options."""
+    parser.addoption(
+        "--bench-output",
+        default="bench_output.json",
+        help="File the benchmark results are written to",
+    )
+    parser.addoption(
+        "--bench-max-plants",
+        type=int,
+        default=max(PLANT_COUNTS),
+        help="Skip benchmarks with more plants",
+    )
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """Write the collected results."""
+    if not RESULTS:
+        return
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],  # noqa: S607
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    output = Path(session.config.getoption("--bench-output"))
+    output.write_text(
+        json.dumps(
+            {
+                "commit": commit,
+                "python": platform.python_version(),
+                "results": sorted(
+                    RESULTS, key=lambda result: (result["name"], result["plants"])
+                ),
+            },
+            indent=4,
+        )
+    )
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations: None) -> None:
+    """Enable the integration in every benchmark."""
+    return
+
+
+def forget_singletons() -> None:
+    """Forget the storage, scheduler and caches, as a restart would."""
+    for cls in (
+        SimplePlantAggregates,
+        SimplePlantStore,
+        SimplePlantJournalStore,
+        SimplePlantDeviceIndex,
+        SimplePlantEstimator,
+        SimplePlantScheduler,
+        SimplePlantImageCache,
+        SimplePlantPhotoStore,
+    ):
+        cls._instance = None
+        cls._initialized = False
+
+
+@pytest.fixture(autouse=True)
+def reset_singletons() -> Iterator[None]:
+    """Give every benchmark its own storage, scheduler and caches."""
+    # Stopping the previous `hass` may have created them again
+    forget_singletons()
+    yield
+    forget_singletons()
+
+
+@pytest.fixture(params=PLANT_COUNTS, ids=lambda count: f"{count}_plants")
+def plant_count(request: pytest.FixtureRequest) -> int:
+    """Return the number of synthetic plants to benchmark."""
+    if request.param > request.config.getoption("--bench-max-plants"):
+        pytest.skip("Above --bench-max-plants")
+    return request.param
+
+
+def plant_data(index: int) -> dict[str, Any]:
+    """Return the config of a synthetic plant, spread over the next days."""
+    days_between_waterings = 7
+    last_watered = utcnow() - timedelta(days=index % days_between_waterings)
+    return {
+        "name": f"Plant {index}",
+        "name_by_user": f"Plant {index}",
+        CONF_PLANT_ID: f"plant_{index}",
+        "last_watered": last_watered.isoformat(),
+        "days_between_waterings": days_between_waterings,
+        "health": "good",
+        "species": "Synthetic",
+        "photo": "/simple_plant/missing.png",
+    }
+
+
+def plant_entry(index: int) -> MockConfigEntry:
+    """Return the entry of a single synthetic plant."""
+    return MockConfigEntry(
+        domain=DOMAIN,
+        title=f"Plant {index}",
+        data=plant_data(index),
+        version=1,
+        minor_version=3,
+    )
+
+
+def hub_entry(count: int) -> MockConfigEntry:
+    """Return a hub entry of `count` synthetic plants."""
+    return MockConfigEntry(
+        domain=DOMAIN,
+        title="Plants",
+        data={CONF_HUB: True},
+        unique_id=CONF_HUB,
+        version=1,
+        minor_version=3,
+        subentries_data=[
+            {
+                "data": plant_data(index),
+                "subentry_type": SUBENTRY_TYPE_PLANT,
+                "title": f"Plant {index}",
+                "unique_id": f"plant_{index}",
+            }
+            for index in range(count)
+        ],
+    )
+
+
+def entity_count(hass: HomeAssistant, entry_id: str) -> int:
+    """Return the number of entities of a config entry."""
+    return len(er.async_entries_for_config_entry(er.async_get(hass), entry_id))
+
+
+@dataclass
+class StorageWrites:
+    """Physical writes of the integration storage, from the in-memory storage."""
+
+    writes: list[tuple[str, int]] = field(default_factory=list)
+
+    @property
+    def count(self) -> int:
+        """Return the number of writes."""
+        return len(self.writes)
+
+    @property
+    def bytes(self) -> int:
+        """Return the number of bytes written."""
+        return sum(size for _, size in self.writes)
+
+    def clear(self) -> None:
+        """Forget recorded writes."""
+        self.writes.clear()
+
+
+@pytest.fixture
+def storage_writes(hass_storage: dict[str, Any]) -> Generator[StorageWrites]:
+    """Record every storage write of the integration with its size."""
+    del hass_storage  # In-memory storage must be patched first
+    recorder = StorageWrites()
+    write_data = Store._async_write_data  # noqa: SLF001
+
+    async def async_write_data(store: Store, path: str, data: dict) -> None:
+        if store.key.startswith(DOMAIN):
+            recorder.writes.append((store.key, len(json_bytes(data))))
+        await write_data(store, path, data)
+
+    with patch.object(Store, "_async_write_data", async_write_data):
+        yield recorder
+
+
+@dataclass
+class Benchmark:
+    """A measure, recorded in the results."""
+
+    name: str
+    plants: int
+    seconds: float = 0.0
+    storage_writes: int = 0
+    bytes_written: int = 0
+    extra: dict[str, Any] = field(default_factory=dict)
+
+    def record(self) -> None:
+        """Add the measure to the results."""
+        RESULTS.append(asdict(self))
+
+
+class Timer:
+    """Context manager measuring wall time."""
+
+    def __enter__(self) -> Self:
+        """Start the timer."""
+        self.start = time.perf_counter()
+        self.seconds = 0.0
+        return self
+
+    def __exit__(self, *_args: object) -> None:
+        """Stop the timer."""
+        self.seconds = time.perf_counter() - self.start
+
+
+@pytest.fixture
+async def store(hass: HomeAssistant) -> SimplePlantStore:
+    """Return the storage, writing every change immediately."""
+    store = SimplePlantStore(hass)
+    # Measure the bytes of each operation rather than of coalesced writes
+    store.save_delay = 0
+    SimplePlantJournalStore(hass).save_delay = 0
+    return store
@@ -0,0 +1,61 @@
+"""Tests of the photo store: moving photos across filesystems."""
+
+from __future__ import annotations
+
+import errno
+import shutil
+from pathlib import Path
+
+import pytest
+
+from custom_components.simple_plant.photos import _move
+
+PNG = b"\x89PNG\r\n\x1a\n" + bytes(64)
+
+
+@pytest.fixture
+def source(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Return a photo that can't be renamed or linked, as on another filesystem."""
+    source = tmp_path / "upload.png"
+    source.write_bytes(PNG)
+    replace = Path.replace
+
+    def cross_device_replace(path: Path, target: Path) -> Path:
+        if path == source:
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+        return replace(path, target)
+
+    def cross_device_link(_path: Path, _target: Path) -> None:
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(Path, "replace", cross_device_replace)
+    monkeypatch.setattr(Path, "hardlink_to", cross_device_link)
+    return source
+
+
+def test_move_by_copy(tmp_path: Path, source: Path) -> None:
+    """Check a photo is copied, then removed, when it can't be renamed."""
+    destination = tmp_path / "photo.png"
+
+    _move(source, destination)
+
+    assert destination.read_bytes() == PNG
+    assert not source.exists()
+    assert list(tmp_path.iterdir()) == [destination]
+
+
+def test_move_interrupted(
+    tmp_path: Path, source: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Check an interrupted copy leaves nothing under the destination name."""
+    destination = tmp_path / "photo.png"
+
+    def disk_full(*_args: object) -> None:
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+    monkeypatch.setattr(shutil, "copyfileobj", disk_full)
+
+    with pytest.raises(OSError, match="No space left"):
+        _move(source, destination)
+
+    assert list(tmp_path.iterdir()) == [source]
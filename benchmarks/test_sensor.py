@@ -0,0 +1,26 @@
+"""Tests of the sensors."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.const import STATE_UNKNOWN
+
+from .conftest import plant_entry
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+async def test_suggested_interval(hass: HomeAssistant) -> None:
+    """Check the suggested interval sensor is set up, unknown until estimated."""
+    entry = plant_entry(0)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.simple_plant_suggested_interval_plant_0")
+    assert state is not None
+    assert state.state == STATE_UNKNOWN
+    assert hass.states.get("sensor.simple_plant_next_watering_plant_0") is not None
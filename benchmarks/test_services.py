@@ -0,0 +1,190 @@
+"""Tests of the services: undoing waterings and importing plants."""
+
+from __future__ import annotations
+
+import errno
+import json
+import shutil
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+from homeassistant.components.date.const import DOMAIN as DATE_DOMAIN
+from homeassistant.components.date.const import SERVICE_SET_VALUE
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.util.dt import now
+
+from custom_components.simple_plant.const import DOMAIN
+from custom_components.simple_plant.journal import SimplePlantJournalStore
+from custom_components.simple_plant.services import (
+    SERVICE_MARK_WATERED,
+    SERVICE_UNDO_WATERING,
+)
+from custom_components.simple_plant.transfer import async_import_plants
+
+from .conftest import hub_entry, plant_entry
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from homeassistant.core import HomeAssistant
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+    from custom_components.simple_plant.coordinator import SimplePlantCoordinator
+
+# Plant 3 was last watered 3 days ago
+LAST_WATERED = "date.simple_plant_last_watered_plant_3"
+
+
+async def async_setup(
+    hass: HomeAssistant, entry: MockConfigEntry
+) -> SimplePlantCoordinator:
+    """Set up a config entry and wait for its entities."""
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return hass.data[DOMAIN][entry.entry_id]
+
+
+async def async_call(
+    hass: HomeAssistant, domain: str, service: str, **data: object
+) -> None:
+    """Call a service and wait for the plants to be updated."""
+    await hass.services.async_call(domain, service, data, blocking=True)
+    await hass.async_block_till_done()
+
+
+def write_manifest(path: Path, plants: object) -> Path:
+    """Write an import manifest."""
+    path.write_text(json.dumps({"plants": plants}), encoding="utf-8")
+    return path
+
+
+async def test_undo_watering(hass: HomeAssistant) -> None:
+    """Check undoing a watering restores the day before it."""
+    await async_setup(hass, plant_entry(3))
+    today = now().date()
+
+    await async_call(hass, DOMAIN, SERVICE_MARK_WATERED, entity_id=LAST_WATERED)
+    assert hass.states.get(LAST_WATERED).state == today.isoformat()
+
+    await async_call(hass, DOMAIN, SERVICE_UNDO_WATERING, entity_id=LAST_WATERED)
+    assert hass.states.get(LAST_WATERED).state == (
+        (today - timedelta(days=3)).isoformat()
+    )
+
+
+async def test_undo_keeps_day_set_by_hand(hass: HomeAssistant) -> None:
+    """Check undoing a watering keeps a day set by hand since."""
+    await async_setup(hass, plant_entry(3))
+    yesterday = now().date() - timedelta(days=1)
+    await async_call(hass, DOMAIN, SERVICE_MARK_WATERED, entity_id=LAST_WATERED)
+    await async_call(
+        hass, DATE_DOMAIN, SERVICE_SET_VALUE, entity_id=LAST_WATERED, date=yesterday
+    )
+
+    await async_call(hass, DOMAIN, SERVICE_UNDO_WATERING, entity_id=LAST_WATERED)
+
+    assert hass.states.get(LAST_WATERED).state == yesterday.isoformat()
+
+
+async def test_undo_only_watering(hass: HomeAssistant) -> None:
+    """Check the only watering recorded is kept, having no day before it."""
+    await async_setup(hass, plant_entry(0))
+    journal = SimplePlantJournalStore(hass)
+    today = now().date()
+    await journal.async_record([("plant_0", today, None)])
+
+    await async_call(
+        hass,
+        DOMAIN,
+        SERVICE_UNDO_WATERING,
+        entity_id="date.simple_plant_last_watered_plant_0",
+    )
+
+    assert hass.states.get("date.simple_plant_last_watered_plant_0").state == (
+        today.isoformat()
+    )
+    assert (await journal.async_get("plant_0")).last == today
+
+
+async def test_import_plants(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Check imported plants are added to the hub."""
+    coordinator = await async_setup(hass, hub_entry(1))
+    manifest = write_manifest(
+        tmp_path / "plants.json",
+        [{"name": "Fern", "days_between_waterings": 3, "health": "good"}],
+    )
+
+    assert await async_import_plants(hass, manifest) == ["Fern"]
+    await hass.async_block_till_done()
+
+    assert {plant.title for plant in coordinator.plants.values()} == {
+        "Plant 0",
+        "Fern",
+    }
+
+
+async def test_import_invalid_plants(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Check a manifest with an invalid plant imports none of them."""
+    coordinator = await async_setup(hass, hub_entry(1))
+    tomorrow = now().date() + timedelta(days=1)
+    manifest = write_manifest(
+        tmp_path / "plants.json",
+        [
+            {"name": "Fern", "days_between_waterings": 3},
+            {"name": "Plant 0", "days_between_waterings": 3},
+            {"name": "Cactus", "days_between_waterings": 0},
+            {
+                "name": "Ivy",
+                "days_between_waterings": 3,
+                "last_watered": tomorrow.isoformat(),
+            },
+        ],
+    )
+
+    with pytest.raises(ServiceValidationError) as err:
+        await async_import_plants(hass, manifest)
+    await hass.async_block_till_done()
+
+    assert err.value.translation_key == "import_invalid"
+    assert err.value.translation_placeholders["count"] == "3"
+    assert len(coordinator.plants) == 1
+
+
+async def test_import_unreadable_manifest(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Check a manifest without a list of plants is rejected."""
+    await async_setup(hass, hub_entry(1))
+    manifest = write_manifest(
+        tmp_path / "plants.json", {"name": "Fern", "days_between_waterings": 3}
+    )
+
+    with pytest.raises(ServiceValidationError) as err:
+        await async_import_plants(hass, manifest)
+
+    assert err.value.translation_key == "import_unreadable"
+
+
+async def test_import_photo_failed(
+    hass: HomeAssistant, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Check a photo that can't be copied imports none of the plants."""
+    coordinator = await async_setup(hass, hub_entry(1))
+    hass.config.allowlist_external_dirs = {str(tmp_path)}
+    (tmp_path / "fern.png").write_bytes(b"\x89PNG\r\n\x1a\n" + bytes(64))
+    manifest = write_manifest(
+        tmp_path / "plants.json",
+        [{"name": "Fern", "days_between_waterings": 3, "photo": "fern.png"}],
+    )
+
+    def disk_full(*_args: object) -> None:
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+    monkeypatch.setattr(shutil, "copyfileobj", disk_full)
+
+    with pytest.raises(HomeAssistantError) as err:
+        await async_import_plants(hass, manifest)
+    await hass.async_block_till_done()
+
+    assert err.value.translation_key == "import_photo_failed"
+    assert len(coordinator.plants) == 1
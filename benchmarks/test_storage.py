@@ -0,0 +1,232 @@
+"""Tests of the storage: version 1 migration, unchanged writes and restoring."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.util.dt import now
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.simple_plant.const import (
+    CONF_SAVE_DELAY,
+    STORAGE_KEY,
+    STORAGE_SAVE_DELAY,
+)
+from custom_components.simple_plant.data import (
+    STORAGE_VERSION,
+    SimplePlantStore,
+    decode_plant,
+    encode_plant,
+)
+from custom_components.simple_plant.journal import SimplePlantJournalStore
+
+from .conftest import (
+    StorageWrites,
+    forget_singletons,
+    hub_entry,
+    plant_data,
+    plant_entry,
+)
+
+if TYPE_CHECKING:
+    from freezegun.api import FrozenDateTimeFactory
+    from homeassistant.core import HomeAssistant
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+PLANT_V1 = {
+    "simple_plant_last_watered_plant_0": "2025-04-01T10:00:00+00:00",
+    "simple_plant_days_between_waterings_plant_0": "7.0",
+    "simple_plant_health_plant_0": "good",
+    "_old_last_watered": "2025-03-25T10:00:00+00:00",
+}
+PLANT = {
+    "last_watered": date(2025, 4, 1),
+    "days_between_waterings": 7.0,
+    "health": "good",
+    "_old_last_watered": date(2025, 3, 25),
+}
+# Values changed before a restart
+CHANGED = {"days_between_waterings": 5.0, "health": "excellent"}
+
+
+def stored_file(version: int, data: dict[str, Any], key: str = STORAGE_KEY) -> dict:
+    """Return a storage file as written by Home Assistant."""
+    return {"version": version, "minor_version": 1, "key": key, "data": data}
+
+
+async def async_setup(hass: HomeAssistant, entry: MockConfigEntry) -> None:
+    """Set up a config entry and wait for its entities."""
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+def test_encode_plant() -> None:
+    """Check plants are stored with short names and read back unchanged."""
+    stored = encode_plant({**PLANT, "days_between_waterings": 7.5})
+
+    assert stored == {
+        "w": date(2025, 4, 1).toordinal(),
+        "i": 7.5,
+        "h": "good",
+        "u": date(2025, 3, 25).toordinal(),
+    }
+    assert isinstance(encode_plant(PLANT)["i"], int)
+    assert decode_plant(encode_plant(PLANT)) == PLANT
+
+
+async def test_migrate_single_file(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Check a version 1 file is read decoded, and rewritten as version 2."""
+    hass_storage[STORAGE_KEY] = stored_file(1, {"plant_0": PLANT_V1})
+
+    assert await SimplePlantStore(hass).async_get_data("plant_0") == PLANT
+    assert hass_storage[STORAGE_KEY]["version"] == STORAGE_VERSION
+    assert hass_storage[STORAGE_KEY]["data"] == {"plant_0": encode_plant(PLANT)}
+
+
+async def test_migrate_shards(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Check version 1 shards are migrated, and their manifest is kept."""
+    manifest_key = f"{STORAGE_KEY}.manifest"
+    hass_storage[manifest_key] = stored_file(1, {"plants": ["plant_0"]}, manifest_key)
+    hass_storage[f"{STORAGE_KEY}.plant_0"] = stored_file(
+        1, PLANT_V1, f"{STORAGE_KEY}.plant_0"
+    )
+    store = SimplePlantStore(hass)
+
+    assert await store.async_get_data("plant_0") == PLANT
+    assert store.sharded
+
+
+async def test_migrate_invalid_value(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Check a version 1 value that can't be read is dropped, not the plant."""
+    hass_storage[STORAGE_KEY] = stored_file(
+        1,
+        {
+            "plant_0": {
+                "last_watered": "yesterday",
+                "days_between_waterings": "7",
+            }
+        },
+    )
+
+    assert await SimplePlantStore(hass).async_get_data("plant_0") == {
+        "days_between_waterings": 7.0
+    }
+
+
+async def test_skip_unchanged_writes(
+    store: SimplePlantStore, storage_writes: StorageWrites
+) -> None:
+    """Check saving values already stored writes nothing."""
+    await store.async_save_data("plant_0", {"health": "good"})
+    await store.async_save_batch({"plant_1": {"health": "good"}})
+    logical_writes = store.logical_writes
+    storage_writes.clear()
+
+    await store.async_save_data("plant_0", {"health": "good"})
+    await store.async_save_batch(
+        {"plant_0": {"health": "good"}, "plant_1": {"health": "good"}}
+    )
+
+    assert store.logical_writes == logical_writes
+    assert storage_writes.count == 0
+
+    await store.async_save_batch(
+        {"plant_0": {"health": "good"}, "plant_1": {"health": "poor"}}
+    )
+
+    assert store.logical_writes == logical_writes + 1
+    assert storage_writes.count == 1
+
+
+async def test_delayed_save(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Check changes made before a delayed save are written together."""
+    store = SimplePlantStore(hass)
+    await store.async_save_data("plant_0", {"health": "good"})
+    await store.async_save_data("plant_0", {"health": "poor"})
+    assert STORAGE_KEY not in hass_storage
+
+    freezer.tick(STORAGE_SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert hass_storage[STORAGE_KEY]["data"] == {"plant_0": {"h": "poor"}}
+    assert store.stats["last_coalesced_writes"] == 2  # noqa: PLR2004
+    assert store.stats["pending_writes"] == 0
+
+
+async def test_restore_without_writes(
+    hass: HomeAssistant, store: SimplePlantStore, storage_writes: StorageWrites
+) -> None:
+    """Check entities restore stored values on restart without writing them."""
+    last_watered = now().date() - timedelta(days=3)
+    entry = plant_entry(0)
+    entry.add_to_hass(hass)
+    await async_setup(hass, entry)
+    await store.async_save_data("plant_0", {**CHANGED, "last_watered": last_watered})
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    forget_singletons()
+    store = SimplePlantStore(hass)
+    store.save_delay = 0
+    SimplePlantJournalStore(hass).save_delay = 0
+    storage_writes.clear()
+
+    await async_setup(hass, entry)
+
+    assert hass.states.get("date.simple_plant_last_watered_plant_0").state == (
+        last_watered.isoformat()
+    )
+    interval = hass.states.get("number.simple_plant_days_between_waterings_plant_0")
+    assert float(interval.state) == CHANGED["days_between_waterings"]
+    health = hass.states.get("select.simple_plant_health_plant_0")
+    assert health.state == CHANGED["health"]
+    assert store.logical_writes == 0
+    assert storage_writes.count == 0
+
+
+async def test_first_setup_without_writes(
+    hass: HomeAssistant, store: SimplePlantStore, storage_writes: StorageWrites
+) -> None:
+    """Check a new plant shows its configured values without storing them."""
+    config = plant_data(0)
+    entry = plant_entry(0)
+    entry.add_to_hass(hass)
+
+    await async_setup(hass, entry)
+
+    interval = hass.states.get("number.simple_plant_days_between_waterings_plant_0")
+    assert float(interval.state) == config["days_between_waterings"]
+    health = hass.states.get("select.simple_plant_health_plant_0")
+    assert health.state == config["health"]
+    assert store.logical_writes == 0
+    assert storage_writes.count == 0
+
+
+async def test_save_delay_option(hass: HomeAssistant) -> None:
+    """Check the hub option sets the delay of storage writes."""
+    entry = hub_entry(1)
+    entry.add_to_hass(hass)
+    await async_setup(hass, entry)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    assert result["step_id"] == "hub"
+    await hass.config_entries.options.async_configure(
+        result["flow_id"], {CONF_SAVE_DELAY: 0}
+    )
+    await hass.async_block_till_done()
+
+    assert SimplePlantStore(hass).save_delay == 0
+    assert SimplePlantJournalStore(hass).save_delay == 0
+    assert entry.state is ConfigEntryState.LOADED
@@ -7,22 +7,40 @@ https://github.com/ndesgranges/simple-plant
 
 from __future__ import annotations
 
+import time
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
-from homeassistant.config_entries import ConfigEntryState
-from homeassistant.core import async_get_hass
+from homeassistant.config_entries import ConfigEntryState, ConfigSubentry
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.config_validation import config_entry_only_config_schema
 from homeassistant.helpers.device_registry import (
-    EVENT_DEVICE_REGISTRY_UPDATED,
-    EventDeviceRegistryUpdatedData,
     async_entries_for_config_entry,
     async_get,
 )
+from homeassistant.helpers.start import async_at_started
 from homeassistant.util import slugify
 
-from .config_flow import remove_photo
-from .const import DOMAIN, LOGGER, PLATFORMS
-from .coordinator import SimplePlantCoordinator
+from .aggregates import SimplePlantAggregates
+from .const import (
+    CONF_FOLDED_INTO,
+    CONF_IMPORT_PLANTS,
+    CONF_PLANT_ID,
+    CONF_SAVE_DELAY,
+    DOMAIN,
+    LOGGER,
+    PLATFORMS,
+    SUBENTRY_TYPE_PLANT,
+)
+from .coordinator import SimplePlantCoordinator, is_hub
+from .data import SimplePlantStore
+from .devices import SimplePlantDeviceIndex
+from .estimator import SimplePlantEstimator
+from .journal import SimplePlantJournalStore
+from .photos import SimplePlantPhotoStore
+from .services import async_setup_services
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -36,83 +54,221 @@ CONFIG_SCHEMA = config_entry_only_config_schema(DOMAIN)
 async def async_setup(hass: HomeAssistant, _config: ConfigType) -> bool:
     """Set up the Simple Plant component."""
     hass.data.setdefault(DOMAIN, {})
+
+    async def flush_store(_event: Event) -> None:
+        """Write pending storage changes before shutdown."""
+        await SimplePlantStore(hass).async_flush()
+        await SimplePlantJournalStore(hass).async_flush()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, flush_store)
+
+    async def collect_photos(_hass: HomeAssistant) -> None:
+        """Reclaim photos left behind by failed flows."""
+        SimplePlantPhotoStore(hass).async_schedule_garbage_collection()
+
+    async_at_started(hass, collect_photos)
+    unsubs = [
+        # A single listener renames plants after their device
+        SimplePlantDeviceIndex(hass).async_listen(),
+        SimplePlantEstimator(hass).async_listen(),
+    ]
+
+    @callback
+    def stop_listening(_event: Event) -> None:
+        """Stop following devices and cancel the nightly estimation."""
+        for unsub in unsubs:
+            unsub()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, stop_listening)
+    SimplePlantAggregates(hass).async_start()
+
+    async def estimate_intervals(_hass: HomeAssistant) -> None:
+        """Suggest intervals until the nightly run, without applying them."""
+        await SimplePlantEstimator(hass).async_run(apply=False)
+
+    async_at_started(hass, estimate_intervals)
+    async_setup_services(hass)
+    return True
+
+
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Migrate an old config entry."""
+    if entry.version > 1:
+        # Downgraded from a future version
+        return False
+
+    if entry.minor_version < 2:  # noqa: PLR2004
+        LOGGER.debug(
+            "Migrating photo of %s to the content-addressed store", entry.title
+        )
+        data = dict(entry.data)
+        if data.get("photo"):
+            photo = await SimplePlantPhotoStore(hass).async_rehome(data["photo"])
+            if photo is not None:
+                data["photo"] = photo
+        hass.config_entries.async_update_entry(entry, data=data, minor_version=2)
+
+    if entry.minor_version < 3:  # noqa: PLR2004
+        await async_migrate_plant_ids(hass, entry)
+        hass.config_entries.async_update_entry(entry, minor_version=3)
+
     return True
 
 
+async def async_migrate_plant_ids(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Key the plants of `entry` by a stable id rather than by their name."""
+    store = SimplePlantStore(hass)
+    device_registry = async_get(hass)
+    entity_registry = er.async_get(hass)
+    # Standalone plants use the id of their entry, hub plants of their subentry
+    plants = (
+        [
+            (subentry, subentry.subentry_id)
+            for subentry in entry.subentries.values()
+            if subentry.subentry_type == SUBENTRY_TYPE_PLANT
+        ]
+        if is_hub(entry)
+        else [(None, entry.entry_id)]
+    )
+    for subentry, plant_id in plants:
+        config = subentry or entry
+        if CONF_PLANT_ID in config.data:
+            continue
+        device = slugify(config.title)
+        LOGGER.debug("Migrating plant %s to id %s", config.title, plant_id)
+        await store.async_migrate_device(device, plant_id)
+
+        # Entities and device were keyed by the slug of the plant name
+        prefix = f"{DOMAIN}_"
+        suffix = f"_{device}"
+        subentry_id = subentry.subentry_id if subentry else None
+        for entity in er.async_entries_for_config_entry(
+            entity_registry, entry.entry_id
+        ):
+            unique_id = entity.unique_id
+            if (
+                entity.config_subentry_id != subentry_id
+                or not unique_id.startswith(prefix)
+                or not unique_id.endswith(suffix)
+            ):
+                continue
+            key = unique_id[len(prefix) : -len(suffix)]
+            entity_registry.async_update_entity(
+                entity.entity_id, new_unique_id=f"{plant_id}_{key}"
+            )
+        old_device = device_registry.async_get_device(
+            identifiers={(DOMAIN, f"{DOMAIN}_{device}")}
+        )
+        if old_device is not None:
+            device_registry.async_update_device(
+                old_device.id, new_identifiers={(DOMAIN, plant_id)}
+            )
+
+        data = {**config.data, CONF_PLANT_ID: plant_id}
+        if subentry is None:
+            hass.config_entries.async_update_entry(entry, data=data)
+        else:
+            hass.config_entries.async_update_subentry(entry, subentry, data=data)
+
+
 # https://developers.home-assistant.io/docs/config_entries_index/#setting-up-an-entry
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up this integration using UI."""
     LOGGER.debug("Setting up entry %s", entry.title)
+    start = time.perf_counter()
+    if is_hub(entry) and entry.data.get(CONF_IMPORT_PLANTS):
+        await async_fold_plant_entries(hass, entry)
+    if is_hub(entry):
+        async_apply_hub_options(hass, entry)
     coordinator = SimplePlantCoordinator(hass, entry)
 
     if entry.state == ConfigEntryState.SETUP_IN_PROGRESS:
         await coordinator.async_config_entry_first_refresh()
     else:
         await coordinator.async_request_refresh()
+    LOGGER.debug(
+        "Loaded data of %s (%s plants) in %.3fs (storage loads: %s)",
+        entry.title,
+        len(coordinator.plants),
+        time.perf_counter() - start,
+        coordinator.store.load_count,
+    )
 
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
-    entry.async_on_unload(
-        hass.bus.async_listen(
-            EVENT_DEVICE_REGISTRY_UPDATED,  # type: ignore[arg-type]
-            on_device_registry_update_handler,
-        )
-    )
+    # Devices exist once the platforms added their entities
+    devices = SimplePlantDeviceIndex(hass)
+    for plant in coordinator.plants.values():
+        devices.async_add_plant(plant)
 
+    coordinator.setup_duration = time.perf_counter() - start
+    LOGGER.debug("Set up %s in %.3fs", entry.title, coordinator.setup_duration)
     return True
 
 
-async def on_device_registry_update_handler(
-    event: Event[EventDeviceRegistryUpdatedData],
-) -> None:
-    """Handle update of device registry."""
-    changes = event.data.get("changes")
-    if not changes or not isinstance(changes, dict) or "name_by_user" not in changes:
+@callback
+def async_apply_hub_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply the options of the hub to the storage of every plant."""
+    if CONF_SAVE_DELAY not in entry.options:
         return
-    # Get device
-    hass = async_get_hass()
-    device_registry = async_get(hass)
-    device = device_registry.async_get(event.data.get("device_id"))
-    if not device:
-        return
-    # Get entries
-    entries: set[ConfigEntry] = set()
-    for entry_id in device.config_entries:
-        entry = hass.config_entries.async_get_entry(entry_id)
-        if entry:
-            entries.add(entry)
-    # Update entries
-    for entry in entries:
-        device_name_from_entry_title = entry.title[0].upper() + entry.title[1:]
-        if (
-            device_name_from_entry_title == device.name_by_user
-            or device.name_by_user is None
-        ):
-            return
-        LOGGER.debug(
-            "Renaming entry %s to %s",
-            entry.title,
-            device.name_by_user,
-        )
-        data = dict(entry.data)
-        data.update(
-            {
-                "name": device.name_by_user,
-                "name_by_user": device.name_by_user,
-            }
-        )
-        new_title = device.name_by_user
+    save_delay = entry.options[CONF_SAVE_DELAY]
+    LOGGER.debug("Writing storage changes after %ss", save_delay)
+    SimplePlantStore(hass).save_delay = save_delay
+    SimplePlantJournalStore(hass).save_delay = save_delay
 
-        coordinator: SimplePlantCoordinator = hass.data[DOMAIN][entry.entry_id]
-        await coordinator.async_rename_device(slugify(new_title))
 
+async def async_fold_plant_entries(hass: HomeAssistant, hub: ConfigEntry) -> None:
+    """Fold every single plant config entry into the `hub` entry."""
+    device_registry = async_get(hass)
+    entity_registry = er.async_get(hass)
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        if is_hub(entry) or entry.data.get(CONF_FOLDED_INTO):
+            continue
+        LOGGER.info("Folding plant %s into %s", entry.title, hub.title)
+        # The plant data now belongs to the hub, keep it on removal
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_FOLDED_INTO: hub.entry_id}
+        )
         await hass.config_entries.async_unload(entry.entry_id)
-        hass.config_entries.async_update_entry(entry, data=data, title=new_title)
-        hass.config_entries.async_schedule_reload(entry.entry_id)
-        device_registry.async_remove_device(device.id)
+        # Plants that didn't set up yet are still keyed by their name
+        if not await async_migrate_entry(hass, entry):
+            continue
+        subentry = ConfigSubentry(
+            data=MappingProxyType(
+                {
+                    key: value
+                    for key, value in entry.data.items()
+                    if key != CONF_FOLDED_INTO
+                }
+            ),
+            subentry_type=SUBENTRY_TYPE_PLANT,
+            title=entry.title,
+            unique_id=slugify(entry.title),
+        )
+        hass.config_entries.async_add_subentry(hub, subentry)
+        # Keep entity ids, history and device customizations
+        for entity in er.async_entries_for_config_entry(
+            entity_registry, entry.entry_id
+        ):
+            entity_registry.async_update_entity(
+                entity.entity_id,
+                config_entry_id=hub.entry_id,
+                config_subentry_id=subentry.subentry_id,
+            )
+        for device in async_entries_for_config_entry(device_registry, entry.entry_id):
+            device_registry.async_update_device(
+                device.id,
+                add_config_entry_id=hub.entry_id,
+                add_config_subentry_id=subentry.subentry_id,
+                remove_config_entry_id=entry.entry_id,
+            )
+        await hass.config_entries.async_remove(entry.entry_id)
+    hass.config_entries.async_update_entry(
+        hub, data={**hub.data, CONF_IMPORT_PLANTS: False}
+    )
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -124,42 +280,76 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Remove entry data
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator: SimplePlantCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        devices = SimplePlantDeviceIndex(hass)
+        for plant in coordinator.plants.values():
+            coordinator.scheduler.async_remove_plant(plant)
+            devices.async_remove_plant(plant)
+        await coordinator.store.async_flush()
 
     return unload_ok
 
 
 async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle removal of an entry."""
-    # Remove storage
-    coordinator = SimplePlantCoordinator(hass, entry)
-    await coordinator.remove_device_from_storage()
+    # Remove storage, unless a hub took it over
+    if not entry.data.get(CONF_FOLDED_INTO):
+        coordinator = SimplePlantCoordinator(hass, entry)
+        await coordinator.remove_devices_from_storage()
 
-    # Remove photo
-    remove_photo(hass, entry)
+    # Remove photo if no other plant uses it
+    SimplePlantPhotoStore(hass).async_schedule_garbage_collection(
+        exclude_entry_id=entry.entry_id
+    )
 
 
 async def async_reload_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
 ) -> None:
-    """Reload config entry."""
-    if entry.title != entry.data.get("name"):
-        LOGGER.info("Changing name of %s to %s", entry.data.get("name"), entry.title)
-        # Migrate storage storage
-        coordinator: SimplePlantCoordinator = hass.data[DOMAIN][entry.entry_id]
-        await coordinator.async_rename_device(slugify(entry.title))
-        # Update entry
-        data = dict(entry.data)
-        data.update({"name": entry.title, "name_by_user": entry.title})
-        hass.config_entries.async_update_entry(entry, data=data)
-        # remove obsolete device
-        device_name = entry.title[0].upper() + entry.title[1:]
-        device_registry = async_get(hass)
-        for device in async_entries_for_config_entry(device_registry, entry.entry_id):
-            if device.name != device_name:
-                device_registry.async_remove_device(device.id)
+    """
+    Update the plants of an entry in place.
+
+    Added, reconfigured, renamed and removed plants are updated without
+    reloading the other plants of a hub: only their own entities are added or
+    removed. Subentries added in a batch call this listener once each, the
+    first call adds them all, the next ones find nothing to update. Hub
+    options apply right away.
+    """
+    coordinator: SimplePlantCoordinator | None = hass.data[DOMAIN].get(entry.entry_id)
+    if coordinator is None:
+        return
+    if is_hub(entry) != coordinator.hub:
+        LOGGER.info("Reloading entry %s", entry.title)
+        hass.config_entries.async_schedule_reload(entry.entry_id)
         return
-    LOGGER.info("Reloading entry %s", entry.title)
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    if coordinator.hub:
+        async_apply_hub_options(hass, entry)
+    configs = coordinator.plant_configs(entry)
+    devices = SimplePlantDeviceIndex(hass)
+    removed = []
+    photos_changed = False
+    for plant in list(coordinator.plants.values()):
+        config = configs.pop(plant.subentry_id, None)
+        if config is None:
+            # Removing the subentry removed the entities and device of the plant
+            LOGGER.info("Removing plant %s", plant.title)
+            coordinator.async_remove_plant(plant)
+            devices.async_remove_plant(plant)
+            removed.append(plant)
+            continue
+        if config.title != plant.title:
+            # Renamed from the integrations page
+            LOGGER.info("Changing name of %s to %s", plant.title, config.title)
+            plant.async_rename(config.title)
+        if dict(config.data) != dict(plant.config):
+            LOGGER.info("Updating plant %s", plant.title)
+            photos_changed |= config.data.get("photo") != plant.config.get("photo")
+            plant.async_update_config(config.data)
+    for subentry in configs.values():
+        LOGGER.info("Adding plant %s", subentry.title)
+        devices.async_add_plant(coordinator.async_add_plant(subentry))
+    for plant in removed:
+        await plant.remove_device_from_storage()
+    if removed or photos_changed:
+        SimplePlantPhotoStore(hass).async_schedule_garbage_collection()
@@ -0,0 +1,218 @@
+"""Aggregates of plants to water, per home, area and label."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from typing import TYPE_CHECKING, Any, ClassVar, Self
+
+from homeassistant.core import callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.util.dt import now
+
+from .const import DOMAIN
+from .scheduler import SimplePlantScheduler
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+
+GROUP_HOME = "home"
+GROUP_AREA = "area"
+GROUP_LABEL = "label"
+
+# (group type, area or label id, None for the home)
+GroupKey = tuple[str, str | None]
+HOME: GroupKey = (GROUP_HOME, None)
+
+# (next watering day ordinal, late)
+PlantState = tuple[int, bool]
+
+
+def device_groups(device: dr.DeviceEntry | None) -> tuple[GroupKey, ...]:
+    """Return the groups of a plant device."""
+    if device is None:
+        return (HOME,)
+    return (
+        HOME,
+        *(((GROUP_AREA, device.area_id),) if device.area_id else ()),
+        *((GROUP_LABEL, label) for label in sorted(device.labels)),
+    )
+
+
+class SimplePlantGroup:
+    """Plants to water of a group, counted as they become due or get watered."""
+
+    def __init__(self) -> None:
+        """Initialize an empty group."""
+        self.to_water = 0
+        # Late plants sorted by next watering day, the oldest one first
+        self._late: list[tuple[int, str]] = []
+
+    @property
+    def late(self) -> int:
+        """Return the number of late plants."""
+        return len(self._late)
+
+    @property
+    def oldest_late(self) -> tuple[int, str] | None:
+        """Return the next watering day and id of the most overdue plant."""
+        return self._late[0] if self._late else None
+
+    def add(self, plant_id: str, state: PlantState) -> None:
+        """Count a plant to water."""
+        self.to_water += 1
+        ordinal, late = state
+        if late:
+            insort(self._late, (ordinal, plant_id))
+
+    def remove(self, plant_id: str, state: PlantState) -> None:
+        """Stop counting a plant to water."""
+        self.to_water -= 1
+        ordinal, late = state
+        if late:
+            del self._late[bisect_left(self._late, (ordinal, plant_id))]
+
+
+class SimplePlantAggregates:
+    """
+    Class to count plants to water, in total and per area and label.
+
+    Only plants to water are tracked: the scheduler reports each plant as it
+    becomes due, late, or gets watered, and the counters of its groups are
+    updated, without scanning other plants. Groups of a plant come from the
+    area and labels of its device.
+    """
+
+    _instance: ClassVar[SimplePlantAggregates | None] = None
+    _initialized: bool = False
+
+    def __new__(cls, _hass: HomeAssistant) -> Self:
+        """Create a singleton instance."""
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the aggregates."""
+        if not self._initialized:
+            self.hass = hass
+            self.scheduler = SimplePlantScheduler(hass)
+            self.groups: dict[GroupKey, SimplePlantGroup] = {HOME: SimplePlantGroup()}
+            # Plants to water: state and groups
+            self._states: dict[str, PlantState] = {}
+            self._memberships: dict[str, tuple[GroupKey, ...]] = {}
+            self._listeners: dict[GroupKey, set[CALLBACK_TYPE]] = {}
+            self._group_listeners: set[Callable[[GroupKey], None]] = set()
+            self._unsub: CALLBACK_TYPE | None = None
+            self._initialized = True
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return aggregate counters."""
+        return {
+            "groups": len(self.groups),
+            "tracked_plants": len(self._states),
+        }
+
+    @callback
+    def async_start(self) -> None:
+        """Count the plants to water, then follow the scheduler."""
+        if self._unsub is not None:
+            return
+        for plant_id in self.scheduler.due:
+            self._async_update_plant(plant_id)
+        self._unsub = self.scheduler.async_listen_due(self._async_update_plant)
+
+    @callback
+    def async_listen(
+        self, key: GroupKey, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for changes of the counters of a group."""
+        listeners = self._listeners.setdefault(key, set())
+        listeners.add(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the listener."""
+            listeners.discard(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_listen_groups(
+        self, group_callback: Callable[[GroupKey], None]
+    ) -> CALLBACK_TYPE:
+        """Listen for new groups."""
+        self._group_listeners.add(group_callback)
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the listener."""
+            self._group_listeners.discard(group_callback)
+
+        return remove_listener
+
+    @callback
+    def async_ensure_group(self, key: GroupKey) -> SimplePlantGroup:
+        """Get a group, creating it empty."""
+        if (group := self.groups.get(key)) is None:
+            group = self.groups[key] = SimplePlantGroup()
+            for group_callback in list(self._group_listeners):
+                group_callback(key)
+        return group
+
+    @callback
+    def async_regroup_plant(self, plant_id: str, device: dr.DeviceEntry) -> None:
+        """Move a plant to the groups of its device."""
+        state = self._states.get(plant_id)
+        groups = device_groups(device)
+        if state is None or groups == self._memberships[plant_id]:
+            return
+        self._async_move(plant_id, state, self._memberships[plant_id], None)
+        self._memberships[plant_id] = groups
+        self._async_move(plant_id, None, groups, state)
+
+    @callback
+    def _async_update_plant(self, plant_id: str) -> None:
+        """Count a plant in or out of its groups."""
+        ordinal = self.scheduler.index.get(plant_id)
+        today = now().date().toordinal()
+        state = None
+        if ordinal is not None and ordinal <= today:
+            state = (ordinal, ordinal < today)
+        previous = self._states.get(plant_id)
+        if state == previous:
+            return
+        groups = self._memberships.get(plant_id)
+        if groups is None:
+            groups = device_groups(
+                dr.async_get(self.hass).async_get_device(
+                    identifiers={(DOMAIN, plant_id)}
+                )
+            )
+        if state is None:
+            del self._states[plant_id]
+            del self._memberships[plant_id]
+        else:
+            self._states[plant_id] = state
+            self._memberships[plant_id] = groups
+        self._async_move(plant_id, previous, groups, state)
+
+    @callback
+    def _async_move(
+        self,
+        plant_id: str,
+        previous: PlantState | None,
+        groups: tuple[GroupKey, ...],
+        state: PlantState | None,
+    ) -> None:
+        """Replace the state of a plant in its groups, and notify them."""
+        for key in groups:
+            group = self.async_ensure_group(key)
+            if previous is not None:
+                group.remove(plant_id, previous)
+            if state is not None:
+                group.add(plant_id, state)
+            for update_callback in list(self._listeners.get(key, ())):
+                update_callback()
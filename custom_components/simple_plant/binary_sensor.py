@@ -9,25 +9,23 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
     BinarySensorEntityDescription,
 )
-from homeassistant.helpers.event import (
-    async_track_state_change_event,
-    async_track_time_change,
-)
-from homeassistant.util.dt import as_local
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
+from .coordinator import SimplePlantCoordinator
 
 if TYPE_CHECKING:
-    from datetime import datetime
-
     from homeassistant.config_entries import ConfigEntry
-    from homeassistant.core import Event, EventStateChangedData, HomeAssistant
+    from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-    from .coordinator import SimplePlantCoordinator
+    from .coordinator import SimplePlant, SimplePlantStatus
 
 
-class SimplePlantBinarySensor(BinarySensorEntity):
+class SimplePlantBinarySensor(
+    CoordinatorEntity[SimplePlantCoordinator], BinarySensorEntity
+):
     """simple_plant binary_sensor base class."""
 
     _attr_has_entity_name = True
@@ -35,27 +33,26 @@ class SimplePlantBinarySensor(BinarySensorEntity):
 
     def __init__(
         self,
-        hass: HomeAssistant,
-        entry: ConfigEntry,
+        plant: SimplePlant,
         description: BinarySensorEntityDescription,
     ) -> None:
         """Initialize the binary_sensor class."""
-        super().__init__()
-        self._hass = hass
+        super().__init__(plant.coordinator, context=plant.plant_id)
+        self.plant = plant
         self.entity_description = description
-        self.coordinator: SimplePlantCoordinator = hass.data[DOMAIN][entry.entry_id]
-
-        self._attr_should_poll = True
 
-        device = self.coordinator.device
+        device = plant.device
 
         self._attr_native_value: bool | None = None
 
         self.entity_id = f"binary_sensor.{DOMAIN}_{description.key}_{device}"
-        self._attr_unique_id = f"{DOMAIN}_{description.key}_{device}"
+        self._attr_unique_id = f"{plant.plant_id}_{description.key}"
 
         # Set up device info
-        self._attr_device_info = self.coordinator.device_info
+        self._attr_device_info = plant.device_info
+
+        # Initial value
+        self._update_value()
 
     @property
     def is_on(self) -> bool:
@@ -69,69 +66,38 @@ class SimplePlantBinarySensor(BinarySensorEntity):
     @property
     def device(self) -> str | None:
         """Return the device name."""
-        return self.coordinator.device
-
-    def get_dates(self) -> dict[str, datetime] | None:
-        """Get dates from relevants device entites states."""
-        return self.coordinator.get_dates()
-
-    async def async_added_to_hass(self) -> None:
-        """Run when entity about to be added to hass."""
-        await super().async_added_to_hass()
-        device = self.coordinator.device
-
-        # Subscribe to state changes
-        self.async_on_remove(
-            async_track_state_change_event(
-                self.hass,
-                f"date.{DOMAIN}_last_watered_{device}",
-                self._update_state,
-            )
-        )
-        self.async_on_remove(
-            async_track_state_change_event(
-                self.hass,
-                f"number.{DOMAIN}_days_between_waterings_{device}",
-                self._update_state,
-            )
-        )
-        self.async_on_remove(
-            async_track_time_change(
-                self.hass,
-                self._update_state,
-                hour=0,
-                minute=0,
-                second=0,
-            )
-        )
-
-        # Initial update
-        await self._update_state()
+        return self.plant.device
 
-    async def _update_state(
-        self,
-        _event: Event[EventStateChangedData] | datetime | None = None,
-    ) -> None:
-        """Update the binary sensor state based on other entities."""
+    def _compute_value(self, status: SimplePlantStatus) -> bool:
+        """Compute the binary sensor value from the watering status."""
         raise NotImplementedError
 
+    def _update_value(self) -> bool:
+        """Update the value from the plant, return True if it changed."""
+        status = self.plant.status
+        if status is None:
+            return False
+        value = self._compute_value(status)
+        if value == self._attr_native_value:
+            return False
+        self._attr_native_value = value
+        return True
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only if the value changed."""
+        if self._update_value():
+            self.async_write_ha_state()
+
 
 class SimplePlantTodo(SimplePlantBinarySensor):
     """simple_plant binary_sensor for todo."""
 
     _fallback_value = False
 
-    async def _update_state(self, _event: Event | None = None) -> None:
-        """Update the binary sensor state based on other entities."""
-        dates = self.get_dates()
-
-        if not dates:
-            return
-
-        self._attr_native_value = (
-            as_local(dates["today"]).date() >= as_local(dates["next_watering"]).date()
-        )
-        self.async_write_ha_state()
+    def _compute_value(self, status: SimplePlantStatus) -> bool:
+        """Return True from the next watering day."""
+        return status.due
 
 
 class SimplePlantProblem(SimplePlantBinarySensor):
@@ -140,17 +106,9 @@ class SimplePlantProblem(SimplePlantBinarySensor):
     _fallback_value = False
     _attr_translation_key = "problem"
 
-    async def _update_state(self, _event: Event | None = None) -> None:
-        """Update the binary sensor state based on other entities."""
-        dates = self.get_dates()
-
-        if not dates:
-            return
-
-        self._attr_native_value = (
-            as_local(dates["today"]).date() > as_local(dates["next_watering"]).date()
-        )
-        self.async_write_ha_state()
+    def _compute_value(self, status: SimplePlantStatus) -> bool:
+        """Return True once the next watering day has passed."""
+        return status.late
 
 
 ENTITIES = [
@@ -182,6 +140,17 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the binary_sensor platform."""
-    async_add_entities(
-        entity["class"](hass, entry, entity["description"]) for entity in ENTITIES
-    )
+    coordinator: SimplePlantCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    @callback
+    def async_add_plant(plant: SimplePlant) -> None:
+        """Add the entities of a plant."""
+        async_add_entities(
+            (entity["class"](plant, entity["description"]) for entity in ENTITIES),
+            config_subentry_id=plant.subentry_id,
+        )
+
+    for plant in coordinator.plants.values():
+        async_add_plant(plant)
+    # Plants of subentries added later, without reloading the entry
+    entry.async_on_unload(coordinator.async_listen_plants(async_add_plant))
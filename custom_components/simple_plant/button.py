@@ -8,6 +8,7 @@ from homeassistant.components.button import (
     ButtonEntity,
     ButtonEntityDescription,
 )
+from homeassistant.core import callback
 
 from .const import DOMAIN
 
@@ -16,7 +17,7 @@ if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-    from .coordinator import SimplePlantCoordinator
+    from .coordinator import SimplePlant, SimplePlantCoordinator
 
 
 ENTITY_DESCRIPTIONS = (
@@ -34,10 +35,23 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the button platform."""
-    async_add_entities(
-        SimplePlantButton(hass, entry, entity_description)
-        for entity_description in ENTITY_DESCRIPTIONS
-    )
+    coordinator: SimplePlantCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    @callback
+    def async_add_plant(plant: SimplePlant) -> None:
+        """Add the entities of a plant."""
+        async_add_entities(
+            (
+                SimplePlantButton(plant, entity_description)
+                for entity_description in ENTITY_DESCRIPTIONS
+            ),
+            config_subentry_id=plant.subentry_id,
+        )
+
+    for plant in coordinator.plants.values():
+        async_add_plant(plant)
+    # Plants of subentries added later, without reloading the entry
+    entry.async_on_unload(coordinator.async_listen_plants(async_add_plant))
 
 
 class SimplePlantButton(ButtonEntity):
@@ -47,29 +61,28 @@ class SimplePlantButton(ButtonEntity):
 
     def __init__(
         self,
-        hass: HomeAssistant,
-        entry: ConfigEntry,
+        plant: SimplePlant,
         description: ButtonEntityDescription,
     ) -> None:
         """Initialize the button class."""
         super().__init__()
 
         self.entity_description = description
-        self.coordinator: SimplePlantCoordinator = hass.data[DOMAIN][entry.entry_id]
+        self.plant = plant
 
-        device = self.coordinator.device
+        device = plant.device
 
         self.entity_id = f"button.{DOMAIN}_{description.key}_{device}"
-        self._attr_unique_id = f"{DOMAIN}_{description.key}_{device}"
+        self._attr_unique_id = f"{plant.plant_id}_{description.key}"
 
         # Set up device info
-        self._attr_device_info = self.coordinator.device_info
+        self._attr_device_info = plant.device_info
 
     @property
     def device(self) -> str | None:
         """Return the device name."""
-        return self.coordinator.device
+        return self.plant.device
 
     async def async_press(self) -> None:
         """Press the button."""
-        await self.coordinator.async_mark_as_watered_toggle()
+        await self.plant.async_mark_as_watered_toggle()
@@ -0,0 +1,222 @@
+"""Calendar platform for simple_plant."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from heapq import merge
+from operator import itemgetter
+from typing import TYPE_CHECKING
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.core import callback
+from homeassistant.helpers.entity import EntityDescription
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util.dt import as_local, now, start_of_local_day
+
+from .const import DOMAIN
+from .coordinator import SimplePlantCoordinator
+from .entity import SimplePlantCoalescedEntity
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from datetime import datetime
+
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+    from .coordinator import SimplePlant
+
+
+ENTITY_DESCRIPTIONS = (
+    EntityDescription(
+        key="watering",
+        translation_key="watering",
+        icon="mdi:calendar-blank",
+    ),
+)
+
+
+def watering_days(
+    plant: SimplePlant, start: date, end: date | None = None
+) -> Iterator[tuple[date, SimplePlant]]:
+    """
+    Yield the projected watering days of a plant, from `start` to `end`.
+
+    Days are projected from the plant status, every `interval` days from
+    its next watering, the first one in the window being computed rather
+    than iterated to. A late plant keeps its missed watering day, and is
+    projected from today, when it is overdue.
+    """
+    status = plant.status
+    if status is None:
+        return
+    day = status.next_watering
+    today = now().date()
+    if day < today:
+        if start <= day and (end is None or day < end):
+            yield day, plant
+        day = today
+    if day < start:
+        day += timedelta(
+            days=-(-(start - day).days // status.interval) * status.interval
+        )
+    step = timedelta(days=status.interval)
+    while end is None or day < end:
+        yield day, plant
+        day += step
+
+
+def merged_watering_days(
+    plants: Iterable[SimplePlant], start: date, end: date | None = None
+) -> Iterator[tuple[date, SimplePlant]]:
+    """Yield the watering days of many plants, in order."""
+    return merge(
+        *(watering_days(plant, start, end) for plant in plants), key=itemgetter(0)
+    )
+
+
+def watering_event(day: date, plant: SimplePlant) -> CalendarEvent:
+    """Return the all-day event of a watering day."""
+    return CalendarEvent(
+        start=day,
+        end=day + timedelta(days=1),
+        summary=plant.title[0].upper() + plant.title[1:],
+        uid=f"{plant.plant_id}_{day.isoformat()}",
+    )
+
+
+def window(start_date: datetime, end_date: datetime) -> tuple[date, date]:
+    """Return the days of all-day events overlapping a window, end excluded."""
+    end = as_local(end_date).date()
+    if as_local(end_date) > start_of_local_day(end):
+        end += timedelta(days=1)
+    return as_local(start_date).date(), end
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the calendar platform."""
+    coordinator: SimplePlantCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    @callback
+    def async_add_plant(plant: SimplePlant) -> None:
+        """Add the entities of a plant."""
+        async_add_entities(
+            (
+                SimplePlantCalendar(plant, entity_description)
+                for entity_description in ENTITY_DESCRIPTIONS
+            ),
+            config_subentry_id=plant.subentry_id,
+        )
+
+    for plant in coordinator.plants.values():
+        async_add_plant(plant)
+    # Plants of subentries added later, without reloading the entry
+    entry.async_on_unload(coordinator.async_listen_plants(async_add_plant))
+    if coordinator.hub:
+        async_add_entities(
+            SimplePlantCollectionCalendar(coordinator, entity_description)
+            for entity_description in ENTITY_DESCRIPTIONS
+        )
+
+
+class SimplePlantCalendar(CoordinatorEntity[SimplePlantCoordinator], CalendarEntity):
+    """simple_plant calendar class."""
+
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        plant: SimplePlant,
+        description: EntityDescription,
+    ) -> None:
+        """Initialize the calendar class."""
+        super().__init__(plant.coordinator, context=plant.plant_id)
+        self.plant = plant
+        self.entity_description = description
+
+        device = plant.device
+
+        self.entity_id = f"calendar.{DOMAIN}_{description.key}_{device}"
+        self._attr_unique_id = f"{plant.plant_id}_{description.key}"
+
+        # Set up device info
+        self._attr_device_info = plant.device_info
+
+    @property
+    def device(self) -> str | None:
+        """Return the device name."""
+        return self.plant.device
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return the next watering."""
+        days = watering_days(self.plant, now().date())
+        return next((watering_event(*day) for day in days), None)
+
+    async def async_get_events(
+        self,
+        _hass: HomeAssistant,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> list[CalendarEvent]:
+        """Return the waterings of a window."""
+        return [
+            watering_event(*day)
+            for day in watering_days(self.plant, *window(start_date, end_date))
+        ]
+
+
+class SimplePlantCollectionCalendar(
+    SimplePlantCoalescedEntity,
+    CoordinatorEntity[SimplePlantCoordinator],
+    CalendarEntity,
+):
+    """
+    simple_plant calendar of every plant of a hub.
+
+    Events of the plants are merged lazily, so a window only costs the
+    events it holds. Plant updates are coalesced into a single state write,
+    so watering every plant at once computes the next event once.
+    """
+
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        coordinator: SimplePlantCoordinator,
+        description: EntityDescription,
+    ) -> None:
+        """Initialize the calendar class."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        entry_id = coordinator.config_entry.entry_id
+        self._attr_unique_id = f"{DOMAIN}_{description.key}_{entry_id}"
+        self._attr_device_info = coordinator.device_info
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return the next watering of any plant."""
+        days = merged_watering_days(self.coordinator.plants.values(), now().date())
+        return next((watering_event(*day) for day in days), None)
+
+    async def async_get_events(
+        self,
+        _hass: HomeAssistant,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> list[CalendarEvent]:
+        """Return the waterings of every plant in a window."""
+        days = merged_watering_days(
+            self.coordinator.plants.values(), *window(start_date, end_date)
+        )
+        return [watering_event(*day) for day in days]
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state once for a burst of plant updates."""
+        self.async_schedule_write()
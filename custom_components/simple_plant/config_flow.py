@@ -3,73 +3,41 @@
 from __future__ import annotations
 
 from datetime import datetime
-from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-import aiofiles
 import voluptuous as vol
-from homeassistant.components.file_upload import process_uploaded_file
 from homeassistant.config_entries import (
     ConfigEntry,
     ConfigFlow,
     ConfigFlowResult,
+    ConfigSubentryFlow,
     OptionsFlow,
+    SubentryFlowResult,
 )
 from homeassistant.core import callback
 from homeassistant.helpers import selector
 from homeassistant.util import slugify
 from homeassistant.util.dt import as_local, as_utc, utcnow
-
-from .const import DOMAIN, HEALTH_OPTIONS, IMAGES_MIME_TYPES, LOGGER, STORAGE_DIR
+from homeassistant.util.ulid import ulid_now
+
+from .const import (
+    CONF_HUB,
+    CONF_IMPORT_PLANTS,
+    CONF_PLANT_ID,
+    CONF_SAVE_DELAY,
+    DOMAIN,
+    HEALTH_OPTIONS,
+    LOGGER,
+    STORAGE_SAVE_DELAY,
+    STORAGE_SAVE_DELAY_MAX,
+    SUBENTRY_TYPE_PLANT,
+)
+from .coordinator import is_hub
+from .photos import SimplePlantPhotoStore
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
-## UTILS
-
-
-async def save_image(hass: HomeAssistant, file_id: str) -> str:
-    """Permanently save an uploaded image."""
-    with process_uploaded_file(hass, file_id) as uploaded_file:
-        # Save the file
-        storage_dir = Path(hass.config.path(STORAGE_DIR))
-        storage_dir.mkdir(parents=True, exist_ok=True)
-
-        suffix = uploaded_file.suffix
-        if suffix not in IMAGES_MIME_TYPES:
-            raise ValueError
-        file_path = storage_dir / f"{file_id}{suffix}"
-
-        # Safely copy the file using async operations
-        async with aiofiles.open(file_path, "wb") as destination_file:  # noqa: SIM117
-            async with aiofiles.open(uploaded_file, "rb") as source_file:
-                await destination_file.write(await source_file.read())
-
-        # relative path
-        return f"/{STORAGE_DIR}/{file_path.name}"
-
-
-def remove_photo(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Remove the photo file of a config entry."""
-    try:
-        # Get the photo path from the entry's data
-        photo_path = entry.data.get("photo")
-        if photo_path:
-            # Convert url path to actual file path
-            file_path = Path(str(hass.config.path(photo_path.lstrip("/"))))
-
-            LOGGER.info("Trying to remove: %s", photo_path)
-
-            # Check if file exists before trying to remove it
-            if file_path.exists():
-                file_path.unlink()
-                LOGGER.info("Successfully removed image file: %s", file_path)
-            else:
-                LOGGER.warning("Image file not found: %s", file_path)
-    except OSError as err:
-        LOGGER.error("Error reading image file %s: %s", file_path, err)
-
-
 ## CONFIG FLOW SCHEMAS
 
 
@@ -109,6 +77,15 @@ def user_form() -> vol.Schema:
     )
 
 
+def hub_form() -> vol.Schema:
+    """Return a new hub form."""
+    return vol.Schema(
+        {
+            vol.Required(CONF_IMPORT_PLANTS, default=True): bool,
+        }
+    )
+
+
 def option_form(suggested_species: str | None = None) -> vol.Schema:
     """Return a device reconfiguration form."""
     LOGGER.debug("option_flow, 1st call : displaying form")
@@ -122,12 +99,73 @@ def option_form(suggested_species: str | None = None) -> vol.Schema:
     )
 
 
+def hub_option_form(save_delay: float) -> vol.Schema:
+    """Return a hub reconfiguration form."""
+    return vol.Schema(
+        {
+            vol.Required(CONF_SAVE_DELAY, default=save_delay): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=STORAGE_SAVE_DELAY_MAX,
+                    mode=selector.NumberSelectorMode.BOX,
+                    unit_of_measurement="s",
+                ),
+            ),
+        }
+    )
+
+
 ## CONFIG FLOWS
 
 
+def plant_names(hass: HomeAssistant) -> set[str]:
+    """Return the slugs of every plant name, standalone or in a hub."""
+    names = set()
+    for entry in hass.config_entries.async_entries(domain=DOMAIN):
+        if not is_hub(entry):
+            names.add(slugify(entry.title))
+            continue
+        names.update(
+            slugify(subentry.title)
+            for subentry in entry.subentries.values()
+            if subentry.subentry_type == SUBENTRY_TYPE_PLANT
+        )
+    return names
+
+
+async def async_validate_plant(hass: HomeAssistant, user_input: dict) -> str | None:
+    """Validate a new plant and save its photo, return an error if any."""
+    # Verify name
+    if slugify(user_input["name"]) in plant_names(hass):
+        return "name_exist"
+    user_input["name_by_user"] = user_input["name"]
+    # Verify date
+    if "last_watered" in user_input:
+        date = as_utc(as_local(datetime.fromisoformat(user_input["last_watered"])))
+        if date > utcnow():
+            return "invalid_future_date"
+    if "photo" not in user_input:
+        return "upload_failed_generic"
+    file_id = user_input["photo"]
+
+    try:
+        user_input["photo"] = await SimplePlantPhotoStore(hass).async_save_upload(
+            file_id
+        )
+    except ValueError:
+        return "upload_failed_type"
+    user_input[CONF_PLANT_ID] = ulid_now()
+    return None
+
+
 class SimplePlantFlowHandler(ConfigFlow, domain=DOMAIN):
     """Config flow for Simple Plant."""
 
+    VERSION = 1
+    # 1.2: photos are content-addressed
+    # 1.3: plants are keyed by a stable id rather than by their name
+    MINOR_VERSION = 3
+
     def __init__(self) -> None:
         """Init."""
         self._user_inputs: dict = {}
@@ -136,9 +174,30 @@ class SimplePlantFlowHandler(ConfigFlow, domain=DOMAIN):
     @callback
     def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
         """Get options flow for this handler."""
+        if is_hub(config_entry):
+            # Hub plants are reconfigured as subentries instead
+            return SimplePlantHubOptionFlowHandler()
         return SimplePlantOptionFlowHandler(config_entry)
 
-    async def async_step_user(self, user_input: dict | None = None) -> ConfigFlowResult:
+    @classmethod
+    @callback
+    def async_get_supported_subentry_types(
+        cls, config_entry: ConfigEntry
+    ) -> dict[str, type[ConfigSubentryFlow]]:
+        """Return subentries supported by this handler."""
+        if not is_hub(config_entry):
+            return {}
+        return {SUBENTRY_TYPE_PLANT: SimplePlantSubentryFlowHandler}
+
+    async def async_step_user(
+        self, _user_input: dict | None = None
+    ) -> ConfigFlowResult:
+        """Choose between a single plant and a hub of plants."""
+        return self.async_show_menu(step_id="user", menu_options=["plant", "hub"])
+
+    async def async_step_plant(
+        self, user_input: dict | None = None
+    ) -> ConfigFlowResult:
         """
         Provide Base Plant information Config Flow.
 
@@ -147,44 +206,86 @@ class SimplePlantFlowHandler(ConfigFlow, domain=DOMAIN):
         """
         if user_input is None:
             # 1st call
-            return self.async_show_form(step_id="user", data_schema=user_form())
+            await SimplePlantPhotoStore(self.hass).async_setup_upload()
+            return self.async_show_form(step_id="plant", data_schema=user_form())
         # 2nd call
-        # Verify name
-        domain_entries = self.hass.config_entries.async_entries(domain=DOMAIN)
-        domain_entries_title_slugs = [slugify(entry.title) for entry in domain_entries]
-        LOGGER.debug(domain_entries_title_slugs)
-        if slugify(user_input["name"]) in domain_entries_title_slugs:
+        error = await async_validate_plant(self.hass, user_input)
+        if error is not None:
             return self.async_show_form(
-                step_id="user",
+                step_id="plant",
                 data_schema=user_form(),
-                errors={"base": "name_exist"},
+                errors={"base": error},
             )
-        user_input["name_by_user"] = user_input["name"]
-        # Verify date
-        if "last_watered" in user_input:
-            date = as_utc(as_local(datetime.fromisoformat(user_input["last_watered"])))
-            if date > utcnow():
-                return self.async_show_form(
-                    step_id="user",
-                    data_schema=user_form(),
-                    errors={"base": "invalid_future_date"},
-                )
-        if "photo" not in user_input:
-            return self.async_show_form(
-                step_id="user",
-                errors={"base": "upload_failed_generic"},
-            )
-        file_id = user_input["photo"]
 
-        try:
-            user_input["photo"] = await save_image(self.hass, file_id)
-        except ValueError:
+        return self.async_create_entry(title=user_input["name"], data=user_input)
+
+    async def async_step_hub(self, user_input: dict | None = None) -> ConfigFlowResult:
+        """Create the hub, managing every plant in a single entry."""
+        await self.async_set_unique_id(CONF_HUB)
+        self._abort_if_unique_id_configured()
+        if user_input is None:
+            return self.async_show_form(step_id="hub", data_schema=hub_form())
+
+        return self.async_create_entry(
+            title="Plants",
+            data={
+                CONF_HUB: True,
+                CONF_IMPORT_PLANTS: user_input[CONF_IMPORT_PLANTS],
+            },
+        )
+
+
+class SimplePlantSubentryFlowHandler(ConfigSubentryFlow):
+    """Flow adding or reconfiguring a plant of the hub."""
+
+    async def async_step_user(
+        self, user_input: dict[str, Any] | None = None
+    ) -> SubentryFlowResult:
+        """Provide Base Plant information."""
+        if user_input is None:
+            await SimplePlantPhotoStore(self.hass).async_setup_upload()
+            return self.async_show_form(step_id="user", data_schema=user_form())
+        error = await async_validate_plant(self.hass, user_input)
+        if error is not None:
             return self.async_show_form(
                 step_id="user",
-                errors={"base": "upload_failed_type"},
+                data_schema=user_form(),
+                errors={"base": error},
             )
 
-        return self.async_create_entry(title=user_input["name"], data=user_input)
+        return self.async_create_entry(
+            title=user_input["name"],
+            data=user_input,
+            unique_id=slugify(user_input["name"]),
+        )
+
+    async def async_step_reconfigure(
+        self, user_input: dict[str, Any] | None = None
+    ) -> SubentryFlowResult:
+        """Modify the species or picture of a plant."""
+        subentry = self._get_reconfigure_subentry()
+        form = option_form(subentry.data.get("species"))
+        if user_input is None:
+            await SimplePlantPhotoStore(self.hass).async_setup_upload()
+            return self.async_show_form(step_id="reconfigure", data_schema=form)
+
+        data = dict(subentry.data)
+        if user_input.get("species"):
+            data["species"] = user_input["species"]
+        if user_input.get("photo"):
+            try:
+                data["photo"] = await SimplePlantPhotoStore(
+                    self.hass
+                ).async_save_upload(user_input["photo"])
+            except ValueError:
+                return self.async_show_form(
+                    step_id="reconfigure",
+                    data_schema=form,
+                    errors={"base": "upload_failed_type"},
+                )
+
+        # The plant is updated in place, and its previous photo reclaimed
+        return self.async_update_and_abort(self._get_entry(), subentry, data=data)
 
 
 class SimplePlantOptionFlowHandler(OptionsFlow):
@@ -206,6 +307,7 @@ class SimplePlantOptionFlowHandler(OptionsFlow):
 
         if user_input is None:
             # 1st call
+            await SimplePlantPhotoStore(self.hass).async_setup_upload()
             return self.async_show_form(step_id="init", data_schema=form)
         # 2nd call
         if user_input.get("species"):
@@ -214,8 +316,9 @@ class SimplePlantOptionFlowHandler(OptionsFlow):
         if user_input.get("photo"):
             try:
                 file_id = user_input["photo"]
-                self.user_inputs["photo"] = await save_image(self.hass, file_id)
-                remove_photo(self.hass, self.entry)
+                self.user_inputs["photo"] = await SimplePlantPhotoStore(
+                    self.hass
+                ).async_save_upload(file_id)
             except ValueError:
                 return self.async_show_form(
                     step_id="user",
@@ -235,9 +338,34 @@ class SimplePlantOptionFlowHandler(OptionsFlow):
         data = dict(self.config_entry.data)
         data.update(self.user_inputs)
         self.hass.config_entries.async_update_entry(self.config_entry, data=data)
+        # Reclaim the previous photo if no other plant uses it
+        SimplePlantPhotoStore(self.hass).async_schedule_garbage_collection()
 
         return self.async_create_entry(
             # No data as config entry has been modified
             title=None,
             data={},
         )
+
+
+class SimplePlantHubOptionFlowHandler(OptionsFlow):
+    """Options of the hub, applying to the storage of every plant."""
+
+    async def async_step_init(
+        self, _user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Show the hub options, translated apart from the plant ones."""
+        return await self.async_step_hub()
+
+    async def async_step_hub(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Set how long changes wait to be written to storage."""
+        if user_input is None:
+            save_delay = self.config_entry.options.get(
+                CONF_SAVE_DELAY, STORAGE_SAVE_DELAY
+            )
+            return self.async_show_form(
+                step_id="hub", data_schema=hub_option_form(save_delay)
+            )
+        return self.async_create_entry(data=user_input)
@@ -5,6 +5,16 @@ from logging import Logger, getLogger
 from homeassistant.const import Platform
 
 STORAGE_KEY = "simple_plant_data"
+JOURNAL_STORAGE_KEY = "simple_plant_journal"
+# Watering days kept per plant, older days only count in interval statistics
+JOURNAL_MAX_ENTRIES = 366
+JOURNAL_HORIZON_DAYS = 730
+
+# Seconds to wait before flushing pending changes to storage (0 = write-through),
+# the default of the hub `save_delay` option
+STORAGE_SAVE_DELAY = 10
+CONF_SAVE_DELAY = "save_delay"
+STORAGE_SAVE_DELAY_MAX = 300
 
 LOGGER: Logger = getLogger(__package__)
 
@@ -14,6 +24,19 @@ STORAGE_DIR = "simple_plant"
 
 MANUFACTURER = "Simple Plant"
 
+# Config entry managing many plants, stored as subentries
+CONF_HUB = "hub"
+SUBENTRY_TYPE_PLANT = "plant"
+# Fold the existing plant entries into the hub on its first setup
+CONF_IMPORT_PLANTS = "import_plants"
+# Stable id of a plant, keying its storage, entities and device
+CONF_PLANT_ID = "plant_id"
+# Set on plant entries being folded into a hub, to keep their data
+CONF_FOLDED_INTO = "folded_into"
+
+# Seconds to wait for a burst of device renames to settle
+RENAME_COOLDOWN = 1.0
+
 HEALTH_OPTIONS = [
     "notset",
     "poor",
@@ -34,12 +57,48 @@ IMAGES_MIME_TYPES = {
     ".svg": "image/svg+xml",
 }
 
+# Bytes read to detect the type of an uploaded image
+IMAGE_SNIFF_SIZE = 1024
+# Buffer size used when an uploaded image must be copied
+IMAGE_COPY_CHUNK_SIZE = 1024 * 1024
+
+# Seconds an unreferenced photo is kept, so that flows can create their entry
+PHOTO_GC_GRACE_PERIOD = 3600
+
+# Longest side, in pixels, of each image variant (None = original size)
+IMAGE_VARIANTS: dict[str, int | None] = {
+    "thumbnail": 256,
+    "card": 768,
+    "full": None,
+}
+IMAGE_DEFAULT_VARIANT = "card"
+IMAGE_VARIANT_FORMAT = "webp"
+IMAGE_VARIANT_QUALITY = 80
+# Size, in bytes, of the in-memory cache of image variants
+IMAGE_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+# Watering interval estimator: latest intervals used, and weight decay per
+# older interval, so that the estimate follows seasons
+ESTIMATOR_WINDOW = 8
+ESTIMATOR_DECAY = 0.8
+# Intervals needed to suggest one, and confidence needed to apply it
+ESTIMATOR_MIN_SAMPLES = 2
+ESTIMATOR_MIN_CONFIDENCE = 0.6
+# Hour of the nightly estimation
+ESTIMATOR_HOUR = 3
+# Bounds of the days between waterings
+DAYS_BETWEEN_WATERINGS_MIN = 1
+DAYS_BETWEEN_WATERINGS_MAX = 60
+
 PLATFORMS: list[Platform] = [
     Platform.BUTTON,
     Platform.BINARY_SENSOR,
+    Platform.CALENDAR,
     Platform.DATE,
     Platform.IMAGE,
     Platform.NUMBER,
     Platform.SELECT,
     Platform.SENSOR,
+    Platform.SWITCH,
+    Platform.TODO,
 ]
@@ -2,65 +2,235 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
+from homeassistant.core import callback
 from homeassistant.exceptions import ServiceValidationError
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import slugify
-from homeassistant.util.dt import as_local, as_utc, utcnow
+from homeassistant.util.dt import (
+    as_local,
+    as_utc,
+    now,
+    start_of_local_day,
+    utcnow,
+)
 
-from .const import DOMAIN, LOGGER, MANUFACTURER
+from .const import (
+    CONF_HUB,
+    CONF_PLANT_ID,
+    DOMAIN,
+    LOGGER,
+    MANUFACTURER,
+    SUBENTRY_TYPE_PLANT,
+)
 from .data import SimplePlantStore
+from .journal import SimplePlantJournalStore
+from .scheduler import SimplePlantScheduler
+from .stats import LatencyHistogram
 
 if TYPE_CHECKING:
-    from homeassistant.config_entries import ConfigEntry
-    from homeassistant.core import HomeAssistant
+    from collections.abc import Callable, Mapping
 
+    from homeassistant.config_entries import ConfigEntry, ConfigSubentry
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
 
-class SimplePlantCoordinator(DataUpdateCoordinator[dict]):
-    """Class to manage fetching Simple Plant data."""
 
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
-        """Initialize the coordinator."""
-        super().__init__(
-            hass,
-            LOGGER,
-            name=DOMAIN,
+@dataclass(frozen=True, slots=True)
+class SimplePlantStatus:
+    """
+    Watering status of a plant, derived from stored data.
+
+    Whether the plant is due or late is computed against the current day
+    when read, so a status stays valid across midnight.
+    """
+
+    last_watered: date
+    next_watering: date
+    # Whole days between waterings, to project the next ones
+    interval: int
+
+    @property
+    def due(self) -> bool:
+        """Return True from the next watering day."""
+        return now().date() >= self.next_watering
+
+    @property
+    def late(self) -> bool:
+        """Return True once the next watering day has passed."""
+        return now().date() > self.next_watering
+
+
+class SimplePlant:
+    """A plant, managed by the coordinator of its config entry."""
+
+    def __init__(
+        self,
+        coordinator: SimplePlantCoordinator,
+        title: str,
+        config: Mapping[str, Any],
+        subentry_id: str | None = None,
+    ) -> None:
+        """Initialize the plant."""
+        self.coordinator = coordinator
+        self.hass = coordinator.hass
+        self.store = coordinator.store
+        self.title = title
+        # Data of the config entry, or of the subentry in a hub
+        self.config = config
+        self.subentry_id = subentry_id
+        # Stable id, keying storage, entities and device. Entity ids use the
+        # slug of the name, they are migrated when the plant is renamed.
+        self.plant_id: str = config.get(
+            CONF_PLANT_ID, subentry_id or coordinator.config_entry.entry_id
         )
-        self.device = slugify(entry.title)
-        self.store = SimplePlantStore(hass)
-        self.config_entry = entry
+        self.device = slugify(title)
+        self.data: dict[str, Any] = {}
+        self.status: SimplePlantStatus | None = None
 
         # Set up device info
-        name = entry.title[0].upper() + entry.title[1:]
+        name = title[0].upper() + title[1:]
         self.device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"{DOMAIN}_{self.device}")},
+            identifiers={(DOMAIN, self.plant_id)},
             name=name,
             manufacturer=MANUFACTURER,
-            model=entry.data.get("species"),
+            model=config.get("species"),
         )
 
-    async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data from storage."""
-        await self.store.async_load()
-        return await self.store.async_get_data(self.device)
+    def _compute_status(self, data: dict[str, Any]) -> SimplePlantStatus | None:
+        """Compute the watering status from stored data."""
+        last_watered: date | None = data.get("last_watered")
+        if last_watered is None and self.config.get("last_watered"):
+            last_watered = as_local(
+                datetime.fromisoformat(self.config["last_watered"])
+            ).date()
+        nb_days = data.get(
+            "days_between_waterings", self.config.get("days_between_waterings")
+        )
+        if last_watered is None or nb_days is None:
+            LOGGER.warning("%s: Couldn't compute watering status", self.device)
+            return None
+        return SimplePlantStatus(
+            last_watered=last_watered,
+            next_watering=last_watered + timedelta(days=float(nb_days)),
+            interval=max(round(float(nb_days)), 1),
+        )
+
+    @callback
+    def async_refresh_status(self) -> bool:
+        """
+        Notify the entities of a plant becoming due or late on day change.
+
+        Return True if the plant has a status, so entities had something to
+        compare their value with.
+        """
+        self.status = self._compute_status(self.data)
+        self.coordinator.async_update_plant_listeners(self)
+        return self.status is not None
+
+    def set_data(self, data: dict[str, Any]) -> None:
+        """Set stored data and derive the watering status from it."""
+        self.data = data
+        self.status = self._compute_status(data)
+        self.coordinator.scheduler.async_update_plant(
+            self, self.status.next_watering if self.status else None
+        )
+
+    @callback
+    def async_publish(self) -> None:
+        """
+        Publish the stored data of the plant, and notify its entities only.
+
+        Writes are applied to the in-memory data of the store, so the plant
+        follows them without reading the file back.
+        """
+        start = time.perf_counter()
+        self.set_data(self.store.get_data(self.plant_id))
+        if self.coordinator.data is not None:
+            self.coordinator.data[self.plant_id] = self.data
+        self.coordinator.async_update_plant_listeners(self)
+        self.coordinator.refresh_latency.observe(time.perf_counter() - start)
 
     async def remove_device_from_storage(self) -> None:
         """Remove entry in storage."""
-        await self.store.async_remove_device(self.device)
-        await self.async_refresh()
+        await self.store.async_remove_device(self.plant_id)
+        await self.coordinator.journal.async_remove(self.plant_id)
 
-    async def async_store_value(self, entity_id: str, value: str) -> None:
+    async def async_store_value(self, key: str, value: Any) -> None:
         """Store value in the store."""
-        await self.store.async_save_data(self.device, {entity_id: value})
-        await self.async_refresh()
+        await self.store.async_save_data(self.plant_id, {key: value})
+        self.async_publish()
 
-    async def async_rename_device(self, new_id: str) -> None:
-        """Migrate data for a device to another name."""
-        await self.store.async_rename_device(self.device, new_id)
-        await self.async_refresh()
+    @callback
+    def async_update_config(self, config: Mapping[str, Any]) -> None:
+        """Follow a reconfigured species or photo, without reloading."""
+        self.config = config
+        self.device_info["model"] = config.get("species")
+        device_registry = dr.async_get(self.hass)
+        device = device_registry.async_get_device(identifiers={(DOMAIN, self.plant_id)})
+        if device is not None:
+            device_registry.async_update_device(device.id, model=config.get("species"))
+        self.async_publish()
+
+    @callback
+    def async_rename(self, title: str) -> None:
+        """
+        Rename the plant in place.
+
+        Storage is keyed by the plant id, so only the config entry, the device
+        name and the entity ids change. Entities are renamed through the entity
+        registry, which keeps their history, without reloading the platforms.
+        """
+        old_device = self.device
+        LOGGER.debug("Renaming plant %s to %s", self.title, title)
+        self.title = title
+        self.device = slugify(title)
+        name = title[0].upper() + title[1:]
+        self.device_info["name"] = name
+        # Update the config first, so the update listener has nothing to reload
+        self.config = {**self.config, "name": title, "name_by_user": title}
+        entry = self.coordinator.config_entry
+        if self.subentry_id is None:
+            self.hass.config_entries.async_update_entry(
+                entry, title=title, data=self.config
+            )
+        else:
+            self.hass.config_entries.async_update_subentry(
+                entry,
+                entry.subentries[self.subentry_id],
+                title=title,
+                data=self.config,
+                unique_id=self.device,
+            )
+
+        device_registry = dr.async_get(self.hass)
+        device = device_registry.async_get_device(identifiers={(DOMAIN, self.plant_id)})
+        if device is None:
+            return
+        device_registry.async_update_device(device.id, name=name)
+        entity_registry = er.async_get(self.hass)
+        suffix = f"_{old_device}"
+        for entity in er.async_entries_for_device(
+            entity_registry, device.id, include_disabled_entities=True
+        ):
+            if not entity.entity_id.endswith(suffix):
+                # Renamed by the user
+                continue
+            new_entity_id = f"{entity.entity_id[: -len(suffix)]}_{self.device}"
+            if entity_registry.async_is_registered(new_entity_id):
+                LOGGER.warning(
+                    "Can't rename %s, %s exists", entity.entity_id, new_entity_id
+                )
+                continue
+            entity_registry.async_update_entity(
+                entity.entity_id, new_entity_id=new_entity_id
+            )
 
     async def async_set_last_watered(self, value: datetime) -> None:
         """Change last watered date manually."""
@@ -72,80 +242,237 @@ class SimplePlantCoordinator(DataUpdateCoordinator[dict]):
                 translation_placeholders={},
             )
         await self.store.async_save_data(
-            self.device, {"last_watered": new_value.isoformat()}
+            self.plant_id, self.mark_as_watered_data(new_value)
         )
-        await self.async_refresh()
+        self.async_publish()
 
-    async def async_mark_as_watered_toggle(self) -> None:
-        """Toggle last watered between old value and today."""
-        data = await self.store.async_get_data(self.device)
-        if data is None:
-            LOGGER.warning("%s: No data found in storage", self.device)
-            return
-
-        last_watered = None
-        old_last_watered = None
-        if "last_watered" in data:
-            last_watered = as_utc(
-                as_local(datetime.fromisoformat(data["last_watered"]))
-            )
-        if "_old_last_watered" in data:
-            old_last_watered = as_utc(
-                as_local(datetime.fromisoformat(data["_old_last_watered"]))
-            )
+    def mark_as_watered_data(self, value: datetime) -> dict[str, date]:
+        """Return data marking the plant as watered at `value`."""
+        return {"last_watered": as_local(value).date()}
 
-        if last_watered and as_local(last_watered).date() != as_local(utcnow()).date():
-            await self.async_action_mark_as_watered(save_old=last_watered)
-        else:
-            await self.async_action_cancel_mark_as_watered(old_value=old_last_watered)
+    def journal_entry(self, value: datetime) -> tuple[str, date, date | None]:
+        """Return the journal entry of a watering at `value`."""
+        previous = self.status.last_watered if self.status is not None else None
+        return self.plant_id, as_local(value).date(), previous
 
-    async def async_action_cancel_mark_as_watered(
-        self, old_value: datetime | None = None
-    ) -> None:
-        """Update last watered date to old value."""
-        if old_value:
-            await self.async_set_last_watered(as_utc(old_value))
+    async def async_mark_as_watered_toggle(self) -> None:
+        """Mark the plant as watered today, or undo it if it already is."""
+        if (
+            self.data.get("last_watered") == now().date()
+            and await self._async_can_undo()
+        ):
+            await self.async_undo_watering()
         else:
             await self.async_action_mark_as_watered()
 
-    async def async_action_mark_as_watered(
-        self, save_old: datetime | None = None
-    ) -> None:
-        """Update last watered date today."""
-        today = utcnow()
-        if save_old:
-            await self.store.async_save_data(
-                self.device, {"_old_last_watered": as_utc(save_old).isoformat()}
+    async def async_action_mark_as_watered(self, value: datetime | None = None) -> None:
+        """Mark the plant as watered at `value`, today if not set."""
+        value = value or utcnow()
+        await self.coordinator.journal.async_record([self.journal_entry(value)])
+        await self.async_set_last_watered(value)
+
+    async def _async_can_undo(self) -> bool:
+        """Return True if the last watered day was recorded, not set by hand."""
+        journal = await self.coordinator.journal.async_get(self.plant_id)
+        if journal.last is None:
+            return "_old_last_watered" in self.data
+        if self.status is None or journal.last != self.status.last_watered:
+            return False
+        # The day before the only one recorded may be known from before the
+        # journal existed, otherwise undoing would just forget the watering
+        return len(journal.days) > 1 or "_old_last_watered" in self.data
+
+    async def async_undo_watering(self) -> None:
+        """Restore the watering day before the latest one."""
+        if not await self._async_can_undo():
+            # Undoing would overwrite the day set by hand with an older one
+            LOGGER.debug("%s: Nothing to undo", self.device)
+            return
+        previous = await self.coordinator.journal.async_undo(self.plant_id)
+        if previous is not None:
+            await self.async_set_last_watered(start_of_local_day(previous))
+        elif "_old_last_watered" in self.data:
+            # Undo value saved before the journal existed
+            await self.async_set_last_watered(
+                start_of_local_day(self.data["_old_last_watered"])
             )
-        await self.async_set_last_watered(today)
 
-    def get_dates(self) -> dict[str, datetime] | None:
-        """Get dates from relevants device entites states."""
-        states_to_get = {
-            "last_watered": f"date.{DOMAIN}_last_watered_{self.device}",
-            "nb_days": f"number.{DOMAIN}_days_between_waterings_{self.device}",
+
+class SimplePlantCoordinator(DataUpdateCoordinator[dict[str, dict[str, Any]]]):
+    """
+    Class to manage fetching Simple Plant data.
+
+    There is one coordinator per config entry: it manages a single plant, or
+    every plant of a hub. Entities subscribe with their plant id as
+    context, so that a plant change only notifies the entities of that plant.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            LOGGER,
+            name=DOMAIN,
+        )
+        self.store = SimplePlantStore(hass)
+        self.journal = SimplePlantJournalStore(hass)
+        self.scheduler = SimplePlantScheduler(hass)
+        self.config_entry = entry
+        self.hub = is_hub(entry)
+        self._plant_listeners: dict[Any, set[CALLBACK_TYPE]] = {}
+        self._plant_added_listeners: set[Callable[[SimplePlant], None]] = set()
+        # Refreshes of the whole entry, or of a single plant
+        self.refresh_latency = LatencyHistogram()
+        # Seconds to set up the entry, platforms included
+        self.setup_duration = 0.0
+
+        plants = (
+            [
+                SimplePlant(self, subentry.title, subentry.data, subentry_id)
+                for subentry_id, subentry in entry.subentries.items()
+                if subentry.subentry_type == SUBENTRY_TYPE_PLANT
+            ]
+            if self.hub
+            else [SimplePlant(self, entry.title, entry.data)]
+        )
+        self.plants: dict[str, SimplePlant] = {
+            plant.plant_id: plant for plant in plants
         }
 
-        # Get states from hass
-        data = {key: self.hass.states.get(eid) for key, eid in states_to_get.items()}
+        # Device of the hub itself, holding its diagnostic entities
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=entry.title,
+            manufacturer=MANUFACTURER,
+            entry_type=DeviceEntryType.SERVICE,
+        )
+
+    async def _async_update_data(self) -> dict[str, dict[str, Any]]:
+        """Get the plants' slices of the (once loaded) storage."""
+        start = time.perf_counter()
+        await self.store.async_ensure_loaded()
+        for plant in self.plants.values():
+            plant.set_data(self.store.get_data(plant.plant_id))
+        self.refresh_latency.observe(time.perf_counter() - start)
+        return {plant_id: plant.data for plant_id, plant in self.plants.items()}
 
-        # Check if all states are available
-        if any(
-            data[key] is None
-            or not data[key].state  # type: ignore noqa: PGH003
-            or data[key].state == "unavailable"  # type: ignore noqa: PGH003
-            for key in states_to_get
-        ):
-            LOGGER.warning("%s: Couldn't get all states", self.device)
-            return None
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates, indexed by plant id context."""
+        remove = super().async_add_listener(update_callback, context)
+        listeners = self._plant_listeners.setdefault(context, set())
+        listeners.add(update_callback)
 
-        states = {key: data.state for key, data in data.items() if data is not None}
+        @callback
+        def remove_listener() -> None:
+            """Remove update listener."""
+            remove()
+            listeners.discard(update_callback)
 
-        last_watered_date = datetime.fromisoformat(states["last_watered"])
-        nb_days = float(states["nb_days"])
+        return remove_listener
+
+    @property
+    def listener_counts(self) -> dict[str, int]:
+        """Return the number of entities listening to each plant."""
+        return {
+            plant_id: len(self._plant_listeners.get(plant_id, ()))
+            for plant_id in self.plants
+        }
 
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return refresh and listener counters."""
         return {
-            "last_watered": last_watered_date,
-            "next_watering": last_watered_date + timedelta(days=nb_days),
-            "today": utcnow(),
+            "plants": len(self.plants),
+            "setup_duration": self.setup_duration,
+            "refresh_latency": self.refresh_latency.as_dict(),
+            "listeners": sum(self.listener_counts.values()),
         }
+
+    def plant_configs(
+        self, entry: ConfigEntry
+    ) -> dict[str | None, ConfigEntry | ConfigSubentry]:
+        """Return the config of every plant of `entry`, by subentry id."""
+        if not self.hub:
+            return {None: entry}
+        return {
+            subentry_id: subentry
+            for subentry_id, subentry in entry.subentries.items()
+            if subentry.subentry_type == SUBENTRY_TYPE_PLANT
+        }
+
+    @callback
+    def async_listen_plants(
+        self, plant_callback: Callable[[SimplePlant], None]
+    ) -> CALLBACK_TYPE:
+        """Listen for plants added to the entry, to add their entities."""
+        self._plant_added_listeners.add(plant_callback)
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the listener."""
+            self._plant_added_listeners.discard(plant_callback)
+
+        return remove_listener
+
+    @callback
+    def async_add_plant(self, subentry: ConfigSubentry) -> SimplePlant:
+        """Add the plant of a new subentry, and its entities."""
+        plant = SimplePlant(self, subentry.title, subentry.data, subentry.subentry_id)
+        self.plants[plant.plant_id] = plant
+        plant.set_data(self.store.get_data(plant.plant_id))
+        if self.data is not None:
+            self.data[plant.plant_id] = plant.data
+        # Create the device first, so it can be indexed right away
+        dr.async_get(self.hass).async_get_or_create(
+            config_entry_id=self.config_entry.entry_id,
+            config_subentry_id=plant.subentry_id,
+            **plant.device_info,
+        )
+        for plant_callback in list(self._plant_added_listeners):
+            plant_callback(plant)
+        # Entities of the whole entry, like the hub calendar
+        self.async_update_plant_listeners(plant)
+        return plant
+
+    @callback
+    def async_remove_plant(self, plant: SimplePlant) -> None:
+        """Forget the plant of a removed subentry, its entities go with it."""
+        del self.plants[plant.plant_id]
+        if self.data is not None:
+            self.data.pop(plant.plant_id, None)
+        self.scheduler.async_remove_plant(plant)
+        self.async_update_plant_listeners(plant)
+
+    def get_plant(self, subentry_id: str | None) -> SimplePlant | None:
+        """Get the plant of a subentry, or the plant of a single plant entry."""
+        if not self.hub:
+            return next(iter(self.plants.values()), None)
+        return next(
+            (
+                plant
+                for plant in self.plants.values()
+                if plant.subentry_id == subentry_id
+            ),
+            None,
+        )
+
+    @callback
+    def async_update_plant_listeners(self, plant: SimplePlant) -> None:
+        """Notify the entities of a single plant, and of the whole entry."""
+        for update_callback in list(self._plant_listeners.get(plant.plant_id, ())):
+            update_callback()
+        for update_callback in list(self._plant_listeners.get(None, ())):
+            update_callback()
+
+    async def remove_devices_from_storage(self) -> None:
+        """Remove every plant of the entry from storage."""
+        for plant in self.plants.values():
+            await plant.remove_device_from_storage()
+
+
+def is_hub(entry: ConfigEntry) -> bool:
+    """Return True if the config entry is a hub of plants."""
+    return bool(entry.data.get(CONF_HUB))
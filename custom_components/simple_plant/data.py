@@ -1,20 +1,173 @@
 """Storage helper for simple_plant."""
 
+import asyncio
+import time
+from datetime import date, datetime
+from functools import partial
+from pathlib import Path
 from typing import Any, ClassVar
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.storage import Store
+from homeassistant.util.dt import as_local
 
-from .const import LOGGER, STORAGE_KEY
+from .const import DOMAIN, LOGGER, STORAGE_KEY, STORAGE_SAVE_DELAY
+from .stats import LatencyHistogram
 
-STORAGE_VERSION = 1
+STORAGE_VERSION = 2
+
+# Short names of plant fields on disk, from STORAGE_VERSION 2
+STORAGE_FIELDS = {
+    "last_watered": "w",
+    "days_between_waterings": "i",
+    "health": "h",
+    "auto_interval": "a",
+    "_old_last_watered": "u",
+}
+FIELD_NAMES = {short: field for field, short in STORAGE_FIELDS.items()}
+# Fields stored as day ordinals, and as numbers
+DATE_FIELDS = frozenset({"w", "u"})
+NUMBER_FIELDS = frozenset({"i"})
+
+STORAGE_BACKEND_SINGLE = "single"
+STORAGE_BACKEND_SHARDED = "sharded"
+STORAGE_BACKENDS = [STORAGE_BACKEND_SINGLE, STORAGE_BACKEND_SHARDED]
+
+
+def encode_plant(data: dict[str, Any]) -> dict[str, Any]:
+    """Return the stored form of plant data: short names, days as ordinals."""
+    stored = {}
+    for field, value in data.items():
+        if isinstance(value, date):
+            stored[STORAGE_FIELDS.get(field, field)] = value.toordinal()
+        elif isinstance(value, float) and value.is_integer():
+            stored[STORAGE_FIELDS.get(field, field)] = int(value)
+        else:
+            stored[STORAGE_FIELDS.get(field, field)] = value
+    return stored
+
+
+def decode_plant(stored: dict[str, Any]) -> dict[str, Any]:
+    """Return plant data from its stored form."""
+    data = {}
+    for short, value in stored.items():
+        if short in DATE_FIELDS:
+            data[FIELD_NAMES[short]] = date.fromordinal(value)
+        elif short in NUMBER_FIELDS:
+            data[FIELD_NAMES[short]] = float(value)
+        else:
+            data[FIELD_NAMES.get(short, short)] = value
+    return data
+
+
+def _migrate_value_v1(short: str, value: Any) -> Any:
+    """Return the STORAGE_VERSION 2 form of a field value."""
+    if short in DATE_FIELDS:
+        return as_local(datetime.fromisoformat(value)).date().toordinal()
+    if short in NUMBER_FIELDS:
+        number = float(value)
+        return int(number) if number.is_integer() else number
+    return value
+
+
+def migrate_plant_v1(device: str, data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Return the STORAGE_VERSION 2 form of plant data.
+
+    Version 1 stored UTC timestamps and numbers as strings, and values of
+    plants keyed by name under entity unique ids (`simple_plant_<key>_<device>`).
+    """
+    prefix = f"{DOMAIN}_"
+    suffix = f"_{device}"
+    stored = {}
+    for key, value in data.items():
+        field = key
+        if key.startswith(prefix) and key.endswith(suffix):
+            field = key[len(prefix) : -len(suffix)]
+        short = STORAGE_FIELDS.get(field, field)
+        try:
+            stored[short] = _migrate_value_v1(short, value)
+        except (TypeError, ValueError):
+            LOGGER.warning("%s: Dropping invalid %s %s", device, field, value)
+    return stored
+
+
+class SimplePlantLoopStore(Store[dict[str, Any]]):
+    """Storage file building the data of delayed saves in the event loop."""
+
+    async def _async_write_data(self, path: str, data: dict) -> None:
+        """Build the data to write, then write it in the executor."""
+        if "data_func" in data:
+            # Home Assistant would call it from the executor, while the event
+            # loop keeps changing what it reads
+            data["data"] = data.pop("data_func")()
+        await super()._async_write_data(path, data)
+
+
+class SimplePlantStorageFile(SimplePlantLoopStore):
+    """Storage file recording its write latency and size."""
+
+    def __init__(
+        self, owner: "SimplePlantStore", key: str, device: str | None = None
+    ) -> None:
+        """Initialize the storage file, of a single plant if `device` is set."""
+        super().__init__(owner.hass, STORAGE_VERSION, key)
+        self._owner = owner
+        self._device = device
+        self._written = 0
+
+    async def _async_migrate_func(
+        self,
+        old_major_version: int,
+        _old_minor_version: int,
+        old_data: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Migrate data written by an older version, before it is decoded."""
+        if old_major_version >= 2 or self.key == f"{STORAGE_KEY}.manifest":  # noqa: PLR2004
+            return old_data
+        LOGGER.info("Migrating %s to version %s", self.key, STORAGE_VERSION)
+        if self._device is not None:
+            return migrate_plant_v1(self._device, old_data)
+        return {
+            device: migrate_plant_v1(device, data) for device, data in old_data.items()
+        }
+
+    def _write_data(self, path: str, data: dict) -> None:
+        """Write the data, in the executor."""
+        super()._write_data(path, data)
+        self._written = Path(path).stat().st_size
+
+    async def _async_write_data(self, path: str, data: dict) -> None:
+        """Write the data and count it."""
+        start = time.perf_counter()
+        self._written = 0
+        await super()._async_write_data(path, data)
+        self._owner.save_latency.observe(time.perf_counter() - start)
+        self._owner.bytes_written += self._written
 
 
 class SimplePlantStore:
     """
     Class to hold simple_plant storage hanlders.
 
-    The goal of such a class it to provide helpers to allow state persistance
+    The goal of such a class it to provide helpers to allow state persistance.
+    Writes are write-behind: changes are applied in memory, the plant is marked
+    dirty and a single physical write is scheduled `save_delay` seconds later,
+    folding every logical write made in the meantime.
+
+    The file is read once per startup and shared by every plant.
+
+    Plants are kept in memory with native values, and stored with short field
+    names, days as ordinals and numbers as numbers (STORAGE_VERSION 2): files
+    of older versions are migrated as they are loaded, and rewritten with the
+    next change.
+
+    Two backends are supported:
+    - single: every plant in the `simple_plant_data` file
+    - sharded: one `simple_plant_data.<plant id>` file per plant, listed by the
+      `simple_plant_data.manifest` file. A plant change only rewrites its own
+      shard; the manifest is only rewritten when plants are added, renamed or
+      removed, after the shards it points to have been written.
     """
 
     _instance: ClassVar["SimplePlantStore | None"] = None
@@ -30,65 +183,293 @@ class SimplePlantStore:
         """Initialize the storage."""
         if not self._initialized:
             LOGGER.debug("Initializing storage %s", STORAGE_KEY)
-            self.store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+            self.hass = hass
+            self.store = SimplePlantStorageFile(self, STORAGE_KEY)
+            self.manifest = SimplePlantStorageFile(self, f"{STORAGE_KEY}.manifest")
+            self.sharded = False
+            self._shards: dict[str, SimplePlantStorageFile] = {}
             self._data: dict[str, Any] | None = None
+            self._load_lock = asyncio.Lock()
+            self.load_count = 0
+            self.last_load_duration = 0.0
+            self.save_delay: float = STORAGE_SAVE_DELAY
+            # Write-behind bookkeeping: pending logical writes per device
+            self._pending: dict[str, int] = {}
+            self.logical_writes = 0
+            self.physical_writes = 0
+            self.last_coalesced_writes = 0
+            self.bytes_written = 0
+            self.save_latency = LatencyHistogram()
             self._initialized = True
 
+    @property
+    def backend(self) -> str:
+        """Return the storage backend in use."""
+        return STORAGE_BACKEND_SHARDED if self.sharded else STORAGE_BACKEND_SINGLE
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return load and write counters."""
+        return {
+            "backend": self.backend,
+            "load_count": self.load_count,
+            "last_load_duration": self.last_load_duration,
+            "logical_writes": self.logical_writes,
+            "physical_writes": self.physical_writes,
+            "pending_writes": sum(self._pending.values()),
+            "last_coalesced_writes": self.last_coalesced_writes,
+            "bytes_written": self.bytes_written,
+            "save_latency": self.save_latency.as_dict(),
+        }
+
+    def _shard(self, device: str) -> SimplePlantStorageFile:
+        """Get the store of a plant shard."""
+        if device not in self._shards:
+            self._shards[device] = SimplePlantStorageFile(
+                self, f"{STORAGE_KEY}.{device}", device
+            )
+        return self._shards[device]
+
     async def async_load(self) -> None:
-        """Load the data from storage."""
-        self._data = await self.store.async_load() or {}
+        """(Re)load the data from storage."""
+        # Write changes still waiting for their delayed save first, rather
+        # than reading the file back without them
+        await self.async_flush()
+        start = time.perf_counter()
+        manifest = await self.manifest.async_load()
+        self.sharded = manifest is not None
+        if manifest is not None:
+            devices: list[str] = manifest.get("plants", [])
+            shards = await asyncio.gather(
+                *(self._shard(device).async_load() for device in devices)
+            )
+            self._data = {
+                device: decode_plant(shard or {})
+                for device, shard in zip(devices, shards, strict=True)
+            }
+        else:
+            data = await self.store.async_load() or {}
+            self._data = {device: decode_plant(plant) for device, plant in data.items()}
+        self.last_load_duration = time.perf_counter() - start
+        self.load_count += 1
+        LOGGER.debug(
+            "Loaded %s storage (%s plants) in %.3fs",
+            self.backend,
+            len(self._data),
+            self.last_load_duration,
+        )
+
+    async def async_ensure_loaded(self) -> None:
+        """Load the data from storage unless it is already in memory."""
+        if self._data is not None:
+            return
+        async with self._load_lock:
+            # Concurrent entry setups wait for the first read instead of
+            # issuing their own
+            if self._data is None:
+                await self.async_load()
 
     async def async_get_data(self, device: str) -> dict[str, Any]:
         """Get data from storage."""
-        if self._data is None:
-            await self.async_load()
+        await self.async_ensure_loaded()
         if self._data is None:  # for linting
             LOGGER.error("Failed to load data from storage")
             return {}
-        return self._data.get(device, {})
+        return self.get_data(device)
+
+    @callback
+    def get_data(self, device: str) -> dict[str, Any]:
+        """Get data of the loaded storage, with the writes made since."""
+        return (self._data or {}).get(device, {})
 
     async def async_save_data(self, device: str, data: dict) -> None:
         """Save data to storage."""
-        if self._data is None:
-            await self.async_load()
+        await self.async_ensure_loaded()
         if self._data is None:  # for linting
             LOGGER.error("Failed to load data from storage")
             return
+        new_device = device not in self._data
         device_data = self._data.get(device, {})
+        if not new_device and data.items() <= device_data.items():
+            # Unchanged, as when entities restore their value: nothing to write
+            return
         # update data
         device_data.update(data)
         self._data[device] = device_data
         # store data
         LOGGER.debug("Storing following data to device %s : %s", device, data)
-        await self.store.async_save(self._data)
+        if self.sharded and new_device:
+            # The shard must exist before the manifest points to it
+            await self._shard(device).async_save(encode_plant(device_data))
+            await self._async_save_manifest()
+            return
+        await self._async_schedule_save(device)
+
+    async def async_save_batch(self, updates: dict[str, dict]) -> None:
+        """Save data of several devices at once."""
+        await self.async_ensure_loaded()
+        if self._data is None:  # for linting
+            LOGGER.error("Failed to load data from storage")
+            return
+        updates = {
+            device: data
+            for device, data in updates.items()
+            if device not in self._data
+            or not data.items() <= self._data[device].items()
+        }
+        if not updates:
+            return
+        new_devices = [device for device in updates if device not in self._data]
+        for device, data in updates.items():
+            self._data.setdefault(device, {}).update(data)
+        LOGGER.debug("Storing data of %s devices", len(updates))
+        if self.sharded and new_devices:
+            await asyncio.gather(
+                *(
+                    self._shard(device).async_save(encode_plant(self._data[device]))
+                    for device in new_devices
+                )
+            )
+            await self._async_save_manifest()
+        for device in updates:
+            if not (self.sharded and device in new_devices):
+                self._mark_dirty(device)
+        await self._async_schedule_saves()
 
     async def async_remove_device(self, device: str) -> None:
         """Remove device data from storage."""
-        if self._data is None:
-            await self.async_load()
+        await self.async_ensure_loaded()
         if self._data is None:  # for linting
             LOGGER.error("Failed to load data from storage")
             return
         if device in self._data:
             del self._data[device]
-            await self.store.async_save(self._data)
+            if not self.sharded:
+                await self._async_schedule_save(device)
+                return
+            self._pending.pop(device, None)
+            await self._async_save_manifest()
+            await self._shard(device).async_remove()
+            del self._shards[device]
 
-    async def async_rename_device(self, device: str, new_id: str) -> None:
-        """Migrate device data from old `device` name to `new_name`."""
-        if self._data is None:
-            await self.async_load()
+    async def async_migrate_device(self, device: str, plant_id: str) -> None:
+        """Move data stored under a plant's name to its stable `plant_id`."""
+        await self.async_ensure_loaded()
         if self._data is None:  # for linting
             LOGGER.error("Failed to load data from storage")
             return
-        if device in self._data:
-            device_data: dict[str, Any] = self._data.get(device, {})
-            new_data = {}
-            for key, value in device_data.items():
-                if device in key:
-                    striped_key = key[: -len(device)]
-                    new_data[striped_key + new_id] = value
-                else:
-                    new_data[key] = value
-            self._data[new_id] = new_data
-            del self._data[device]
-            await self.store.async_save(self._data)
+        if device in self._data and device != plant_id:
+            # Unique id keys were renamed when the file was migrated
+            new_data = self._data.pop(device)
+            self._data[plant_id] = new_data
+            if not self.sharded:
+                await self._async_schedule_save(plant_id)
+                return
+            self._pending.pop(device, None)
+            await self._shard(plant_id).async_save(encode_plant(new_data))
+            await self._async_save_manifest()
+            await self._shard(device).async_remove()
+            del self._shards[device]
+
+    async def async_set_backend(self, backend: str) -> None:
+        """Migrate every plant to the `backend` storage layout."""
+        await self.async_ensure_loaded()
+        if self._data is None:  # for linting
+            LOGGER.error("Failed to load data from storage")
+            return
+        if backend == self.backend:
+            return
+        LOGGER.info("Migrating storage from %s to %s", self.backend, backend)
+        await self.async_flush()
+        if backend == STORAGE_BACKEND_SHARDED:
+            await asyncio.gather(
+                *(
+                    self._shard(device).async_save(encode_plant(data))
+                    for device, data in self._data.items()
+                )
+            )
+            await self._async_save_manifest()
+            await self.store.async_remove()
+            self.sharded = True
+        else:
+            await self.store.async_save(self._encode())
+            await self.manifest.async_remove()
+            await asyncio.gather(
+                *(shard.async_remove() for shard in self._shards.values())
+            )
+            self._shards.clear()
+            self.sharded = False
+
+    async def async_flush(self) -> None:
+        """Write pending changes to disk now."""
+        if self._data is None or not self._pending:
+            return
+        if not self.sharded:
+            await self.store.async_save(self._data_to_save())
+            return
+        await asyncio.gather(
+            *(
+                self._shard(device).async_save(self._shard_to_save(device))
+                for device in list(self._pending)
+            )
+        )
+
+    async def _async_save_manifest(self) -> None:
+        """Atomically write the list of plant shards."""
+        await self.manifest.async_save({"plants": sorted(self._data or {})})
+
+    async def _async_schedule_save(self, device: str) -> None:
+        """Mark `device` as dirty and schedule a coalesced write."""
+        self._mark_dirty(device)
+        await self._async_schedule_saves()
+
+    def _mark_dirty(self, device: str) -> None:
+        """Count a logical write of `device`."""
+        self._pending[device] = self._pending.get(device, 0) + 1
+        self.logical_writes += 1
+
+    async def _async_schedule_saves(self) -> None:
+        """Schedule a coalesced write of every dirty device."""
+        if not self._pending:
+            return
+        if self.save_delay <= 0:
+            await self.async_flush()
+            return
+        if not self.sharded:
+            self.store.async_delay_save(self._data_to_save, self.save_delay)
+            return
+        for device in self._pending:
+            self._shard(device).async_delay_save(
+                partial(self._shard_to_save, device), self.save_delay
+            )
+
+    def _encode(self) -> dict[str, Any]:
+        """Return the stored form of every plant."""
+        return {
+            device: encode_plant(data) for device, data in (self._data or {}).items()
+        }
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return data to write, called once per physical write."""
+        self.physical_writes += 1
+        self.last_coalesced_writes = sum(self._pending.values())
+        LOGGER.debug(
+            "Writing storage: %s write(s) coalesced for %s",
+            self.last_coalesced_writes,
+            ", ".join(sorted(self._pending)),
+        )
+        self._pending.clear()
+        return self._encode()
+
+    @callback
+    def _shard_to_save(self, device: str) -> dict[str, Any]:
+        """Return the shard data to write, called once per physical write."""
+        self.physical_writes += 1
+        self.last_coalesced_writes = self._pending.pop(device, 0)
+        LOGGER.debug(
+            "Writing storage shard %s: %s write(s) coalesced",
+            device,
+            self.last_coalesced_writes,
+        )
+        return encode_plant((self._data or {}).get(device, {}))
@@ -9,6 +9,7 @@ from homeassistant.components.date import (
     DateEntity,
     DateEntityDescription,
 )
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util.dt import as_local, as_utc
 
@@ -20,6 +21,8 @@ if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+    from .coordinator import SimplePlant
+
 
 ENTITY_DESCRIPTIONS = (
     DateEntityDescription(
@@ -36,10 +39,23 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the date platform."""
-    async_add_entities(
-        SimplePlantDate(hass, entry, entity_description)
-        for entity_description in ENTITY_DESCRIPTIONS
-    )
+    coordinator: SimplePlantCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    @callback
+    def async_add_plant(plant: SimplePlant) -> None:
+        """Add the entities of a plant."""
+        async_add_entities(
+            (
+                SimplePlantDate(plant, entity_description)
+                for entity_description in ENTITY_DESCRIPTIONS
+            ),
+            config_subentry_id=plant.subentry_id,
+        )
+
+    for plant in coordinator.plants.values():
+        async_add_plant(plant)
+    # Plants of subentries added later, without reloading the entry
+    entry.async_on_unload(coordinator.async_listen_plants(async_add_plant))
 
 
 class SimplePlantDate(CoordinatorEntity[SimplePlantCoordinator], DateEntity):
@@ -49,53 +65,39 @@ class SimplePlantDate(CoordinatorEntity[SimplePlantCoordinator], DateEntity):
 
     def __init__(
         self,
-        hass: HomeAssistant,
-        entry: ConfigEntry,
+        plant: SimplePlant,
         description: DateEntityDescription,
     ) -> None:
         """Initialize the date class."""
-        coordinator: SimplePlantCoordinator = hass.data[DOMAIN][entry.entry_id]
-        super().__init__(coordinator)
+        super().__init__(plant.coordinator, context=plant.plant_id)
+        self.plant = plant
         self.entity_description = description
 
-        device = self.coordinator.device
+        device = plant.device
 
         self._fallback_value = as_local(
-            datetime.fromisoformat(str(entry.data.get("last_watered")))
+            datetime.fromisoformat(str(plant.config.get("last_watered")))
         ).date()
 
         self.entity_id = f"date.{DOMAIN}_{description.key}_{device}"
-        self._attr_unique_id = f"{DOMAIN}_{description.key}_{device}"
+        self._attr_unique_id = f"{plant.plant_id}_{description.key}"
 
         # Set up device info
-        self._attr_device_info = self.coordinator.device_info
+        self._attr_device_info = plant.device_info
 
     @property
     def device(self) -> str | None:
         """Return the device name."""
-        return self.coordinator.device
-
-    async def async_added_to_hass(self) -> None:
-        """Run when entity is added to hass."""
-        await super().async_added_to_hass()
-        if not self.native_value:
-            await self.async_set_value(self._fallback_value)
+        return self.plant.device
 
     async def async_set_value(self, value: date) -> None:
         """Change the date."""
         # Validate the date is not in the future
         dt = datetime.combine(value, datetime.min.time())
         new_val = as_utc(as_local(dt))
-        await self.coordinator.async_set_last_watered(new_val)
+        await self.plant.async_set_last_watered(new_val)
 
     @property
     def native_value(self) -> date | None:
-        """Return the date value."""
-        if not self.coordinator.data:
-            return None
-
-        date_str = self.coordinator.data.get("last_watered")
-        if not date_str:
-            return None
-
-        return as_local(datetime.fromisoformat(date_str)).date()
+        """Return the date value, the configured one until changed."""
+        return self.plant.data.get("last_watered", self._fallback_value)
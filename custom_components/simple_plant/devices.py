@@ -0,0 +1,136 @@
+"""Plant devices of simple_plant."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, ClassVar, Self
+
+from homeassistant.core import callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.device_registry import (
+    EVENT_DEVICE_REGISTRY_UPDATED,
+    EventDeviceRegistryUpdatedData,
+    async_get,
+)
+
+from .aggregates import SimplePlantAggregates
+from .const import DOMAIN, LOGGER, RENAME_COOLDOWN
+
+if TYPE_CHECKING:
+    from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant
+
+    from .coordinator import SimplePlant
+
+
+# Device changes renaming or regrouping a plant
+WATCHED_CHANGES = {"name_by_user", "area_id", "labels"}
+
+
+class SimplePlantDeviceIndex:
+    """
+    Class to rename and group plants after their device.
+
+    A single listener serves the whole domain. Device registry updates are
+    filtered against an index of plant device ids, so updates of other
+    integrations' devices only cost a set lookup. Renames are debounced: a
+    burst of updates renames each plant once, after its latest name.
+    """
+
+    _instance: ClassVar[SimplePlantDeviceIndex | None] = None
+    _initialized: bool = False
+
+    def __new__(cls, _hass: HomeAssistant) -> Self:
+        """Create a singleton instance."""
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        if not self._initialized:
+            self.hass = hass
+            # Device id -> plant
+            self._plants: dict[str, SimplePlant] = {}
+            self._pending: set[str] = set()
+            self._debouncer = Debouncer(
+                hass,
+                LOGGER,
+                cooldown=RENAME_COOLDOWN,
+                immediate=False,
+                function=self._async_rename_pending,
+            )
+            self._initialized = True
+
+    @callback
+    def async_listen(self) -> CALLBACK_TYPE:
+        """Listen for device renames and regroupings."""
+        unsub = self.hass.bus.async_listen(
+            EVENT_DEVICE_REGISTRY_UPDATED,
+            self._async_device_updated,
+            event_filter=self._async_filter,
+        )
+
+        @callback
+        def unsubscribe() -> None:
+            """Stop listening."""
+            unsub()
+            self._debouncer.async_shutdown()
+
+        return unsubscribe
+
+    @callback
+    def async_add_plant(self, plant: SimplePlant) -> None:
+        """Index the device of a plant."""
+        device = async_get(self.hass).async_get_device(
+            identifiers={(DOMAIN, plant.plant_id)}
+        )
+        if device is not None:
+            self._plants[device.id] = plant
+
+    @callback
+    def async_remove_plant(self, plant: SimplePlant) -> None:
+        """Remove the device of a plant from the index."""
+        for device_id, indexed in list(self._plants.items()):
+            if indexed is plant:
+                del self._plants[device_id]
+                self._pending.discard(device_id)
+
+    @callback
+    def _async_filter(self, event_data: EventDeviceRegistryUpdatedData) -> bool:
+        """Return True for renames and regroupings of plant devices."""
+        return (
+            event_data["action"] == "update"
+            and event_data["device_id"] in self._plants
+            and not WATCHED_CHANGES.isdisjoint(event_data["changes"])
+        )
+
+    @callback
+    def _async_device_updated(
+        self, event: Event[EventDeviceRegistryUpdatedData]
+    ) -> None:
+        """Queue the rename of a plant, or move it to its new groups."""
+        device_id = event.data["device_id"]
+        changes = event.data["changes"]
+        if "name_by_user" in changes:
+            self._pending.add(device_id)
+            self._debouncer.async_schedule_call()
+        if "area_id" in changes or "labels" in changes:
+            device = async_get(self.hass).async_get(device_id)
+            if device is not None:
+                SimplePlantAggregates(self.hass).async_regroup_plant(
+                    self._plants[device_id].plant_id, device
+                )
+
+    @callback
+    def _async_rename_pending(self) -> None:
+        """Rename plants after the latest name of their device."""
+        device_registry = async_get(self.hass)
+        pending = self._pending
+        self._pending = set()
+        for device_id in pending:
+            device = device_registry.async_get(device_id)
+            plant = self._plants.get(device_id)
+            if device is None or plant is None or device.name_by_user is None:
+                continue
+            if device.name_by_user in (plant.title, plant.device_info.get("name")):
+                continue
+            plant.async_rename(device.name_by_user)
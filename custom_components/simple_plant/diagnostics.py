@@ -0,0 +1,61 @@
+"""Diagnostics support for simple_plant."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from .aggregates import SimplePlantAggregates
+from .const import DOMAIN
+from .data import SimplePlantStore
+from .estimator import SimplePlantEstimator
+from .image_cache import SimplePlantImageCache
+from .journal import SimplePlantJournalStore
+from .photos import SimplePlantPhotoStore
+from .scheduler import SimplePlantScheduler
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+    from .coordinator import SimplePlantCoordinator
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: SimplePlantCoordinator = hass.data[DOMAIN][entry.entry_id]
+    listener_counts = coordinator.listener_counts
+    return {
+        "entry": {
+            "title": entry.title,
+            "data": dict(entry.data),
+            "hub": coordinator.hub,
+        },
+        "plants": {
+            plant_id: {
+                "title": plant.title,
+                "device": plant.device,
+                "config": dict(plant.config),
+                "data": plant.data,
+                "status": {
+                    "last_watered": plant.status.last_watered.isoformat(),
+                    "next_watering": plant.status.next_watering.isoformat(),
+                    "due": plant.status.due,
+                    "late": plant.status.late,
+                }
+                if plant.status
+                else None,
+                "listeners": listener_counts.get(plant_id, 0),
+            }
+            for plant_id, plant in coordinator.plants.items()
+        },
+        "coordinator": coordinator.stats,
+        "store": SimplePlantStore(hass).stats,
+        "journal": SimplePlantJournalStore(hass).stats,
+        "estimator": SimplePlantEstimator(hass).stats,
+        "scheduler": SimplePlantScheduler(hass).stats,
+        "aggregates": SimplePlantAggregates(hass).stats,
+        "image_cache": SimplePlantImageCache(hass).stats,
+        "photos": SimplePlantPhotoStore(hass).stats,
+    }
@@ -0,0 +1,45 @@
+"""Base entities for simple_plant."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+from homeassistant.helpers.entity import Entity
+
+if TYPE_CHECKING:
+    import asyncio
+
+
+class SimplePlantCoalescedEntity(Entity):
+    """
+    Entity summarizing many plants.
+
+    Its state is written once per event loop iteration however many plants
+    changed, so that watering every plant at once writes it once, and only
+    then: it is never polled.
+    """
+
+    _attr_should_poll = False
+    _scheduled_write: asyncio.Handle | None = None
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a scheduled state write."""
+        await super().async_will_remove_from_hass()
+        if self._scheduled_write is not None:
+            self._scheduled_write.cancel()
+            self._scheduled_write = None
+
+    @callback
+    def async_schedule_write(self) -> None:
+        """Write the state at the end of the event loop iteration."""
+        if self._scheduled_write is None:
+            self._scheduled_write = self.hass.loop.call_soon(
+                self._async_write_scheduled_state
+            )
+
+    @callback
+    def _async_write_scheduled_state(self) -> None:
+        """Write the scheduled state."""
+        self._scheduled_write = None
+        self.async_write_ha_state()
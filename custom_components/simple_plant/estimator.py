@@ -0,0 +1,227 @@
+"""Watering interval estimator for simple_plant."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, ClassVar, Self
+
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_track_time_change
+
+from .const import (
+    DAYS_BETWEEN_WATERINGS_MAX,
+    DAYS_BETWEEN_WATERINGS_MIN,
+    DOMAIN,
+    ESTIMATOR_DECAY,
+    ESTIMATOR_HOUR,
+    ESTIMATOR_MIN_CONFIDENCE,
+    ESTIMATOR_MIN_SAMPLES,
+    ESTIMATOR_WINDOW,
+    LOGGER,
+)
+from .journal import SimplePlantJournalStore
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+
+    from .coordinator import SimplePlant, SimplePlantCoordinator
+
+# Switch opting a plant in to the suggested interval
+AUTO_INTERVAL_KEY = "auto_interval"
+DAYS_BETWEEN_WATERINGS_KEY = "days_between_waterings"
+
+
+@dataclass(frozen=True, slots=True)
+class IntervalSuggestion:
+    """Watering interval suggested from the latest waterings of a plant."""
+
+    interval: int
+    confidence: float
+    samples: int
+    mean: float
+
+
+def estimate_intervals(
+    days: list[list[int]],
+) -> tuple[list[float], list[float], list[int]] | None:
+    """
+    Estimate the watering interval of many plants at once, in the executor.
+
+    `days` holds the latest watering day ordinals of each plant. Rows are
+    padded into a single matrix, so that intervals and their weighted mean
+    and variance are computed in one array pass for every plant: recent
+    intervals weigh more, and confidence grows with the number of intervals
+    and shrinks with their dispersion.
+
+    Return the means, confidences and sample counts, None without numpy.
+    """
+    try:
+        import numpy as np  # noqa: PLC0415
+    except ImportError:
+        return None
+    width = ESTIMATOR_WINDOW + 1
+    matrix = np.array(
+        [[np.nan] * (width - len(row)) + row for row in days], dtype=float
+    ).reshape(len(days), width)
+    intervals = np.diff(matrix, axis=1)
+    valid = ~np.isnan(intervals)
+    # Latest interval weighs 1, each older one ESTIMATOR_DECAY times less
+    weights = np.where(
+        valid, ESTIMATOR_DECAY ** np.arange(ESTIMATOR_WINDOW - 1, -1, -1), 0.0
+    )
+    values = np.nan_to_num(intervals)
+    samples = valid.sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        total = weights.sum(axis=1)
+        mean = (weights * values).sum(axis=1) / total
+        variance = (weights * (values - mean[:, None]) ** 2).sum(axis=1) / total
+        dispersion = np.sqrt(variance) / mean
+        confidence = samples / (samples + ESTIMATOR_WINDOW / 2) / (1 + dispersion)
+    return (
+        np.nan_to_num(mean).tolist(),
+        np.nan_to_num(confidence).tolist(),
+        samples.tolist(),
+    )
+
+
+class SimplePlantEstimator:
+    """
+    Class to suggest watering intervals from the watering journals.
+
+    Once a night, the latest intervals of every plant are estimated in a
+    single batch. Plants opted in with their `auto_interval` switch get
+    their days between waterings updated when the suggestion is confident
+    enough, with a single storage write.
+    """
+
+    _instance: ClassVar[SimplePlantEstimator | None] = None
+    _initialized: bool = False
+
+    def __new__(cls, _hass: HomeAssistant) -> Self:
+        """Create a singleton instance."""
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the estimator."""
+        if not self._initialized:
+            self.hass = hass
+            # Plant id -> suggestion
+            self.suggestions: dict[str, IntervalSuggestion] = {}
+            self.last_run_duration = 0.0
+            self.last_run_plants = 0
+            self.last_run_applied = 0
+            self._initialized = True
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return estimation counters."""
+        return {
+            "suggestions": len(self.suggestions),
+            "last_run_duration": self.last_run_duration,
+            "last_run_plants": self.last_run_plants,
+            "last_run_applied": self.last_run_applied,
+        }
+
+    @callback
+    def async_listen(self) -> CALLBACK_TYPE:
+        """Estimate intervals every night."""
+        return async_track_time_change(
+            self.hass, self._async_nightly, hour=ESTIMATOR_HOUR, minute=0, second=0
+        )
+
+    async def _async_nightly(self, _now: datetime) -> None:
+        """Run the nightly estimation."""
+        await self.async_run()
+
+    def _plants(self) -> list[SimplePlant]:
+        """Return the plants of every loaded config entry."""
+        coordinators: dict[str, SimplePlantCoordinator] = self.hass.data[DOMAIN]
+        return [
+            plant
+            for coordinator in coordinators.values()
+            for plant in coordinator.plants.values()
+        ]
+
+    async def async_run(self, *, apply: bool = True) -> None:
+        """Estimate the interval of every plant, applying opted-in ones."""
+        plants = self._plants()
+        if not plants:
+            return
+        start = time.perf_counter()
+        journal = SimplePlantJournalStore(self.hass)
+        journals = await journal.async_ensure_loaded()
+        days = [
+            journals[plant.plant_id].tail(ESTIMATOR_WINDOW + 1)
+            if plant.plant_id in journals
+            else []
+            for plant in plants
+        ]
+        estimates = await self.hass.async_add_executor_job(estimate_intervals, days)
+        if estimates is None:
+            LOGGER.debug("numpy is not available, not estimating intervals")
+            return
+
+        previous = self.suggestions
+        self.suggestions = {
+            plant.plant_id: IntervalSuggestion(
+                interval=min(
+                    max(round(mean), DAYS_BETWEEN_WATERINGS_MIN),
+                    DAYS_BETWEEN_WATERINGS_MAX,
+                ),
+                confidence=round(confidence, 3),
+                samples=samples,
+                mean=round(mean, 2),
+            )
+            for plant, mean, confidence, samples in zip(plants, *estimates, strict=True)
+            if samples >= ESTIMATOR_MIN_SAMPLES
+        }
+        updates = self._updates(plants) if apply else {}
+        if updates:
+            await plants[0].store.async_save_batch(
+                {
+                    plant.plant_id: {DAYS_BETWEEN_WATERINGS_KEY: float(interval)}
+                    for plant, interval in updates.values()
+                }
+            )
+            for plant, _ in updates.values():
+                plant.async_publish()
+        # Notify the suggestion sensors of the other plants
+        for plant in plants:
+            if plant.plant_id not in updates and previous.get(
+                plant.plant_id
+            ) != self.suggestions.get(plant.plant_id):
+                plant.coordinator.async_update_plant_listeners(plant)
+
+        self.last_run_duration = time.perf_counter() - start
+        self.last_run_plants = len(plants)
+        self.last_run_applied = len(updates)
+        LOGGER.debug(
+            "Estimated intervals of %s plants in %.3fms, %s applied",
+            len(plants),
+            self.last_run_duration * 1000,
+            len(updates),
+        )
+
+    def _updates(self, plants: list[SimplePlant]) -> dict[str, tuple[SimplePlant, int]]:
+        """Return the opted-in plants whose interval should change."""
+        updates = {}
+        for plant in plants:
+            suggestion = self.suggestions.get(plant.plant_id)
+            if (
+                suggestion is None
+                or not plant.data.get(AUTO_INTERVAL_KEY)
+                or suggestion.confidence < ESTIMATOR_MIN_CONFIDENCE
+            ):
+                continue
+            current = plant.data.get(
+                DAYS_BETWEEN_WATERINGS_KEY,
+                plant.config.get(DAYS_BETWEEN_WATERINGS_KEY),
+            )
+            if current is None or float(current) != suggestion.interval:
+                updates[plant.plant_id] = (plant, suggestion.interval)
+        return updates
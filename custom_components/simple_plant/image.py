@@ -2,23 +2,35 @@
 
 from __future__ import annotations
 
+from http import HTTPStatus
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-import aiofiles
+from aiohttp import hdrs, web
+from homeassistant.components.http import KEY_AUTHENTICATED, KEY_HASS, HomeAssistantView
 from homeassistant.components.image import (
+    DATA_COMPONENT,
     ImageEntity,
     ImageEntityDescription,
 )
-
-from .const import DOMAIN, IMAGES_MIME_TYPES, LOGGER
+from homeassistant.core import callback
+
+from .const import (
+    DOMAIN,
+    IMAGE_DEFAULT_VARIANT,
+    IMAGE_VARIANTS,
+    IMAGES_MIME_TYPES,
+    LOGGER,
+)
+from .image_cache import SimplePlantImageCache
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-    from .coordinator import SimplePlantCoordinator
+    from .coordinator import SimplePlant, SimplePlantCoordinator
+    from .image_cache import Image
 
 
 ENTITY_DESCRIPTIONS = (
@@ -36,10 +48,27 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the image platform."""
-    async_add_entities(
-        SimplePlantImage(hass, entry, entity_description)
-        for entity_description in ENTITY_DESCRIPTIONS
-    )
+    cache = SimplePlantImageCache(hass)
+    if not cache.view_registered:
+        hass.http.register_view(SimplePlantImageView())
+        cache.view_registered = True
+    coordinator: SimplePlantCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    @callback
+    def async_add_plant(plant: SimplePlant) -> None:
+        """Add the entities of a plant."""
+        async_add_entities(
+            (
+                SimplePlantImage(plant, entity_description)
+                for entity_description in ENTITY_DESCRIPTIONS
+            ),
+            config_subentry_id=plant.subentry_id,
+        )
+
+    for plant in coordinator.plants.values():
+        async_add_plant(plant)
+    # Plants of subentries added later, without reloading the entry
+    entry.async_on_unload(coordinator.async_listen_plants(async_add_plant))
 
 
 class SimplePlantImage(ImageEntity):
@@ -49,33 +78,36 @@ class SimplePlantImage(ImageEntity):
 
     def __init__(
         self,
-        hass: HomeAssistant,
-        entry: ConfigEntry,
+        plant: SimplePlant,
         description: ImageEntityDescription,
     ) -> None:
         """Initialize the image class."""
-        super().__init__(hass)
+        super().__init__(plant.hass)
         self.entity_description = description
 
-        self.coordinator: SimplePlantCoordinator = hass.data[DOMAIN][entry.entry_id]
+        self.plant = plant
+        self.cache = SimplePlantImageCache(plant.hass)
 
-        device = self.coordinator.device
+        device = plant.device
 
-        image_path = str(entry.data.get("photo"))
-        self._attr_image_url = hass.config.path(image_path.lstrip("/"))
-
-        self._attr_content_type = self._get_content_type(Path(image_path))
+        self._set_photo(str(plant.config.get("photo")))
 
         self.entity_id = f"image.{DOMAIN}_{description.key}_{device}"
-        self._attr_unique_id = f"{DOMAIN}_{description.key}_{device}"
+        self._attr_unique_id = f"{plant.plant_id}_{description.key}"
 
         # Set up device info
-        self._attr_device_info = self.coordinator.device_info
+        self._attr_device_info = plant.device_info
 
     @property
     def device(self) -> str | None:
         """Return the device name."""
-        return self.coordinator.device
+        return self.plant.device
+
+    def _set_photo(self, image_path: str) -> None:
+        """Show a photo of the plant."""
+        self._photo = image_path
+        self._attr_image_url = self.plant.hass.config.path(image_path.lstrip("/"))
+        self._attr_content_type = self._get_content_type(Path(image_path))
 
     def _get_content_type(self, path: Path) -> str:
         """Get the content type of the image based on its extension."""
@@ -83,11 +115,81 @@ class SimplePlantImage(ImageEntity):
             return IMAGES_MIME_TYPES[path.suffix]
         return "image/jpeg"  # default to jpeg
 
+    async def async_added_to_hass(self) -> None:
+        """Run when entity is added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.plant.coordinator.async_add_listener(
+                self._async_plant_updated, self.plant.plant_id
+            )
+        )
+        await self._async_update_last_modified()
+
+    async def _async_update_last_modified(self) -> None:
+        """Date the picture, so browsers can keep it cached until it changes."""
+        self._attr_image_last_updated = await self.cache.async_last_modified(
+            Path(str(self._attr_image_url))
+        )
+
+    @callback
+    def _async_plant_updated(self) -> None:
+        """Show the new photo of a reconfigured plant."""
+        photo = str(self.plant.config.get("photo"))
+        if photo == self._photo:
+            return
+        self._set_photo(photo)
+        self.hass.async_create_task(self._async_write_new_photo())
+
+    async def _async_write_new_photo(self) -> None:
+        """Write the state once the new photo is dated."""
+        await self._async_update_last_modified()
+        self.async_write_ha_state()
+
     async def async_image(self) -> bytes | None:
         """Return bytes of image."""
-        file_path = Path(str(self._attr_image_url))
-        if file_path.exists():
-            async with aiofiles.open(file_path, mode="rb") as file:
-                return await file.read()
-        LOGGER.error("Image file not found")
-        return None
+        image = await self.async_variant(IMAGE_DEFAULT_VARIANT)
+        if image is None:
+            return None
+        self._attr_content_type = image[1]
+        return image[0]
+
+    async def async_variant(self, variant: str) -> Image | None:
+        """Return content and content type of an image variant."""
+        image = await self.cache.async_get(Path(str(self._attr_image_url)), variant)
+        if image is None:
+            LOGGER.error("Image file not found")
+        return image
+
+
+class SimplePlantImageView(HomeAssistantView):
+    """View serving the variants of plant pictures."""
+
+    # Authenticated like the image entity proxy: by session or access token
+    requires_auth = False
+    url = "/api/simple_plant/image/{entity_id}/{variant}"
+    name = "api:simple_plant:image"
+
+    async def get(
+        self, request: web.Request, entity_id: str, variant: str
+    ) -> web.StreamResponse:
+        """Serve an image variant."""
+        hass = request.app[KEY_HASS]
+        entity = hass.data[DATA_COMPONENT].get_entity(entity_id)
+        if not isinstance(entity, SimplePlantImage) or variant not in IMAGE_VARIANTS:
+            raise web.HTTPNotFound
+        authenticated = (
+            request[KEY_AUTHENTICATED]
+            or request.query.get("token") in entity.access_tokens
+        )
+        if not authenticated:
+            if hdrs.AUTHORIZATION in request.headers:
+                raise web.HTTPUnauthorized
+            raise web.HTTPForbidden
+        image = await entity.async_variant(variant)
+        if image is None:
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+        return web.Response(
+            body=image[0],
+            content_type=image[1],
+            headers={hdrs.CACHE_CONTROL: "private, max-age=86400"},
+        )
@@ -0,0 +1,186 @@
+"""Resized image variants cache for simple_plant."""
+
+from __future__ import annotations
+
+import hashlib
+import io
+from collections import OrderedDict
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar, Self
+
+from .const import (
+    IMAGE_CACHE_MAX_BYTES,
+    IMAGE_VARIANT_FORMAT,
+    IMAGE_VARIANT_QUALITY,
+    IMAGE_VARIANTS,
+    IMAGES_MIME_TYPES,
+    LOGGER,
+    STORAGE_DIR,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+VARIANT_CONTENT_TYPE = f"image/{IMAGE_VARIANT_FORMAT}"
+# Variants are cached as `<source digest>-<variant>.<version>` in this folder
+CACHE_DIR = ".cache"
+
+# (content, content type)
+Image = tuple[bytes, str]
+
+
+def source_digest(source: Path) -> str:
+    """Return the digest naming the cached variants of `source`."""
+    return hashlib.sha256(str(source).encode()).hexdigest()[:16]
+
+
+def _stat(source: Path) -> tuple[int, int] | None:
+    """Return modification time and size of `source`."""
+    try:
+        stat = source.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _render(source: Path, size: int | None) -> bytes | None:
+    """Render a variant of `source`, None if it can't be converted."""
+    try:
+        from PIL import Image as PILImage  # noqa: PLC0415
+        from PIL import ImageOps  # noqa: PLC0415
+    except ImportError:
+        return None
+    try:
+        with PILImage.open(source) as original:
+            image = ImageOps.exif_transpose(original)
+            if size is not None:
+                image.thumbnail((size, size))
+            if image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGBA")
+            buffer = io.BytesIO()
+            image.save(
+                buffer, format=IMAGE_VARIANT_FORMAT, quality=IMAGE_VARIANT_QUALITY
+            )
+    except (OSError, ValueError) as err:
+        LOGGER.debug("Can't render %s: %s", source, err)
+        return None
+    return buffer.getvalue()
+
+
+def _load(source: Path, variant: str, cache_file: Path) -> tuple[Image, bool] | None:
+    """
+    Load a variant from the disk cache, or render and cache it.
+
+    Return the image and whether it came from the disk cache. Sources that
+    can't be converted (SVG, missing Pillow...) are served as is.
+    """
+    if cache_file.exists():
+        return (cache_file.read_bytes(), VARIANT_CONTENT_TYPE), True
+    if not source.exists():
+        return None
+    content = _render(source, IMAGE_VARIANTS[variant])
+    if content is None:
+        content_type = IMAGES_MIME_TYPES.get(source.suffix, "image/jpeg")
+        return (source.read_bytes(), content_type), False
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    # Drop variants rendered from previous versions of the source
+    for stale in cache_file.parent.glob(f"{cache_file.name.split('.')[0]}.*"):
+        stale.unlink(missing_ok=True)
+    temp_file = cache_file.with_suffix(".tmp")
+    temp_file.write_bytes(content)
+    temp_file.replace(cache_file)
+    return (content, VARIANT_CONTENT_TYPE), False
+
+
+class SimplePlantImageCache:
+    """
+    Class to serve resized variants of plant pictures.
+
+    Variants are rendered in the executor, kept on disk next to the pictures
+    and in a bounded in-memory LRU. Both are keyed by the source path,
+    modification time and size, so a replaced picture is rendered again.
+    """
+
+    _instance: ClassVar[SimplePlantImageCache | None] = None
+    _initialized: bool = False
+
+    def __new__(cls, _hass: HomeAssistant) -> Self:
+        """Create a singleton instance."""
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        if not self._initialized:
+            self.hass = hass
+            self.cache_dir = Path(hass.config.path(STORAGE_DIR, CACHE_DIR))
+            self.max_bytes = IMAGE_CACHE_MAX_BYTES
+            self._images: OrderedDict[tuple, Image] = OrderedDict()
+            self._size = 0
+            self.hits = 0
+            self.disk_hits = 0
+            self.misses = 0
+            self.bytes_served = 0
+            self.view_registered = False
+            self._initialized = True
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return cache counters."""
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "bytes_served": self.bytes_served,
+            "cached_images": len(self._images),
+            "cached_bytes": self._size,
+        }
+
+    async def async_last_modified(self, source: Path) -> datetime | None:
+        """Return the modification time of `source`."""
+        stat = await self.hass.async_add_executor_job(_stat, source)
+        if stat is None:
+            return None
+        return datetime.fromtimestamp(stat[0] / 1e9, tz=UTC)
+
+    async def async_get(self, source: Path, variant: str) -> Image | None:
+        """Return the `variant` of the `source` picture."""
+        stat = await self.hass.async_add_executor_job(_stat, source)
+        if stat is None:
+            return None
+        key = (str(source), variant, *stat)
+        if (image := self._images.get(key)) is not None:
+            self._images.move_to_end(key)
+            self.hits += 1
+            self.bytes_served += len(image[0])
+            return image
+
+        digest = source_digest(source)
+        version = hashlib.sha256(repr(stat).encode()).hexdigest()[:16]
+        cache_file = self.cache_dir / f"{digest}-{variant}.{version}"
+        loaded = await self.hass.async_add_executor_job(
+            _load, source, variant, cache_file
+        )
+        if loaded is None:
+            return None
+        image, from_disk = loaded
+        if from_disk:
+            self.disk_hits += 1
+        else:
+            self.misses += 1
+        self._remember(key, image)
+        self.bytes_served += len(image[0])
+        return image
+
+    def _remember(self, key: tuple, image: Image) -> None:
+        """Keep `image` in memory, evicting the least recently used ones."""
+        size = len(image[0])
+        if size > self.max_bytes:
+            return
+        self._images[key] = image
+        self._size += size
+        while self._size > self.max_bytes:
+            _, evicted = self._images.popitem(last=False)
+            self._size -= len(evicted[0])
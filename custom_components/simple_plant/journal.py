@@ -0,0 +1,276 @@
+"""Watering journal for simple_plant."""
+
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_left
+from collections import deque
+from datetime import date
+from itertools import islice
+from typing import TYPE_CHECKING, Any, ClassVar, Self
+
+from homeassistant.core import callback
+
+from .const import (
+    JOURNAL_HORIZON_DAYS,
+    JOURNAL_MAX_ENTRIES,
+    JOURNAL_STORAGE_KEY,
+    LOGGER,
+    STORAGE_SAVE_DELAY,
+)
+from .data import SimplePlantLoopStore
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from homeassistant.core import HomeAssistant
+
+JOURNAL_STORAGE_VERSION = 1
+
+
+class WateringJournal:
+    """
+    Watering days of a plant, as day ordinals in ascending order.
+
+    Interval statistics are running sums, updated on each change, so they
+    cover every recorded interval even once old days are compacted away:
+    days past the horizon, or beyond the maximum size, are dropped from the
+    oldest end and can't be undone anymore.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty journal."""
+        self.days: deque[int] = deque()
+        # Intervals, in days: count, sum and sum of squares
+        self.count = 0
+        self.total = 0
+        self.total_sq = 0
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Self:
+        """Load a journal from its stored form."""
+        journal = cls()
+        # Days are stored delta-encoded: first day ordinal, then intervals
+        day = 0
+        for delta in data.get("d", ()):
+            day += delta
+            journal.days.append(day)
+        journal.count = data.get("n", 0)
+        journal.total = data.get("s", 0)
+        journal.total_sq = data.get("q", 0)
+        return journal
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the stored form of the journal."""
+        deltas = []
+        previous = 0
+        for day in self.days:
+            deltas.append(day - previous)
+            previous = day
+        return {"d": deltas, "n": self.count, "s": self.total, "q": self.total_sq}
+
+    @property
+    def last(self) -> date | None:
+        """Return the latest watering day."""
+        return date.fromordinal(self.days[-1]) if self.days else None
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean interval between waterings, in days."""
+        return self.total / self.count if self.count else None
+
+    @property
+    def variance(self) -> float | None:
+        """Return the variance of intervals between waterings."""
+        if not self.count:
+            return None
+        mean = self.total / self.count
+        return max(self.total_sq / self.count - mean * mean, 0.0)
+
+    def recent(self, count: int) -> list[date]:
+        """Return up to `count` latest watering days, latest first."""
+        return [
+            date.fromordinal(self.days[-index])
+            for index in range(1, min(count, len(self.days)) + 1)
+        ]
+
+    def tail(self, count: int) -> list[int]:
+        """Return up to `count` latest watering day ordinals, in order."""
+        return list(islice(reversed(self.days), count))[::-1]
+
+    def _add_interval(self, interval: int, sign: int = 1) -> None:
+        """Count an interval in, or out with a negative `sign`."""
+        self.count += sign
+        self.total += sign * interval
+        self.total_sq += sign * interval * interval
+
+    def record(self, day: date, previous: date | None = None) -> bool:
+        """
+        Record a watering day, return False if it was already recorded.
+
+        An empty journal is seeded with the `previous` watering day, so that
+        the first watering recorded can be undone.
+        """
+        if previous is not None and not self.days:
+            self.days.append(previous.toordinal())
+        ordinal = day.toordinal()
+        days = self.days
+        if not days or ordinal > days[-1]:
+            if days:
+                self._add_interval(ordinal - days[-1])
+            days.append(ordinal)
+        else:
+            # Recorded late: split the interval the day falls in
+            index = bisect_left(days, ordinal)
+            if days[index] == ordinal:
+                return False
+            if index > 0:
+                self._add_interval(days[index] - days[index - 1], -1)
+                self._add_interval(ordinal - days[index - 1])
+            self._add_interval(days[index] - ordinal)
+            days.insert(index, ordinal)
+        self.compact(days[-1])
+        return True
+
+    def undo(self) -> date | None:
+        """Forget the latest watering day, return the one before it."""
+        if not self.days:
+            return None
+        ordinal = self.days.pop()
+        if self.days:
+            self._add_interval(ordinal - self.days[-1], -1)
+        return self.last
+
+    def compact(self, today: int) -> None:
+        """Drop the oldest days, keeping their intervals in the statistics."""
+        horizon = today - JOURNAL_HORIZON_DAYS
+        while len(self.days) > JOURNAL_MAX_ENTRIES or (
+            len(self.days) > 1 and self.days[0] < horizon
+        ):
+            self.days.popleft()
+
+    def as_response(self) -> dict[str, Any]:
+        """Return the journal as a service response."""
+        variance = self.variance
+        return {
+            "days": [day.isoformat() for day in self.recent(len(self.days))],
+            "intervals": self.count,
+            "mean_interval": self.mean,
+            "interval_stddev": variance**0.5 if variance is not None else None,
+        }
+
+
+class SimplePlantJournalStore:
+    """
+    Class to store the watering journal of every plant.
+
+    Journals are kept in their own `simple_plant_journal` file, so that the
+    main storage file stays small. The file is only read when a journal is
+    first used, and written behind like the main storage.
+    """
+
+    _instance: ClassVar[SimplePlantJournalStore | None] = None
+    _initialized: bool = False
+
+    def __new__(cls, _hass: HomeAssistant) -> Self:
+        """Create a singleton instance."""
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the journal storage."""
+        if not self._initialized:
+            self.hass = hass
+            # Journals change in the event loop, read them there for delayed saves
+            self.store = SimplePlantLoopStore(
+                hass, JOURNAL_STORAGE_VERSION, JOURNAL_STORAGE_KEY
+            )
+            self._journals: dict[str, WateringJournal] | None = None
+            self._load_lock = asyncio.Lock()
+            self.save_delay: float = STORAGE_SAVE_DELAY
+            self._dirty = False
+            self.physical_writes = 0
+            self._initialized = True
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return journal counters."""
+        journals = self._journals or {}
+        return {
+            "loaded": self._journals is not None,
+            "plants": len(journals),
+            "days": sum(len(journal.days) for journal in journals.values()),
+            "physical_writes": self.physical_writes,
+        }
+
+    async def async_ensure_loaded(self) -> dict[str, WateringJournal]:
+        """Load the journals unless they are already in memory."""
+        if self._journals is None:
+            async with self._load_lock:
+                if self._journals is None:
+                    data = await self.store.async_load() or {}
+                    self._journals = {
+                        plant_id: WateringJournal.from_dict(journal)
+                        for plant_id, journal in data.items()
+                    }
+                    LOGGER.debug("Loaded %s watering journals", len(self._journals))
+        return self._journals
+
+    async def async_get(self, plant_id: str) -> WateringJournal:
+        """Get the journal of a plant."""
+        journals = await self.async_ensure_loaded()
+        return journals.get(plant_id) or WateringJournal()
+
+    async def async_record(
+        self, waterings: Iterable[tuple[str, date, date | None]]
+    ) -> None:
+        """Record watering days, as `(plant id, day, previous day)` tuples."""
+        journals = await self.async_ensure_loaded()
+        for plant_id, day, previous in waterings:
+            journal = journals.setdefault(plant_id, WateringJournal())
+            if journal.record(day, previous):
+                self._dirty = True
+        await self._async_schedule_save()
+
+    async def async_undo(self, plant_id: str) -> date | None:
+        """Forget the latest watering day of a plant, return the one before."""
+        journals = await self.async_ensure_loaded()
+        journal = journals.get(plant_id)
+        if journal is None or not journal.days:
+            return None
+        previous = journal.undo()
+        self._dirty = True
+        await self._async_schedule_save()
+        return previous
+
+    async def async_remove(self, plant_id: str) -> None:
+        """Remove the journal of a plant."""
+        journals = await self.async_ensure_loaded()
+        if journals.pop(plant_id, None) is not None:
+            self._dirty = True
+            await self._async_schedule_save()
+
+    async def async_flush(self) -> None:
+        """Write pending changes to disk now."""
+        if self._dirty:
+            await self.store.async_save(self._data_to_save())
+
+    async def _async_schedule_save(self) -> None:
+        """Schedule a coalesced write."""
+        if not self._dirty:
+            return
+        if self.save_delay <= 0:
+            await self.async_flush()
+            return
+        self.store.async_delay_save(self._data_to_save, self.save_delay)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return data to write."""
+        self._dirty = False
+        self.physical_writes += 1
+        return {
+            plant_id: journal.as_dict()
+            for plant_id, journal in (self._journals or {}).items()
+        }
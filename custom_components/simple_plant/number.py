@@ -11,15 +11,23 @@ from homeassistant.components.number import (
     NumberMode,
 )
 from homeassistant.const import UnitOfTime
-
-from .const import DOMAIN, LOGGER
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import (
+    DAYS_BETWEEN_WATERINGS_MAX,
+    DAYS_BETWEEN_WATERINGS_MIN,
+    DOMAIN,
+    LOGGER,
+)
+from .coordinator import SimplePlantCoordinator
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-    from .coordinator import SimplePlantCoordinator
+    from .coordinator import SimplePlant
 
 
 ENTITY_DESCRIPTIONS = (
@@ -41,49 +49,59 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the number platform."""
-    async_add_entities(
-        SimplePlantNumber(hass, entry, entity_description)
-        for entity_description in ENTITY_DESCRIPTIONS
-    )
-
-
-class SimplePlantNumber(NumberEntity):
+    coordinator: SimplePlantCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    @callback
+    def async_add_plant(plant: SimplePlant) -> None:
+        """Add the entities of a plant."""
+        async_add_entities(
+            (
+                SimplePlantNumber(plant, entity_description)
+                for entity_description in ENTITY_DESCRIPTIONS
+            ),
+            config_subentry_id=plant.subentry_id,
+        )
+
+    for plant in coordinator.plants.values():
+        async_add_plant(plant)
+    # Plants of subentries added later, without reloading the entry
+    entry.async_on_unload(coordinator.async_listen_plants(async_add_plant))
+
+
+class SimplePlantNumber(CoordinatorEntity[SimplePlantCoordinator], NumberEntity):
     """simple_plant number class."""
 
     _attr_has_entity_name = True
     _attr_should_poll = False
-    _attr_native_min_value = 1
-    _attr_native_max_value = 60
+    _attr_native_min_value = DAYS_BETWEEN_WATERINGS_MIN
+    _attr_native_max_value = DAYS_BETWEEN_WATERINGS_MAX
     _attr_native_step = 1
 
     def __init__(
         self,
-        hass: HomeAssistant,
-        entry: ConfigEntry,
+        plant: SimplePlant,
         description: NumberEntityDescription,
     ) -> None:
         """Initialize the number class."""
-        super().__init__()
-        self._hass = hass
-        self._entry = entry
+        super().__init__(plant.coordinator, context=plant.plant_id)
         self.entity_description = description
-        self.coordinator: SimplePlantCoordinator = hass.data[DOMAIN][entry.entry_id]
+        self.plant = plant
 
-        device = self.coordinator.device
+        device = plant.device
 
         self.entity_id = f"number.{DOMAIN}_{description.key}_{device}"
-        self._attr_unique_id = f"{DOMAIN}_{description.key}_{device}"
+        self._attr_unique_id = f"{plant.plant_id}_{description.key}"
 
         # set value
-        self._fallback_value = entry.data.get("days_between_waterings")
+        self._fallback_value = plant.config.get("days_between_waterings")
 
         # Set up device info
-        self._attr_device_info = self.coordinator.device_info
+        self._attr_device_info = plant.device_info
 
     @property
     def device(self) -> str | None:
         """Return the device name."""
-        return self.coordinator.device
+        return self.plant.device
 
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to hass."""
@@ -92,17 +110,20 @@ class SimplePlantNumber(NumberEntity):
         def warning(msg: str) -> None:
             LOGGER.warning("%s :%s", self.unique_id, msg)
 
-        if self.coordinator.data is None:
-            warning("Coordinator not ready at initialization")
-            return
-        data = self.coordinator.data.get(self.unique_id)
-        if data is None:
-            if self._fallback_value is None:
-                warning("Initialization failed as _fallback_value is None")
-                return
-            await self.async_set_native_value(self._fallback_value)
+        # Restore without storing: the config value is the default anyway
+        data = self.plant.data.get(self.entity_description.key)
+        if data is None and self._fallback_value is None:
+            warning("Initialization failed as _fallback_value is None")
             return
-        await self.async_set_native_value(float(data))
+        self._attr_native_value = data if data is not None else self._fallback_value
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Follow values stored by others, like the interval estimator."""
+        data = self.plant.data.get(self.entity_description.key)
+        if data is not None and data != self._attr_native_value:
+            self._attr_native_value = data
+            self.async_write_ha_state()
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
@@ -110,5 +131,4 @@ class SimplePlantNumber(NumberEntity):
         self.async_write_ha_state()
 
         # Save to persistent storage
-        if self.unique_id is not None:
-            await self.coordinator.async_store_value(self.unique_id, str(value))
+        await self.plant.async_store_value(self.entity_description.key, float(value))
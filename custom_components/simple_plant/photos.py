@@ -0,0 +1,297 @@
+"""Content-addressed photo store for simple_plant."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import time
+from contextlib import suppress
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar, Self
+
+from homeassistant.core import callback
+from homeassistant.setup import async_setup_component
+
+from .const import (
+    DOMAIN,
+    IMAGE_COPY_CHUNK_SIZE,
+    IMAGE_SNIFF_SIZE,
+    IMAGES_MIME_TYPES,
+    LOGGER,
+    PHOTO_GC_GRACE_PERIOD,
+    STORAGE_DIR,
+)
+from .image_cache import CACHE_DIR, source_digest
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+def sniff_image_type(header: bytes) -> str | None:
+    """Return the mime type of an image from its first bytes."""
+    mime_type = None
+    if header.startswith(b"\x89PNG\r\n\x1a\n"):
+        mime_type = "image/png"
+    elif header.startswith(b"\xff\xd8\xff"):
+        mime_type = "image/jpeg"
+    elif header.startswith((b"GIF87a", b"GIF89a")):
+        mime_type = "image/gif"
+    elif header.startswith(b"BM"):
+        mime_type = "image/bmp"
+    elif header.startswith(b"RIFF") and header[8:12] == b"WEBP":
+        mime_type = "image/webp"
+    elif header.startswith((b"II*\x00", b"MM\x00*")):
+        mime_type = "image/tiff"
+    elif b"<svg" in header.lstrip(b"\xef\xbb\xbf \t\r\n").lower():
+        mime_type = "image/svg+xml"
+    return mime_type
+
+
+def _suffix_for(mime_type: str) -> str:
+    """Return the canonical file suffix of a mime type."""
+    return next(
+        suffix
+        for suffix, suffix_type in IMAGES_MIME_TYPES.items()
+        if suffix_type == mime_type
+    )
+
+
+def _hash_image(path: Path) -> tuple[str, str]:
+    """Return the sha256 and mime type of an image, reading it in chunks."""
+    digest = hashlib.sha256()
+    with path.open("rb") as file:
+        header = file.read(IMAGE_SNIFF_SIZE)
+        # Validate content rather than trusting the file name
+        mime_type = sniff_image_type(header)
+        if mime_type is None:
+            raise ValueError
+        digest.update(header)
+        while chunk := file.read(IMAGE_COPY_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest(), mime_type
+
+
+def _copy(source: Path, destination: Path) -> None:
+    """Copy `source` in chunks, naming the copy `destination` once complete."""
+    # An interrupted copy must never take the content address
+    temp_path = destination.with_suffix(".tmp")
+    try:
+        with source.open("rb") as source_file, temp_path.open("wb") as temp_file:
+            shutil.copyfileobj(source_file, temp_file, IMAGE_COPY_CHUNK_SIZE)
+        temp_path.replace(destination)
+    except OSError:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def _move(source: Path, destination: Path) -> None:
+    """Move `source` by renaming it, else by linking or copying it."""
+    with suppress(OSError):
+        source.replace(destination)
+        return
+    try:
+        destination.hardlink_to(source)
+    except OSError:
+        # Across filesystems
+        _copy(source, destination)
+    source.unlink(missing_ok=True)
+
+
+def _add_photo(storage_dir: Path, source: Path) -> Path:
+    """Move `source` to its content address, dropping it if already stored."""
+    storage_dir.mkdir(parents=True, exist_ok=True)
+    digest, mime_type = _hash_image(source)
+    file_path = storage_dir / f"{digest}{_suffix_for(mime_type)}"
+    if file_path.exists():
+        # Deduplicated: refresh mtime so garbage collection doesn't race us
+        os.utime(file_path)
+        source.unlink(missing_ok=True)
+        return file_path
+    _move(source, file_path)
+    return file_path
+
+
+def _copy_photo(storage_dir: Path, source: Path) -> Path:
+    """Copy `source` to its content address, unless already stored."""
+    storage_dir.mkdir(parents=True, exist_ok=True)
+    digest, mime_type = _hash_image(source)
+    file_path = storage_dir / f"{digest}{_suffix_for(mime_type)}"
+    if file_path.exists():
+        os.utime(file_path)
+        return file_path
+    _copy(source, file_path)
+    return file_path
+
+
+def _store_uploaded_image(hass: HomeAssistant, storage_dir: Path, file_id: str) -> Path:
+    """Store an uploaded image, in the executor."""
+    # Only flows upload files, keep file_upload off the startup path
+    from homeassistant.components.file_upload import (  # noqa: PLC0415
+        process_uploaded_file,
+    )
+
+    with process_uploaded_file(hass, file_id) as uploaded_file:
+        return _add_photo(storage_dir, uploaded_file)
+
+
+def _rehome_photo(storage_dir: Path, file_path: Path) -> Path | None:
+    """Move a photo saved by name to its content address."""
+    if not file_path.exists():
+        return None
+    return _add_photo(storage_dir, file_path)
+
+
+def _collect_garbage(storage_dir: Path, referenced: set[str]) -> tuple[int, int]:
+    """
+    Remove unreferenced photos, return the count and bytes reclaimed.
+
+    Cached variants of photos that no longer exist are removed as well.
+    """
+    if not storage_dir.is_dir():
+        return 0, 0
+    count = 0
+    reclaimed = 0
+    threshold = time.time() - PHOTO_GC_GRACE_PERIOD
+    for file_path in storage_dir.iterdir():
+        if not file_path.is_file() or file_path.name in referenced:
+            continue
+        stat = file_path.stat()
+        # Keep photos of flows that didn't create their entry yet
+        if stat.st_mtime > threshold:
+            continue
+        file_path.unlink(missing_ok=True)
+        count += 1
+        reclaimed += stat.st_size
+    return count, reclaimed + _collect_variants(storage_dir)
+
+
+def _collect_variants(storage_dir: Path) -> int:
+    """Remove cached variants of missing photos, return the bytes reclaimed."""
+    cache_dir = storage_dir / CACHE_DIR
+    if not cache_dir.is_dir():
+        return 0
+    photos = {
+        source_digest(file_path)
+        for file_path in storage_dir.iterdir()
+        if file_path.is_file()
+    }
+    reclaimed = 0
+    for cache_file in cache_dir.iterdir():
+        if cache_file.name.split("-")[0] in photos:
+            continue
+        reclaimed += cache_file.stat().st_size
+        cache_file.unlink(missing_ok=True)
+    return reclaimed
+
+
+class SimplePlantPhotoStore:
+    """
+    Class to store plant photos by content.
+
+    Photos are saved as `/simple_plant/<sha256><suffix>`, so uploading the
+    same picture for several plants stores it once. Photos are never removed
+    directly: a garbage collection pass removes the files no config entry
+    references anymore.
+    """
+
+    _instance: ClassVar[SimplePlantPhotoStore | None] = None
+    _initialized: bool = False
+
+    def __new__(cls, _hass: HomeAssistant) -> Self:
+        """Create a singleton instance."""
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the photo store."""
+        if not self._initialized:
+            self.hass = hass
+            self.storage_dir = Path(hass.config.path(STORAGE_DIR))
+            self.removed_files = 0
+            self.reclaimed_bytes = 0
+            self._initialized = True
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return garbage collection counters."""
+        return {
+            "removed_files": self.removed_files,
+            "reclaimed_bytes": self.reclaimed_bytes,
+        }
+
+    def references(self, exclude_entry_id: str | None = None) -> set[str]:
+        """Return the file names of photos used by config entries and subentries."""
+        references = set()
+        for entry in self.hass.config_entries.async_entries(DOMAIN):
+            if entry.entry_id == exclude_entry_id:
+                continue
+            for data in (
+                entry.data,
+                *(subentry.data for subentry in entry.subentries.values()),
+            ):
+                if data.get("photo"):
+                    references.add(Path(str(data["photo"])).name)
+        return references
+
+    async def async_setup_upload(self) -> None:
+        """Set up file uploads, once a flow shows an upload field."""
+        await async_setup_component(self.hass, "file_upload", {})
+
+    async def async_save_upload(self, file_id: str) -> str:
+        """Permanently save an uploaded image, return its url path."""
+        file_path = await self.hass.async_add_executor_job(
+            _store_uploaded_image, self.hass, self.storage_dir, file_id
+        )
+        return f"/{STORAGE_DIR}/{file_path.name}"
+
+    async def async_import(self, source: Path) -> str:
+        """Copy a local image to the store, return its url path."""
+        file_path = await self.hass.async_add_executor_job(
+            _copy_photo, self.storage_dir, source
+        )
+        return f"/{STORAGE_DIR}/{file_path.name}"
+
+    def path(self, photo: str) -> Path:
+        """Return the file of a photo url path."""
+        return Path(self.hass.config.path(photo.lstrip("/")))
+
+    async def async_rehome(self, photo: str) -> str | None:
+        """Move a photo saved by name to its content address."""
+        file_path = await self.hass.async_add_executor_job(
+            _rehome_photo,
+            self.storage_dir,
+            self.path(photo),
+        )
+        if file_path is None:
+            LOGGER.warning("Image file not found: %s", photo)
+            return None
+        return f"/{STORAGE_DIR}/{file_path.name}"
+
+    async def async_collect_garbage(self, exclude_entry_id: str | None = None) -> int:
+        """Remove unreferenced photos, return the bytes reclaimed."""
+        try:
+            count, reclaimed = await self.hass.async_add_executor_job(
+                _collect_garbage, self.storage_dir, self.references(exclude_entry_id)
+            )
+        except OSError as err:
+            LOGGER.error("Error collecting unused photos: %s", err)
+            return 0
+        self.removed_files += count
+        self.reclaimed_bytes += reclaimed
+        if count:
+            LOGGER.info(
+                "Removed %s unused photos, %s bytes reclaimed", count, reclaimed
+            )
+        return reclaimed
+
+    @callback
+    def async_schedule_garbage_collection(
+        self, exclude_entry_id: str | None = None
+    ) -> None:
+        """Collect unreferenced photos in the background."""
+        self.hass.async_create_background_task(
+            self.async_collect_garbage(exclude_entry_id),
+            f"{DOMAIN}_photo_garbage_collection",
+        )
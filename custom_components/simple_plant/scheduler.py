@@ -0,0 +1,291 @@
+"""Watering schedule for simple_plant."""
+
+from __future__ import annotations
+
+import time
+from bisect import bisect_left, insort
+from datetime import date
+from typing import TYPE_CHECKING, Any, ClassVar, Self
+
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.util.dt import as_local, now, start_of_local_day
+
+from .const import LOGGER
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import datetime
+
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+
+    from .coordinator import SimplePlant
+
+
+class SimplePlantScheduleIndex:
+    """
+    Plants sorted by next watering day.
+
+    Keys are `(day ordinal, plant id)` tuples kept sorted, so due and late plants
+    are contiguous slices found by bisection.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the index."""
+        self._keys: list[tuple[int, str]] = []
+        self._days: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Return the number of indexed plants."""
+        return len(self._keys)
+
+    def update(self, plant_id: str, day: date) -> bool:
+        """Set the next watering day of `plant_id`, return True if it changed."""
+        ordinal = day.toordinal()
+        if self._days.get(plant_id) == ordinal:
+            return False
+        self.remove(plant_id)
+        self._days[plant_id] = ordinal
+        insort(self._keys, (ordinal, plant_id))
+        return True
+
+    def remove(self, plant_id: str) -> None:
+        """Remove `plant_id` from the index."""
+        ordinal = self._days.pop(plant_id, None)
+        if ordinal is None:
+            return
+        del self._keys[bisect_left(self._keys, (ordinal, plant_id))]
+
+    def earliest(self) -> int | None:
+        """Return the earliest next watering day ordinal."""
+        return self._keys[0][0] if self._keys else None
+
+    def get(self, plant_id: str) -> int | None:
+        """Return the next watering day ordinal of `plant_id`."""
+        return self._days.get(plant_id)
+
+    def between(self, first: int, last: int) -> list[tuple[int, str]]:
+        """Return plants to water from day `first` to day `last` included."""
+        start = bisect_left(self._keys, (first,))
+        end = bisect_left(self._keys, (last + 1,), lo=start)
+        return self._keys[start:end]
+
+    def before(self, day: int) -> list[tuple[int, str]]:
+        """Return plants that should have been watered before `day`."""
+        return self._keys[: bisect_left(self._keys, (day,))]
+
+    def next_flip(self, today: int) -> int | None:
+        """
+        Return the next day a plant status changes.
+
+        A plant becomes due on its next watering day and late the day after.
+        """
+        candidates = []
+        due = bisect_left(self._keys, (today + 1,))
+        if due < len(self._keys):
+            candidates.append(self._keys[due][0])
+        late = bisect_left(self._keys, (today,))
+        if late < len(self._keys):
+            candidates.append(self._keys[late][0] + 1)
+        return min(candidates, default=None)
+
+
+class SimplePlantScheduler:
+    """
+    Class to refresh plants when their watering status changes.
+
+    Plants are indexed by next watering day, and a single timer is armed for
+    the next day a plant becomes due or late. When it fires, only the plants
+    whose status flipped are recomputed, and their entities only write their
+    state if their value changed. Plants to water are tracked as they become
+    due and get watered, so their listeners only hear about those plants.
+    While plants are late, and something counts their days late, the timer
+    is also armed for every midnight.
+    """
+
+    _instance: ClassVar[SimplePlantScheduler | None] = None
+    _initialized: bool = False
+
+    def __new__(cls, _hass: HomeAssistant) -> Self:
+        """Create a singleton instance."""
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        if not self._initialized:
+            self.hass = hass
+            self.index = SimplePlantScheduleIndex()
+            self._plants: dict[str, SimplePlant] = {}
+            self._unsub: CALLBACK_TYPE | None = None
+            self._next_flip: int | None = None
+            # Plants to water today or late, and callbacks of their changes
+            self._due: set[str] = set()
+            self._due_listeners: set[Callable[[str], None]] = set()
+            self._day_listeners: set[CALLBACK_TYPE] = set()
+            self.last_run_duration = 0.0
+            self.last_run_updates = 0
+            self._initialized = True
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return day change counters."""
+        return {
+            "indexed_plants": len(self.index),
+            "due_plants": len(self._due),
+            "next_flip": (
+                date.fromordinal(self._next_flip).isoformat()
+                if self._next_flip is not None
+                else None
+            ),
+            "last_run_duration": self.last_run_duration,
+            "last_run_updates": self.last_run_updates,
+        }
+
+    @callback
+    def async_update_plant(
+        self, plant: SimplePlant, next_watering: date | None
+    ) -> None:
+        """Index the next watering day of a plant."""
+        if next_watering is None:
+            self.async_remove_plant(plant)
+            return
+        self._plants[plant.plant_id] = plant
+        if self.index.update(plant.plant_id, next_watering):
+            self._async_schedule()
+            self._async_update_due(plant.plant_id, now().date().toordinal())
+
+    @callback
+    def async_remove_plant(self, plant: SimplePlant) -> None:
+        """Remove a plant from the schedule."""
+        if self._plants.get(plant.plant_id) is plant:
+            del self._plants[plant.plant_id]
+            self.index.remove(plant.plant_id)
+            self._async_schedule()
+            self._async_update_due(plant.plant_id, now().date().toordinal())
+
+    def get_plant(self, plant_id: str) -> SimplePlant | None:
+        """Return an indexed plant."""
+        return self._plants.get(plant_id)
+
+    @property
+    def due(self) -> set[str]:
+        """Return the ids of plants to water today and of late plants."""
+        return self._due
+
+    @callback
+    def async_listen_due(self, update_callback: Callable[[str], None]) -> CALLBACK_TYPE:
+        """
+        Listen for changes of the plants to water.
+
+        `update_callback` is called with the id of a plant when it becomes
+        due, then late, when its next watering day changes while due, and
+        once watered.
+        """
+        self._due_listeners.add(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the listener."""
+            self._due_listeners.discard(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_listen_day(self, day_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listen for day changes while plants are late."""
+        self._day_listeners.add(day_callback)
+        self._async_schedule()
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the listener."""
+            self._day_listeners.discard(day_callback)
+            self._async_schedule()
+
+        return remove_listener
+
+    @callback
+    def _async_update_due(self, plant_id: str, today: int) -> None:
+        """Track whether a plant is due, and notify its changes."""
+        ordinal = self.index.get(plant_id)
+        if ordinal is not None and ordinal <= today:
+            self._due.add(plant_id)
+        elif plant_id in self._due:
+            self._due.discard(plant_id)
+        else:
+            return
+        for update_callback in list(self._due_listeners):
+            update_callback(plant_id)
+
+    @callback
+    def async_get_due_plants(self) -> dict[str, list[dict[str, Any]]]:
+        """Return plants to water today and late plants."""
+        today = now().date().toordinal()
+        return {
+            "due": [self._describe(*key) for key in self.index.between(today, today)],
+            "late": [self._describe(*key) for key in self.index.before(today)],
+        }
+
+    def _describe(self, ordinal: int, plant_id: str) -> dict[str, Any]:
+        """Describe an indexed plant."""
+        plant = self._plants[plant_id]
+        return {
+            "plant": plant.device,
+            "name": plant.title,
+            "next_watering": date.fromordinal(ordinal).isoformat(),
+        }
+
+    @callback
+    def _async_schedule(self) -> None:
+        """Arm the timer for the next status change."""
+        today = now().date().toordinal()
+        next_flip = self.index.next_flip(today)
+        earliest = self.index.earliest()
+        if self._day_listeners and earliest is not None and earliest < today:
+            # Late plants are one more day late tomorrow
+            next_flip = today + 1
+        if next_flip == self._next_flip:
+            return
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        self._next_flip = next_flip
+        if next_flip is None:
+            return
+        self._unsub = async_track_point_in_time(
+            self.hass,
+            self._async_day_changed,
+            start_of_local_day(date.fromordinal(next_flip)),
+        )
+
+    @callback
+    def _async_day_changed(self, fired_at: datetime) -> None:
+        """Recompute plants whose status flipped, in a single pass."""
+        start = time.perf_counter()
+        first = (self._next_flip or 0) - 1
+        self._unsub = None
+        self._next_flip = None
+        today = as_local(fired_at).date().toordinal()
+        # Plants becoming due today, or late since their day is over
+        flipped = self.index.between(min(first, today - 1), today)
+        updates = sum(
+            1
+            for _, plant_id in flipped
+            if self._plants[plant_id].async_refresh_status()
+        )
+        for ordinal, plant_id in flipped:
+            if ordinal <= today:
+                self._async_update_due(plant_id, today)
+        for day_callback in list(self._day_listeners):
+            day_callback()
+        self.last_run_duration = time.perf_counter() - start
+        self.last_run_updates = updates
+        LOGGER.debug(
+            "Day changed: %s of %s plants updated in %.3fms",
+            updates,
+            len(flipped),
+            self.last_run_duration * 1000,
+        )
+        self._async_schedule()
@@ -8,6 +8,7 @@ from homeassistant.components.select import (
     SelectEntity,
     SelectEntityDescription,
 )
+from homeassistant.core import callback
 
 from .const import DOMAIN, HEALTH_OPTIONS, LOGGER
 
@@ -16,7 +17,7 @@ if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-    from .coordinator import SimplePlantCoordinator
+    from .coordinator import SimplePlant, SimplePlantCoordinator
 
 
 ENTITY_DESCRIPTIONS = (
@@ -43,10 +44,23 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the select platform."""
-    async_add_entities(
-        SimplePlantSelect(hass, entry, entity_description)
-        for entity_description in ENTITY_DESCRIPTIONS
-    )
+    coordinator: SimplePlantCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    @callback
+    def async_add_plant(plant: SimplePlant) -> None:
+        """Add the entities of a plant."""
+        async_add_entities(
+            (
+                SimplePlantSelect(plant, entity_description)
+                for entity_description in ENTITY_DESCRIPTIONS
+            ),
+            config_subentry_id=plant.subentry_id,
+        )
+
+    for plant in coordinator.plants.values():
+        async_add_plant(plant)
+    # Plants of subentries added later, without reloading the entry
+    entry.async_on_unload(coordinator.async_listen_plants(async_add_plant))
 
 
 class SimplePlantSelect(SelectEntity):
@@ -56,32 +70,31 @@ class SimplePlantSelect(SelectEntity):
 
     def __init__(
         self,
-        hass: HomeAssistant,
-        entry: ConfigEntry,
+        plant: SimplePlant,
         description: SelectEntityDescription,
     ) -> None:
         """Initialize the select class."""
         super().__init__()
         self.entity_description = description
-        self._fallback_value = str(entry.data.get("health"))
-        self.coordinator: SimplePlantCoordinator = hass.data[DOMAIN][entry.entry_id]
+        self._fallback_value = str(plant.config.get("health"))
+        self.plant = plant
 
-        device = self.coordinator.device
+        device = plant.device
 
         self.entity_id = f"select.{DOMAIN}_{description.key}_{device}"
-        self._attr_unique_id = f"{DOMAIN}_{description.key}_{device}"
+        self._attr_unique_id = f"{plant.plant_id}_{description.key}"
 
         self._attr_extra_state_attributes = {
             "state_color": False,
         }
 
         # Set up device info
-        self._attr_device_info = self.coordinator.device_info
+        self._attr_device_info = plant.device_info
 
     @property
     def device(self) -> str | None:
         """Return the device name."""
-        return self.coordinator.device
+        return self.plant.device
 
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to hass."""
@@ -90,21 +103,21 @@ class SimplePlantSelect(SelectEntity):
         def warning(msg: str) -> None:
             LOGGER.warning("%s :%s", self.unique_id, msg)
 
-        # Load stored data
-        if self.coordinator.data is None:
-            warning("Coordinator not ready at initialization")
-            return
-        data = self.coordinator.data.get(self.unique_id)
-        if data is None:
-            if self._fallback_value is None:
-                warning("Initialization failed as _fallback_value is None")
-                return
-            await self.async_select_option(self._fallback_value)
+        # Restore without storing: the config value is the default anyway
+        data = self.plant.data.get(self.entity_description.key)
+        if data is None and self._fallback_value is None:
+            warning("Initialization failed as _fallback_value is None")
             return
-        await self.async_select_option(data)
+        self._set_option(data if data is not None else self._fallback_value)
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
+        self._set_option(option)
+        # Save to persistent storage
+        await self.plant.async_store_value(self.entity_description.key, option)
+
+    def _set_option(self, option: str) -> None:
+        """Show an option, and its color."""
         self._attr_current_option = option
         # Color
         if option in COLOR_MAPPING:
@@ -114,6 +127,3 @@ class SimplePlantSelect(SelectEntity):
             }
         else:
             self._attr_extra_state_attributes = {"state_color": False}
-        # Save to persistent storage
-        if self.unique_id is not None:
-            await self.coordinator.async_store_value(self.unique_id, option)
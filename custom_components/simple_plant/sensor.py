@@ -2,29 +2,51 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
+    SensorStateClass,
 )
-from homeassistant.helpers.event import (
-    async_track_state_change_event,
-    async_track_time_change,
-)
-from homeassistant.util.dt import as_local
+from homeassistant.const import EntityCategory, UnitOfInformation, UnitOfTime
+from homeassistant.core import callback
+from homeassistant.helpers import area_registry as ar
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import label_registry as lr
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util.dt import now
 
+from .aggregates import (
+    GROUP_AREA,
+    GROUP_HOME,
+    HOME,
+    GroupKey,
+    SimplePlantAggregates,
+    SimplePlantGroup,
+    device_groups,
+)
 from .const import DOMAIN
+from .coordinator import SimplePlantCoordinator
+from .entity import SimplePlantCoalescedEntity
+from .estimator import SimplePlantEstimator
+from .image_cache import SimplePlantImageCache
 
 if TYPE_CHECKING:
-    from datetime import date, datetime
+    from collections.abc import Callable
 
     from homeassistant.config_entries import ConfigEntry
-    from homeassistant.core import Event, EventStateChangedData, HomeAssistant
+    from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
+    from homeassistant.helpers.typing import StateType
 
-    from .coordinator import SimplePlantCoordinator
+    from .coordinator import SimplePlant
+
+# Diagnostic sensors poll their counters, only once enabled
+SCAN_INTERVAL = timedelta(minutes=1)
 
 
 ENTITY_DESCRIPTIONS = (
@@ -36,55 +58,239 @@ ENTITY_DESCRIPTIONS = (
     ),
 )
 
+SUGGESTION_DESCRIPTIONS = (
+    SensorEntityDescription(
+        key="suggested_interval",
+        translation_key="suggested_interval",
+        icon="mdi:calendar-sync",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.DAYS,
+    ),
+)
+
 COLOR_MAPPING = {"Today": "Goldenrod", "Late": "Tomato"}
 
 
+@dataclass(frozen=True, kw_only=True)
+class SimplePlantDiagnosticSensorEntityDescription(SensorEntityDescription):
+    """Describe a diagnostic sensor of the hub."""
+
+    value_fn: Callable[[SimplePlantCoordinator], StateType]
+    attributes_fn: Callable[[SimplePlantCoordinator], dict[str, Any]] | None = None
+
+
+@dataclass(frozen=True, kw_only=True)
+class SimplePlantAggregateSensorEntityDescription(SensorEntityDescription):
+    """Describe a sensor of the plants to water of a group."""
+
+    value_fn: Callable[[SimplePlantAggregateSensor, SimplePlantGroup], StateType]
+    attributes_fn: (
+        Callable[[SimplePlantAggregateSensor, SimplePlantGroup], dict[str, Any]] | None
+    ) = None
+    # Attributes count days, and change every day a plant stays late
+    daily: bool = False
+
+
+AGGREGATE_DESCRIPTIONS = (
+    SimplePlantAggregateSensorEntityDescription(
+        key="to_water",
+        translation_key="to_water",
+        icon="mdi:watering-can",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda _sensor, group: group.to_water,
+    ),
+    SimplePlantAggregateSensorEntityDescription(
+        key="late",
+        translation_key="late",
+        icon="mdi:water-alert",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda _sensor, group: group.late,
+    ),
+    SimplePlantAggregateSensorEntityDescription(
+        key="most_overdue",
+        translation_key="most_overdue",
+        icon="mdi:sprout-outline",
+        value_fn=lambda sensor, group: sensor.most_overdue_name(group),
+        attributes_fn=lambda sensor, group: sensor.most_overdue_attributes(group),
+        daily=True,
+    ),
+)
+
+DIAGNOSTIC_DESCRIPTIONS = (
+    SimplePlantDiagnosticSensorEntityDescription(
+        key="storage_loads",
+        translation_key="storage_loads",
+        icon="mdi:database-arrow-up",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: coordinator.store.load_count,
+        attributes_fn=lambda coordinator: {
+            "last_load_duration": coordinator.store.last_load_duration,
+        },
+    ),
+    SimplePlantDiagnosticSensorEntityDescription(
+        key="storage_writes",
+        translation_key="storage_writes",
+        icon="mdi:database-arrow-down",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: coordinator.store.physical_writes,
+        attributes_fn=lambda coordinator: {
+            "logical_writes": coordinator.store.logical_writes,
+            "last_coalesced_writes": coordinator.store.last_coalesced_writes,
+        },
+    ),
+    SimplePlantDiagnosticSensorEntityDescription(
+        key="storage_bytes_written",
+        translation_key="storage_bytes_written",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: coordinator.store.bytes_written,
+    ),
+    SimplePlantDiagnosticSensorEntityDescription(
+        key="storage_save_latency",
+        translation_key="storage_save_latency",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=1,
+        value_fn=lambda coordinator: coordinator.store.save_latency.mean,
+        attributes_fn=lambda coordinator: coordinator.store.save_latency.as_dict(),
+    ),
+    SimplePlantDiagnosticSensorEntityDescription(
+        key="refreshes",
+        translation_key="refreshes",
+        icon="mdi:refresh",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: coordinator.refresh_latency.count,
+        attributes_fn=lambda coordinator: coordinator.refresh_latency.as_dict(),
+    ),
+    SimplePlantDiagnosticSensorEntityDescription(
+        key="listeners",
+        translation_key="listeners",
+        icon="mdi:ear-hearing",
+        value_fn=lambda coordinator: sum(coordinator.listener_counts.values()),
+    ),
+    SimplePlantDiagnosticSensorEntityDescription(
+        key="image_bytes_served",
+        translation_key="image_bytes_served",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: SimplePlantImageCache(
+            coordinator.hass
+        ).bytes_served,
+        attributes_fn=lambda coordinator: SimplePlantImageCache(coordinator.hass).stats,
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the sensor platform."""
-    async_add_entities(
-        SimplePlantSensor(hass, entry, entity_description)
-        for entity_description in ENTITY_DESCRIPTIONS
-    )
+    coordinator: SimplePlantCoordinator = hass.data[DOMAIN][entry.entry_id]
 
+    @callback
+    def async_add_plant(plant: SimplePlant) -> None:
+        """Add the entities of a plant."""
+        async_add_entities(
+            (
+                SimplePlantSensor(plant, entity_description)
+                for entity_description in ENTITY_DESCRIPTIONS
+            ),
+            config_subentry_id=plant.subentry_id,
+        )
+        async_add_entities(
+            (
+                SimplePlantSuggestionSensor(plant, entity_description)
+                for entity_description in SUGGESTION_DESCRIPTIONS
+            ),
+            config_subentry_id=plant.subentry_id,
+        )
+
+    for plant in coordinator.plants.values():
+        async_add_plant(plant)
+    # Plants of subentries added later, without reloading the entry
+    entry.async_on_unload(coordinator.async_listen_plants(async_add_plant))
+    if coordinator.hub:
+        async_add_entities(
+            SimplePlantDiagnosticSensor(coordinator, entity_description)
+            for entity_description in DIAGNOSTIC_DESCRIPTIONS
+        )
+        async_setup_aggregates(hass, entry, coordinator, async_add_entities)
 
-class SimplePlantSensor(SensorEntity):
+
+@callback
+def async_setup_aggregates(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    coordinator: SimplePlantCoordinator,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Add sensors of the plants to water, in total and per area and label."""
+    aggregates = SimplePlantAggregates(hass)
+
+    @callback
+    def async_add_group(key: GroupKey) -> None:
+        """Add the sensors of a group."""
+        async_add_entities(
+            SimplePlantAggregateSensor(coordinator, entity_description, key)
+            for entity_description in AGGREGATE_DESCRIPTIONS
+        )
+
+    # Groups of every plant device, to water or not
+    device_registry = dr.async_get(hass)
+    keys = {HOME}
+    for plant_entry in hass.config_entries.async_entries(DOMAIN):
+        for device in dr.async_entries_for_config_entry(
+            device_registry, plant_entry.entry_id
+        ):
+            keys.update(device_groups(device))
+    for key in keys:
+        aggregates.async_ensure_group(key)
+    for key in aggregates.groups:
+        async_add_group(key)
+    entry.async_on_unload(aggregates.async_listen_groups(async_add_group))
+
+
+class SimplePlantSensor(CoordinatorEntity[SimplePlantCoordinator], SensorEntity):
     """simple_plant sensor class."""
 
     _attr_has_entity_name = True
 
     def __init__(
         self,
-        hass: HomeAssistant,
-        entry: ConfigEntry,
+        plant: SimplePlant,
         description: SensorEntityDescription,
     ) -> None:
         """Initialize the sensor class."""
-        super().__init__()
+        super().__init__(plant.coordinator, context=plant.plant_id)
+        self.plant = plant
         self.entity_description = description
         self._fallback_value: date | None = None
         self._attr_native_value: date | None = None
-        self.coordinator: SimplePlantCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-        device = self.coordinator.device
+        device = plant.device
 
         self.entity_id = f"sensor.{DOMAIN}_{description.key}_{device}"
-        self._attr_unique_id = f"{DOMAIN}_{description.key}_{device}"
+        self._attr_unique_id = f"{plant.plant_id}_{description.key}"
 
         self._attr_extra_state_attributes = {
             "state_color": False,
         }
 
         # Set up device info
-        self._attr_device_info = self.coordinator.device_info
+        self._attr_device_info = plant.device_info
+
+        # Initial value
+        self._update_value()
 
     @property
     def device(self) -> str | None:
         """Return the device name."""
-        return self.coordinator.device
+        return self.plant.device
 
     @property
     def native_value(self) -> date | None:
@@ -95,54 +301,24 @@ class SimplePlantSensor(SensorEntity):
             else self._attr_native_value
         )
 
-    async def async_added_to_hass(self) -> None:
-        """Run when entity is added to hass."""
-        await super().async_added_to_hass()
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only if the value changed."""
+        if self._update_value():
+            self.async_write_ha_state()
 
-        self.async_on_remove(
-            async_track_state_change_event(
-                self.hass,
-                f"date.{DOMAIN}_last_watered_{self.device}",
-                self._update_state,
-            )
-        )
-        self.async_on_remove(
-            async_track_state_change_event(
-                self.hass,
-                f"number.{DOMAIN}_days_between_waterings_{self.device}",
-                self._update_state,
-            )
-        )
-        self.async_on_remove(
-            async_track_time_change(
-                self.hass,
-                self._update_state,
-                hour=0,
-                minute=0,
-                second=0,
-            )
-        )
-
-        # Initial update
-        await self._update_state()
-
-    async def _update_state(
-        self, _event: Event[EventStateChangedData] | datetime | None = None
-    ) -> None:
-        """Update the binary sensor state based on other entities."""
-        dates = self.coordinator.get_dates()
-
-        if not dates:
-            return
+    def _update_value(self) -> bool:
+        """Update value and color from the plant, return True if changed."""
+        status = self.plant.status
+        if status is None:
+            return False
+        previous = (self._attr_native_value, self._attr_extra_state_attributes)
 
         # Color
-        today = as_local(dates["today"]).date()
-        next_watering = as_local(dates["next_watering"]).date()
-
         color_key = "OK"
-        if today == next_watering:
+        if status.due:
             color_key = "Today"
-        if today > next_watering:
+        if status.late:
             color_key = "Late"
 
         if color_key in COLOR_MAPPING:
@@ -154,5 +330,185 @@ class SimplePlantSensor(SensorEntity):
             self._attr_extra_state_attributes = {"state_color": False}
 
         # Value
-        self._attr_native_value = next_watering
-        self.async_write_ha_state()
+        self._attr_native_value = status.next_watering
+        return previous != (
+            self._attr_native_value,
+            self._attr_extra_state_attributes,
+        )
+
+
+class SimplePlantSuggestionSensor(
+    CoordinatorEntity[SimplePlantCoordinator], SensorEntity
+):
+    """simple_plant suggested watering interval sensor class."""
+
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        plant: SimplePlant,
+        description: SensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor class."""
+        super().__init__(plant.coordinator, context=plant.plant_id)
+        self.plant = plant
+        self.entity_description = description
+        self.estimator = SimplePlantEstimator(plant.hass)
+
+        self.entity_id = f"sensor.{DOMAIN}_{description.key}_{plant.device}"
+        self._attr_unique_id = f"{plant.plant_id}_{description.key}"
+        self._attr_native_value = None
+        self._attr_extra_state_attributes = {}
+
+        # Set up device info
+        self._attr_device_info = plant.device_info
+
+        # Initial value
+        self._update_value()
+
+    @property
+    def device(self) -> str | None:
+        """Return the device name."""
+        return self.plant.device
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only if the suggestion changed."""
+        if self._update_value():
+            self.async_write_ha_state()
+
+    def _update_value(self) -> bool:
+        """Update value from the estimator, return True if changed."""
+        previous = (self._attr_native_value, self._attr_extra_state_attributes)
+        suggestion = self.estimator.suggestions.get(self.plant.plant_id)
+        if suggestion is None:
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = {}
+        else:
+            self._attr_native_value = suggestion.interval
+            self._attr_extra_state_attributes = {
+                "confidence": suggestion.confidence,
+                "samples": suggestion.samples,
+                "mean_interval": suggestion.mean,
+            }
+        return previous != (
+            self._attr_native_value,
+            self._attr_extra_state_attributes,
+        )
+
+
+class SimplePlantAggregateSensor(SimplePlantCoalescedEntity, SensorEntity):
+    """simple_plant sensor of the plants to water of a home, area or label."""
+
+    _attr_has_entity_name = True
+    entity_description: SimplePlantAggregateSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: SimplePlantCoordinator,
+        description: SimplePlantAggregateSensorEntityDescription,
+        key: GroupKey,
+    ) -> None:
+        """Initialize the sensor class."""
+        self.entity_description = description
+        self.aggregates = SimplePlantAggregates(coordinator.hass)
+        self.key = key
+        self.group = self.aggregates.async_ensure_group(key)
+        entry_id = coordinator.config_entry.entry_id
+        group_type, group_id = key
+        if group_type == GROUP_HOME:
+            self._attr_unique_id = f"{DOMAIN}_{description.key}_{entry_id}"
+        else:
+            self._attr_unique_id = (
+                f"{DOMAIN}_{description.key}_{group_type}_{group_id}_{entry_id}"
+            )
+            self._attr_translation_key = f"{description.key}_group"
+            self._attr_translation_placeholders = {
+                "group": self._group_name(coordinator.hass, group_type, group_id)
+            }
+        self._attr_device_info = coordinator.device_info
+
+    @staticmethod
+    def _group_name(hass: HomeAssistant, group_type: str, group_id: str | None) -> str:
+        """Return the name of an area or label."""
+        entry = (
+            ar.async_get(hass).async_get_area(str(group_id))
+            if group_type == GROUP_AREA
+            else lr.async_get(hass).async_get_label(str(group_id))
+        )
+        return entry.name if entry is not None else str(group_id)
+
+    async def async_added_to_hass(self) -> None:
+        """Follow the counters of the group."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.aggregates.async_listen(self.key, self.async_schedule_write)
+        )
+        if self.entity_description.daily:
+            self.async_on_remove(
+                self.aggregates.scheduler.async_listen_day(self._async_day_changed)
+            )
+
+    @callback
+    def _async_day_changed(self) -> None:
+        """Count one more day late."""
+        if self.group.oldest_late is not None:
+            self.async_schedule_write()
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the value of the group."""
+        return self.entity_description.value_fn(self, self.group)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the attributes of the group."""
+        if self.entity_description.attributes_fn is None:
+            return None
+        return self.entity_description.attributes_fn(self, self.group)
+
+    def most_overdue_name(self, group: SimplePlantGroup) -> str | None:
+        """Return the name of the most overdue plant."""
+        if group.oldest_late is None:
+            return None
+        plant = self.aggregates.scheduler.get_plant(group.oldest_late[1])
+        return plant.title if plant is not None else None
+
+    def most_overdue_attributes(self, group: SimplePlantGroup) -> dict[str, Any]:
+        """Return the watering day of the most overdue plant."""
+        if group.oldest_late is None:
+            return {}
+        ordinal = group.oldest_late[0]
+        return {
+            "next_watering": date.fromordinal(ordinal).isoformat(),
+            "days_late": now().date().toordinal() - ordinal,
+        }
+
+
+class SimplePlantDiagnosticSensor(SensorEntity):
+    """simple_plant diagnostic sensor class, disabled by default."""
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    entity_description: SimplePlantDiagnosticSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: SimplePlantCoordinator,
+        description: SimplePlantDiagnosticSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor class."""
+        self.coordinator = coordinator
+        self.entity_description = description
+        entry_id = coordinator.config_entry.entry_id
+        self._attr_unique_id = f"{DOMAIN}_{description.key}_{entry_id}"
+        self._attr_device_info = coordinator.device_info
+
+    async def async_update(self) -> None:
+        """Read the counters."""
+        self._attr_native_value = self.entity_description.value_fn(self.coordinator)
+        if self.entity_description.attributes_fn is not None:
+            self._attr_extra_state_attributes = self.entity_description.attributes_fn(
+                self.coordinator
+            )
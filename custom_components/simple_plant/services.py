@@ -0,0 +1,205 @@
+"""Services for simple_plant."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
+from homeassistant.core import SupportsResponse, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.service import async_extract_referenced_entity_ids
+from homeassistant.util.dt import as_local, as_utc, utcnow
+
+from .const import DOMAIN, LOGGER
+from .data import STORAGE_BACKENDS, SimplePlantStore
+from .journal import SimplePlantJournalStore
+from .scheduler import SimplePlantScheduler
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
+
+    from .coordinator import SimplePlant, SimplePlantCoordinator
+
+SERVICE_SET_STORAGE_BACKEND = "set_storage_backend"
+SERVICE_GET_DUE_PLANTS = "get_due_plants"
+SERVICE_MARK_WATERED = "mark_watered"
+SERVICE_UNDO_WATERING = "undo_watering"
+SERVICE_GET_WATERING_HISTORY = "get_watering_history"
+SERVICE_IMPORT_PLANTS = "import_plants"
+SERVICE_EXPORT_PLANTS = "export_plants"
+
+SET_STORAGE_BACKEND_SCHEMA = vol.Schema(
+    {
+        vol.Required("backend"): vol.In(STORAGE_BACKENDS),
+    }
+)
+
+MARK_WATERED_SCHEMA = vol.Schema(
+    {
+        **cv.ENTITY_SERVICE_FIELDS,
+        vol.Optional("date"): cv.date,
+    }
+)
+
+TARGET_SCHEMA = vol.Schema(cv.ENTITY_SERVICE_FIELDS)
+
+IMPORT_PLANTS_SCHEMA = vol.Schema(
+    {
+        vol.Required("path"): cv.string,
+        vol.Optional("photos"): cv.string,
+    }
+)
+
+EXPORT_PLANTS_SCHEMA = vol.Schema(
+    {
+        vol.Required("path"): cv.string,
+    }
+)
+
+
+@callback
+def async_get_target_plants(
+    hass: HomeAssistant, call: ServiceCall
+) -> list[SimplePlant]:
+    """Get the plants owning the entities targeted by a service call."""
+    selected = async_extract_referenced_entity_ids(hass, call)
+    entity_registry = er.async_get(hass)
+    plants: dict[str, SimplePlant] = {}
+    for entity_id in selected.referenced | selected.indirectly_referenced:
+        entity = entity_registry.async_get(entity_id)
+        if entity is None or entity.platform != DOMAIN:
+            continue
+        coordinator: SimplePlantCoordinator | None = hass.data[DOMAIN].get(
+            entity.config_entry_id
+        )
+        if coordinator is None:
+            continue
+        plant = coordinator.get_plant(entity.config_subentry_id)
+        if plant is not None:
+            plants[plant.plant_id] = plant
+    return list(plants.values())
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register simple_plant services."""
+
+    async def set_storage_backend(call: ServiceCall) -> None:
+        """Migrate the plant storage to another backend."""
+        await SimplePlantStore(hass).async_set_backend(call.data["backend"])
+
+    async def get_due_plants(_call: ServiceCall) -> ServiceResponse:
+        """Return plants to water today and late plants."""
+        return SimplePlantScheduler(hass).async_get_due_plants()
+
+    async def mark_watered(call: ServiceCall) -> None:
+        """Mark every targeted plant as watered with a single storage write."""
+        value = utcnow()
+        if "date" in call.data:
+            value = as_utc(
+                as_local(datetime.combine(call.data["date"], datetime.min.time()))
+            )
+            if value > utcnow():
+                raise ServiceValidationError(
+                    translation_domain=DOMAIN,
+                    translation_key="invalid_future_date",
+                    translation_placeholders={},
+                )
+        plants = async_get_target_plants(hass, call)
+        if not plants:
+            return
+        LOGGER.debug("Marking %s plants as watered", len(plants))
+        await SimplePlantJournalStore(hass).async_record(
+            [plant.journal_entry(value) for plant in plants]
+        )
+        await SimplePlantStore(hass).async_save_batch(
+            {plant.plant_id: plant.mark_as_watered_data(value) for plant in plants}
+        )
+        for plant in plants:
+            plant.async_publish()
+
+    async def undo_watering(call: ServiceCall) -> None:
+        """Restore the previous watering day of every targeted plant."""
+        plants = async_get_target_plants(hass, call)
+        await asyncio.gather(*(plant.async_undo_watering() for plant in plants))
+
+    async def get_watering_history(call: ServiceCall) -> ServiceResponse:
+        """Return the watering journal of every targeted plant."""
+        journal = SimplePlantJournalStore(hass)
+        return {
+            plant.device: {
+                "name": plant.title,
+                **(await journal.async_get(plant.plant_id)).as_response(),
+            }
+            for plant in async_get_target_plants(hass, call)
+        }
+
+    async def import_plants(call: ServiceCall) -> ServiceResponse:
+        """Add the plants of a manifest to the hub."""
+        # Bulk transfers are rare, keep them off the startup path
+        from .transfer import async_import_plants, resolve_path  # noqa: PLC0415
+
+        photos = call.data.get("photos")
+        names = await async_import_plants(
+            hass,
+            resolve_path(hass, call.data["path"]),
+            resolve_path(hass, photos) if photos else None,
+        )
+        return {"plants": names}
+
+    async def export_plants(call: ServiceCall) -> ServiceResponse:
+        """Write every plant to a manifest."""
+        from .transfer import async_export_plants, resolve_path  # noqa: PLC0415
+
+        count = await async_export_plants(hass, resolve_path(hass, call.data["path"]))
+        return {"plants": count}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_STORAGE_BACKEND,
+        set_storage_backend,
+        schema=SET_STORAGE_BACKEND_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_DUE_PLANTS,
+        get_due_plants,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_MARK_WATERED,
+        mark_watered,
+        schema=MARK_WATERED_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_UNDO_WATERING,
+        undo_watering,
+        schema=TARGET_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_WATERING_HISTORY,
+        get_watering_history,
+        schema=TARGET_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_IMPORT_PLANTS,
+        import_plants,
+        schema=IMPORT_PLANTS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXPORT_PLANTS,
+        export_plants,
+        schema=EXPORT_PLANTS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,50 @@
+"""Runtime performance counters for simple_plant."""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_left
+
+# Upper bounds, in seconds, of the latency histogram buckets
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, math.inf)
+
+
+class LatencyHistogram:
+    """
+    Count of durations by bucket.
+
+    Observing a duration is a bisection and two additions, so it is cheap
+    enough to be always on.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the histogram."""
+        self.counts = [0] * len(LATENCY_BUCKETS)
+        self.count = 0
+        self.total = 0.0
+        self.last = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Count a duration."""
+        self.counts[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.last = seconds
+
+    @property
+    def mean(self) -> float:
+        """Return the mean duration."""
+        return self.total / self.count if self.count else 0.0
+
+    def as_dict(self) -> dict[str, float | dict[str, int]]:
+        """Return the histogram as diagnostics data."""
+        return {
+            "count": self.count,
+            "total": self.total,
+            "last": self.last,
+            "mean": self.mean,
+            "buckets": {
+                f"le_{bound}": count
+                for bound, count in zip(LATENCY_BUCKETS, self.counts, strict=True)
+            },
+        }
@@ -0,0 +1,104 @@
+"""Switch platform for simple_plant."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.switch import (
+    SwitchEntity,
+    SwitchEntityDescription,
+)
+from homeassistant.const import EntityCategory
+from homeassistant.core import callback
+
+from .const import DOMAIN
+from .estimator import AUTO_INTERVAL_KEY
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+    from .coordinator import SimplePlant, SimplePlantCoordinator
+
+
+ENTITY_DESCRIPTIONS = (
+    SwitchEntityDescription(
+        key=AUTO_INTERVAL_KEY,
+        translation_key=AUTO_INTERVAL_KEY,
+        icon="mdi:calendar-sync",
+        entity_category=EntityCategory.CONFIG,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the switch platform."""
+    coordinator: SimplePlantCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    @callback
+    def async_add_plant(plant: SimplePlant) -> None:
+        """Add the entities of a plant."""
+        async_add_entities(
+            (
+                SimplePlantSwitch(plant, entity_description)
+                for entity_description in ENTITY_DESCRIPTIONS
+            ),
+            config_subentry_id=plant.subentry_id,
+        )
+
+    for plant in coordinator.plants.values():
+        async_add_plant(plant)
+    # Plants of subentries added later, without reloading the entry
+    entry.async_on_unload(coordinator.async_listen_plants(async_add_plant))
+
+
+class SimplePlantSwitch(SwitchEntity):
+    """simple_plant switch class."""
+
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        plant: SimplePlant,
+        description: SwitchEntityDescription,
+    ) -> None:
+        """Initialize the switch class."""
+        super().__init__()
+        self.entity_description = description
+        self.plant = plant
+
+        device = plant.device
+
+        self.entity_id = f"switch.{DOMAIN}_{description.key}_{device}"
+        self._attr_unique_id = f"{plant.plant_id}_{description.key}"
+
+        # Opted out until switched on
+        self._attr_is_on = bool(plant.data.get(description.key, False))
+
+        # Set up device info
+        self._attr_device_info = plant.device_info
+
+    @property
+    def device(self) -> str | None:
+        """Return the device name."""
+        return self.plant.device
+
+    async def async_turn_on(self, **_kwargs: Any) -> None:
+        """Apply suggested watering intervals."""
+        await self._async_set(is_on=True)
+
+    async def async_turn_off(self, **_kwargs: Any) -> None:
+        """Stop applying suggested watering intervals."""
+        await self._async_set(is_on=False)
+
+    async def _async_set(self, *, is_on: bool) -> None:
+        """Change and store the state."""
+        self._attr_is_on = is_on
+        self.async_write_ha_state()
+        # Save to persistent storage
+        await self.plant.async_store_value(self.entity_description.key, is_on)
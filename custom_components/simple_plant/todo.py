@@ -0,0 +1,116 @@
+"""Todo platform for simple_plant."""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import TYPE_CHECKING
+
+from homeassistant.components.todo import (
+    TodoItem,
+    TodoItemStatus,
+    TodoListEntity,
+    TodoListEntityFeature,
+)
+from homeassistant.core import callback
+from homeassistant.helpers.entity import EntityDescription
+
+from .const import DOMAIN
+from .entity import SimplePlantCoalescedEntity
+from .scheduler import SimplePlantScheduler
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+    from .coordinator import SimplePlantCoordinator
+
+
+ENTITY_DESCRIPTIONS = (
+    EntityDescription(
+        key="to_water",
+        translation_key="to_water",
+        icon="mdi:watering-can",
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the todo platform."""
+    coordinator: SimplePlantCoordinator = hass.data[DOMAIN][entry.entry_id]
+    if coordinator.hub:
+        async_add_entities(
+            SimplePlantTodoList(coordinator, entity_description)
+            for entity_description in ENTITY_DESCRIPTIONS
+        )
+
+
+class SimplePlantTodoList(SimplePlantCoalescedEntity, TodoListEntity):
+    """
+    simple_plant todo list of every plant to water.
+
+    Items are kept up to date from the scheduler, one plant at a time as it
+    becomes due or gets watered, and their changes are coalesced into a
+    single state write. Checking an item marks its plant as watered.
+    """
+
+    _attr_has_entity_name = True
+    _attr_supported_features = TodoListEntityFeature.UPDATE_TODO_ITEM
+
+    def __init__(
+        self,
+        coordinator: SimplePlantCoordinator,
+        description: EntityDescription,
+    ) -> None:
+        """Initialize the todo list class."""
+        self.entity_description = description
+        self.scheduler = SimplePlantScheduler(coordinator.hass)
+        entry_id = coordinator.config_entry.entry_id
+        self._attr_unique_id = f"{DOMAIN}_{description.key}_{entry_id}"
+        self._attr_device_info = coordinator.device_info
+        # Plant id -> item
+        self._items: dict[str, TodoItem] = {}
+
+    async def async_added_to_hass(self) -> None:
+        """Fill the list and follow the plants to water."""
+        await super().async_added_to_hass()
+        for plant_id in self.scheduler.due:
+            self._update_item(plant_id)
+        self.async_on_remove(self.scheduler.async_listen_due(self._async_due_changed))
+
+    @property
+    def todo_items(self) -> list[TodoItem]:
+        """Return the items, most overdue plants first."""
+        return sorted(self._items.values(), key=lambda item: (item.due, item.summary))
+
+    async def async_update_todo_item(self, item: TodoItem) -> None:
+        """Mark the plant of a checked item as watered."""
+        if item.status != TodoItemStatus.COMPLETED or item.uid is None:
+            return
+        plant = self.scheduler.get_plant(item.uid)
+        if plant is not None:
+            await plant.async_action_mark_as_watered()
+
+    def _update_item(self, plant_id: str) -> None:
+        """Add, update or remove the item of a plant."""
+        plant = self.scheduler.get_plant(plant_id)
+        ordinal = self.scheduler.index.get(plant_id)
+        if plant is None or ordinal is None or plant_id not in self.scheduler.due:
+            self._items.pop(plant_id, None)
+            return
+        self._items[plant_id] = TodoItem(
+            summary=plant.title[0].upper() + plant.title[1:],
+            uid=plant_id,
+            status=TodoItemStatus.NEEDS_ACTION,
+            due=date.fromordinal(ordinal),
+        )
+
+    @callback
+    def _async_due_changed(self, plant_id: str) -> None:
+        """Update the item of a plant, and schedule a state write."""
+        self._update_item(plant_id)
+        self.async_schedule_write()
@@ -0,0 +1,312 @@
+"""Bulk import and export of plants for simple_plant."""
+
+from __future__ import annotations
+
+import csv
+import json
+import shutil
+from datetime import date
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.config_entries import ConfigSubentry
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import slugify
+from homeassistant.util.dt import now
+from homeassistant.util.ulid import ulid_now
+
+from .const import (
+    CONF_PLANT_ID,
+    DAYS_BETWEEN_WATERINGS_MAX,
+    DAYS_BETWEEN_WATERINGS_MIN,
+    DOMAIN,
+    HEALTH_OPTIONS,
+    LOGGER,
+    SUBENTRY_TYPE_PLANT,
+)
+from .coordinator import is_hub
+from .photos import SimplePlantPhotoStore, sniff_image_type
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+    # Config, stored data and last watered day of a plant to export
+    ExportedPlant = tuple[Mapping[str, Any], Mapping[str, Any], date | None]
+
+MANIFEST_FIELDS = [
+    "name",
+    "species",
+    "last_watered",
+    "days_between_waterings",
+    "health",
+    "photo",
+]
+# Errors listed in the import error message
+MAX_REPORTED_ERRORS = 10
+
+PLANT_SCHEMA = vol.Schema(
+    {
+        vol.Required("name"): vol.All(cv.string, vol.Strip, vol.Length(min=1)),
+        vol.Optional("species", default=""): vol.Any(None, cv.string),
+        vol.Optional("last_watered"): vol.Any(None, "", cv.date),
+        vol.Required("days_between_waterings"): vol.All(
+            vol.Coerce(float),
+            vol.Range(min=DAYS_BETWEEN_WATERINGS_MIN, max=DAYS_BETWEEN_WATERINGS_MAX),
+        ),
+        vol.Optional("health", default="notset"): vol.Any(
+            None, "", vol.In(HEALTH_OPTIONS)
+        ),
+        vol.Optional("photo"): vol.Any(None, cv.string),
+    },
+    extra=vol.REMOVE_EXTRA,
+)
+
+
+def _read_manifest(path: Path) -> list[dict[str, Any]]:
+    """Read the plants of a JSON or CSV manifest, in the executor."""
+    with path.open(encoding="utf-8", newline="") as file:
+        if path.suffix.lower() == ".csv":
+            return list(csv.DictReader(file))
+        data = json.load(file)
+    plants = data.get("plants", []) if isinstance(data, dict) else data
+    if not isinstance(plants, list):
+        msg = "expected a list of plants"
+        raise ValueError(msg)  # noqa: TRY004
+    return plants
+
+
+def _check_photos(photos: Iterable[Path]) -> list[Path]:
+    """Return the photos that are missing or not images, in the executor."""
+    invalid = []
+    for photo in photos:
+        try:
+            with photo.open("rb") as file:
+                header = file.read(1024)
+        except OSError:
+            invalid.append(photo)
+            continue
+        if sniff_image_type(header) is None:
+            invalid.append(photo)
+    return invalid
+
+
+def _write_manifest(path: Path, rows: Iterable[dict[str, Any]]) -> None:
+    """Write a JSON or CSV manifest one plant at a time, in the executor."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f".{path.name}.tmp")
+    with temp_path.open("w", encoding="utf-8", newline="") as file:
+        if path.suffix.lower() == ".csv":
+            writer = csv.DictWriter(file, fieldnames=MANIFEST_FIELDS)
+            writer.writeheader()
+            for row in rows:
+                writer.writerow(row)
+        else:
+            file.write('{"plants": [')
+            for index, row in enumerate(rows):
+                file.write(",\n" if index else "\n")
+                json.dump(row, file, ensure_ascii=False)
+            file.write("\n]}\n")
+    temp_path.replace(path)
+
+
+def _export_rows(
+    plants: Iterable[ExportedPlant], photo_store: SimplePlantPhotoStore, folder: Path
+) -> Iterator[dict[str, Any]]:
+    """Yield the row of each plant and copy its photo to `folder`, in the executor."""
+    for config, data, last_watered in plants:
+        # Values changed from their entities are stored, not in the config
+        row = {field: data.get(field, config.get(field)) for field in MANIFEST_FIELDS}
+        if last_watered is not None:
+            row["last_watered"] = last_watered
+        if isinstance(row["last_watered"], date):
+            row["last_watered"] = row["last_watered"].isoformat()
+        if row["photo"]:
+            source = photo_store.path(str(row["photo"]))
+            destination = folder / source.name
+            if source.is_file() and not destination.exists():
+                shutil.copyfile(source, destination)
+            row["photo"] = source.name
+        yield row
+
+
+def resolve_path(hass: HomeAssistant, path: str) -> Path:
+    """Return an allowed path, relative to the configuration directory."""
+    resolved = Path(hass.config.path(path))
+    if not hass.config.is_allowed_path(str(resolved)):
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="path_not_allowed",
+            translation_placeholders={"path": path},
+        )
+    return resolved
+
+
+def _get_hub(hass: HomeAssistant) -> ConfigEntry:
+    """Return the hub imported plants are added to."""
+    hub = next(
+        (entry for entry in hass.config_entries.async_entries(DOMAIN) if is_hub(entry)),
+        None,
+    )
+    if hub is None:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="no_hub",
+            translation_placeholders={},
+        )
+    return hub
+
+
+async def _async_import_photos(
+    hass: HomeAssistant, plants: Iterable[dict[str, Any]]
+) -> None:
+    """Copy the photo of each plant to the store, replacing it by its url path."""
+    photo_store = SimplePlantPhotoStore(hass)
+    for plant in plants:
+        if "photo" not in plant:
+            continue
+        try:
+            plant["photo"] = await photo_store.async_import(plant["photo"])
+        except (OSError, ValueError) as err:
+            # Photos already copied are left to the garbage collection
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="import_photo_failed",
+                translation_placeholders={
+                    "path": str(plant["photo"]),
+                    "error": str(err),
+                },
+            ) from err
+
+
+async def async_import_plants(
+    hass: HomeAssistant, manifest: Path, photos: Path | None = None
+) -> list[str]:
+    """
+    Add the plants of a manifest to the hub, return their names.
+
+    Every plant is validated, and every photo copied, before any plant is
+    added, so a manifest is imported entirely or not at all. Each plant added
+    then runs the hub update listener once, which adds its entities without
+    reloading the hub.
+    """
+    # Only the services use the flow helpers, keep them off the startup path
+    from .config_flow import plant_names  # noqa: PLC0415
+
+    hub = _get_hub(hass)
+    photos = photos or manifest.parent
+    try:
+        rows = await hass.async_add_executor_job(_read_manifest, manifest)
+    except (OSError, ValueError) as err:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="import_unreadable",
+            translation_placeholders={"path": str(manifest), "error": str(err)},
+        ) from err
+
+    errors: list[str] = []
+    plants: list[dict[str, Any]] = []
+    names = plant_names(hass)
+    today = now().date()
+    for index, row in enumerate(rows, start=1):
+        try:
+            plant = PLANT_SCHEMA(row)
+        except vol.Invalid as err:
+            errors.append(f"#{index}: {err}")
+            continue
+        slug = slugify(plant["name"])
+        if slug in names:
+            errors.append(f"#{index}: {plant['name']} exists")
+        names.add(slug)
+        last_watered: date = plant.get("last_watered") or today
+        if last_watered > today:
+            errors.append(f"#{index}: last watered in the future")
+        plant["last_watered"] = last_watered.isoformat()
+        plant["species"] = plant.get("species") or ""
+        plant["health"] = plant.get("health") or "notset"
+        if plant.get("photo"):
+            plant["photo"] = photos / plant["photo"]
+            if not hass.config.is_allowed_path(str(plant["photo"])):
+                errors.append(f"#{index}: photo not allowed")
+        else:
+            plant.pop("photo", None)
+        plants.append(plant)
+    invalid = await hass.async_add_executor_job(
+        _check_photos, [plant["photo"] for plant in plants if "photo" in plant]
+    )
+    errors.extend(f"{photo.name}: not an image" for photo in invalid)
+    if errors:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="import_invalid",
+            translation_placeholders={
+                "count": str(len(errors)),
+                "errors": "; ".join(errors[:MAX_REPORTED_ERRORS]),
+            },
+        )
+
+    await _async_import_photos(hass, plants)
+    LOGGER.info("Importing %s plants to %s", len(plants), hub.title)
+    for plant in plants:
+        hass.config_entries.async_add_subentry(
+            hub,
+            ConfigSubentry(
+                data=MappingProxyType(
+                    {
+                        **plant,
+                        "name_by_user": plant["name"],
+                        CONF_PLANT_ID: ulid_now(),
+                    }
+                ),
+                subentry_type=SUBENTRY_TYPE_PLANT,
+                title=plant["name"],
+                unique_id=slugify(plant["name"]),
+            ),
+        )
+    return [plant["name"] for plant in plants]
+
+
+async def async_export_plants(hass: HomeAssistant, manifest: Path) -> int:
+    """
+    Write every plant to a manifest, with its photo, return the plant count.
+
+    Plants are written with their current values, so the manifest can be
+    imported as is: photos are copied next to it. Only the config and a copy
+    of the stored values of each plant are gathered in the event loop; rows
+    are then built, written and their photo copied one plant at a time in the
+    executor.
+    """
+    plants: list[ExportedPlant] = []
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        coordinator = hass.data[DOMAIN].get(entry.entry_id)
+        configs = (
+            [
+                (subentry.subentry_id, subentry.data)
+                for subentry in entry.subentries.values()
+                if subentry.subentry_type == SUBENTRY_TYPE_PLANT
+            ]
+            if is_hub(entry)
+            else [(None, entry.data)]
+        )
+        for subentry_id, config in configs:
+            plant = coordinator.get_plant(subentry_id) if coordinator else None
+            if plant is None:
+                plants.append((config, {}, None))
+                continue
+            status = plant.status
+            # Copied, as writes go on while rows are built in the executor
+            plants.append(
+                (config, dict(plant.data), status.last_watered if status else None)
+            )
+    await hass.async_add_executor_job(
+        _write_manifest,
+        manifest,
+        _export_rows(plants, SimplePlantPhotoStore(hass), manifest.parent),
+    )
+    LOGGER.info("Exported %s plants to %s", len(plants), manifest)
+    return len(plants)